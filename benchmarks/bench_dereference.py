@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Benchmark deep dereferencing of many refs into a web of schemas.
+
+Builds a binary heap of object schemas, each referring to its two children,
+and dereferences ten refs per schema into it. Memoization makes the cost
+linear in the number of refs; the best of several runs is reported.
+
+Usage:
+    python benchmarks/bench_dereference.py
+    python benchmarks/bench_dereference.py --schemas 20000 --repeat 10
+"""
+
+import argparse
+import sys
+
+from bench_ir import best_of
+from bench_load import REPO_ROOT
+
+sys.path.insert(0, str(REPO_ROOT))
+
+from mcp_swagger_cli.dereference import Dereferencer  # noqa: E402
+from mcp_swagger_cli.refs import PointerIndex  # noqa: E402
+
+
+def build_schemas(count: int) -> dict:
+    """Build a heap of object schemas over string leaves."""
+    schemas = {
+        f"S{i}": {
+            "type": "object",
+            "properties": {
+                "left": {"$ref": f"#/components/schemas/S{2 * i + 1}"},
+                "right": {"type": "array", "items": {"$ref": f"#/components/schemas/S{2 * i + 2}"}},
+            },
+        }
+        for i in range(count)
+    }
+    schemas.update({f"S{i}": {"type": "string"} for i in range(count, 2 * count + 1)})
+    return schemas
+
+
+def main() -> None:
+    """Run the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--schemas", type=int, default=5000, help="Number of object schemas")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = arg_parser.parse_args()
+
+    index = PointerIndex({"components": {"schemas": build_schemas(args.schemas)}})
+    referrers = [
+        {"items": {"$ref": f"#/components/schemas/S{i % args.schemas}"}} for i in range(10 * args.schemas)
+    ]
+
+    def dereference_all() -> None:
+        dereference = Dereferencer(lambda node: index.resolve(node["$ref"][1:]))
+        for referrer in referrers:
+            dereference(referrer)
+
+    seconds = best_of(args.repeat, dereference_all)
+    print(f"{len(referrers)} refs into {2 * args.schemas + 1} schemas")
+    print(f"{'dereference (s)':>16} {'per ref (us)':>13}")
+    print(f"{seconds:>16.3f} {seconds / len(referrers) * 1e6:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Benchmark loading a compiled IR against parsing its spec.
+
+Builds the synthetic spec of ``bench_load.py``, compiles it to an IR and
+reports the best of several runs of: parsing the spec and building its
+operations, and loading the IR and listing its operations.
+
+Usage:
+    python benchmarks/bench_ir.py
+    python benchmarks/bench_ir.py --paths 5000 --repeat 10
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_load import REPO_ROOT, build_spec
+
+sys.path.insert(0, str(REPO_ROOT))
+
+from mcp_swagger_cli.ir import SpecIR  # noqa: E402
+from mcp_swagger_cli.parser import OpenAPIParser  # noqa: E402
+
+
+def best_of(repeat: int, action) -> float:
+    """Run an action several times and return its fastest time in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--paths", type=int, default=5000, help="Number of path items")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        spec_path = Path(tmp) / "synthetic.json"
+        spec_path.write_text(json.dumps(build_spec(args.paths)))
+        ir_path = Path(tmp) / "synthetic.mcpir"
+        SpecIR.from_parser(OpenAPIParser(str(spec_path), validate=False)).dump(ir_path)
+
+        parse = best_of(
+            args.repeat, lambda: OpenAPIParser(str(spec_path), validate=False).get_operations()
+        )
+        load = best_of(args.repeat, lambda: SpecIR.load(ir_path).get_operations())
+        print(f"Synthetic spec: {args.paths} paths, IR {ir_path.stat().st_size / (1024 * 1024):.1f} MiB")
+        print(f"{'parse spec (s)':>15} {'load IR (s)':>12} {'speedup':>8}")
+        print(f"{parse:>15.3f} {load:>12.3f} {parse / load:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Benchmark spec loading modes on a large synthetic JSON spec.
+
+Each mode loads the same spec in a fresh subprocess, so peak RSS is not
+polluted by earlier runs. Load time, total time (load + ``get_operations``)
+and peak RSS during load come from an untraced run; peak Python heap during
+load, and the heap still held once operations are built (parser and
+operation records alive), come from a second run under ``tracemalloc``. Streaming builds
+operations while loading, so compare its total time with the others. Mapped
+file pages count towards RSS while they are resident but are reclaimable page
+cache, so the heap column is the one that shows the avoided buffer copy.
+
+Usage:
+    python benchmarks/bench_load.py
+    python benchmarks/bench_load.py --paths 20000 --modes read,mmap
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Parser keyword arguments for each benchmarked mode
+MODES = {
+    "read": {},
+    "mmap": {"memory_map": True},
+    "stream": {"streaming": True},
+    "lazy": {"lazy": True},
+    "intern": {"intern_strings": True},
+    "lazy-intern": {"lazy": True, "intern_strings": True},
+}
+
+CHILD_SCRIPT = """
+import json, resource, sys, time, tracemalloc
+from mcp_swagger_cli.parser import OpenAPIParser
+
+spec_path, kwargs, trace = sys.argv[1], json.loads(sys.argv[2]), sys.argv[3] == "1"
+if trace:
+    tracemalloc.start()
+start = time.perf_counter()
+parser = OpenAPIParser(spec_path, validate=False, **kwargs)
+load_seconds = time.perf_counter() - start
+load_heap = tracemalloc.get_traced_memory()[1] if trace else 0
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+operations = parser.get_operations()
+total_seconds = time.perf_counter() - start
+retained_heap = tracemalloc.get_traced_memory()[0] if trace else 0
+print(json.dumps({
+    "load_seconds": load_seconds,
+    "total_seconds": total_seconds,
+    "peak_rss_mb": rss / (1024 * 1024 if sys.platform == "darwin" else 1024),
+    "peak_heap_mb": load_heap / (1024 * 1024),
+    "retained_heap_mb": retained_heap / (1024 * 1024),
+    "operations": len(operations),
+}))
+"""
+
+
+def build_spec(path_count: int) -> dict:
+    """Build a synthetic spec with realistic per-operation bulk."""
+    paths = {}
+    for i in range(path_count):
+        paths[f"/resources{i}/{{id}}"] = {
+            "parameters": [
+                {"name": "id", "in": "path", "required": True, "schema": {"type": "string"}},
+            ],
+            "get": {
+                "operationId": f"getResource{i}",
+                "summary": f"Get resource {i}",
+                "description": "Returns a single resource. " * 8,
+                "tags": [f"group{i % 50}"],
+                "parameters": [
+                    {"name": "expand", "in": "query", "schema": {"type": "array", "items": {"type": "string"}}},
+                ],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "#/components/schemas/Resource"},
+                                "example": {"id": str(i), "tags": ["a", "b", "c"] * 10},
+                            },
+                        },
+                    },
+                    "404": {"description": "Not found"},
+                },
+            },
+            "put": {
+                "operationId": f"putResource{i}",
+                "tags": [f"group{i % 50}"],
+                "requestBody": {
+                    "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Resource"}}},
+                },
+                "responses": {"204": {"description": "Updated"}},
+            },
+        }
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Synthetic", "version": "1.0.0"},
+        "paths": paths,
+        "components": {
+            "schemas": {
+                "Resource": {
+                    "type": "object",
+                    "properties": {"id": {"type": "string"}, "tags": {"type": "array"}},
+                },
+            },
+        },
+    }
+
+
+def run_mode(spec_path: Path, kwargs: dict, trace: bool) -> dict:
+    """Load the spec in a subprocess and return its measurements."""
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, str(spec_path), json.dumps(kwargs), "1" if trace else "0"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT,
+    )
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--paths", type=int, default=20000, help="Number of path items")
+    arg_parser.add_argument("--modes", default=",".join(MODES), help="Comma-separated modes")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        spec_path = Path(tmp) / "synthetic.json"
+        spec_path.write_text(json.dumps(build_spec(args.paths)))
+        size_mb = spec_path.stat().st_size / (1024 * 1024)
+        print(f"Synthetic spec: {args.paths} paths, {size_mb:.1f} MiB")
+        print(
+            f"{'mode':<12} {'load (s)':>9} {'total (s)':>10} {'peak RSS (MiB)':>15} "
+            f"{'peak heap (MiB)':>16} {'retained (MiB)':>15}"
+        )
+        for mode in args.modes.split(","):
+            stats = run_mode(spec_path, MODES[mode], trace=False)
+            traced = run_mode(spec_path, MODES[mode], trace=True)
+            print(
+                f"{mode:<12} {stats['load_seconds']:>9.2f} {stats['total_seconds']:>10.2f} "
+                f"{stats['peak_rss_mb']:>15.1f} {traced['peak_heap_mb']:>16.1f} "
+                f"{traced['retained_heap_mb']:>15.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""On-disk caches for parsed specifications."""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import IO, Any
+
+# Default size bound for the parsed-spec cache (256 MiB)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """Get the root directory for mcp-swagger caches.
+
+    Honours ``MCP_SWAGGER_CACHE_DIR``, then ``XDG_CACHE_HOME``, and falls back
+    to ``~/.cache/mcp-swagger-cli``.
+    """
+    override = os.environ.get("MCP_SWAGGER_CACHE_DIR")
+    if override:
+        return Path(override)
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "mcp-swagger-cli"
+
+
+def spec_digest(data: bytes) -> str:
+    """Get the content address (SHA-256 hex digest) of raw spec bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class SpecCache:
+    """Content-addressed cache of parsed specs.
+
+    Entries are keyed by the SHA-256 of the raw spec bytes and store the
+    parsed structure as a pickle, so a warm load skips JSON/YAML parsing
+    entirely. The cache is bounded by total size; the least recently used
+    entries (by modification time, refreshed on every hit) are evicted first.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (defaults to ``<cache dir>/specs``)
+            max_bytes: Maximum total size of cached entries in bytes
+        """
+        self.directory = Path(directory) if directory else default_cache_dir() / "specs"
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.directory / f"{key}.pickle"
+
+    def get(self, key: str) -> Any | None:
+        """Get a parsed spec by content digest, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            # Corrupt or unreadable entry - drop it and treat as a miss
+            path.unlink(missing_ok=True)
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a parsed spec under its content digest.
+
+        Cache write failures are ignored; the cache is purely an optimization.
+        """
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see partial entries
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, self._entry_path(key))
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except (OSError, pickle.PicklingError):
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = []
+        total = 0
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        for path in self.directory.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+
+
+class HTTPCache:
+    """Revalidation cache for URL-sourced specs.
+
+    Stores the body of each fetched spec together with its ``ETag`` and
+    ``Last-Modified`` validators, so later fetches can be made conditional
+    and reuse the stored body when the server answers ``304 Not Modified``.
+    """
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Cache directory (defaults to ``<cache dir>/http``)
+        """
+        self.directory = Path(directory) if directory else default_cache_dir() / "http"
+
+    def _entry_paths(self, url: str) -> tuple[Path, Path]:
+        """Get the body and metadata file paths for a URL."""
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.body", self.directory / f"{key}.json"
+
+    def get(self, url: str) -> tuple[bytes, dict[str, str]] | None:
+        """Get the cached body and validators for a URL, or None on a miss."""
+        body_path, meta_path = self._entry_paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url:
+            return None
+        return body, meta
+
+    @staticmethod
+    def conditional_headers(meta: dict[str, str]) -> dict[str, str]:
+        """Build conditional request headers from stored validators."""
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def put(self, url: str, body: bytes | IO[bytes], headers: Any) -> None:
+        """Store a fetched spec if the response carries validators.
+
+        Args:
+            url: URL the spec was fetched from
+            body: Raw response body, or a seekable binary file holding it
+            headers: Response headers (any mapping with case-insensitive ``get``)
+        """
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+
+        meta = {
+            "url": url,
+            "etag": etag or "",
+            "last_modified": last_modified or "",
+            "content_type": headers.get("content-type", ""),
+        }
+        body_path, meta_path = self._entry_paths(url)
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Metadata is removed first and written last, so an entry only
+            # counts once both files are complete
+            meta_path.unlink(missing_ok=True)
+            if isinstance(body, bytes):
+                body_path.write_bytes(body)
+            else:
+                body.seek(0)
+                with open(body_path, "wb") as f:
+                    shutil.copyfileobj(body, f)
+                body.seek(0)
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        except OSError:
+            return
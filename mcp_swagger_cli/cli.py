@@ -5,10 +5,13 @@ from typing import Optional
 
 import typer
 from rich.console import Console
+from rich.markup import escape
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from mcp_swagger_cli import __version__
+from mcp_swagger_cli.cache import HTTPCache, SpecCache
 from mcp_swagger_cli.generator import MCPServerGenerator
+from mcp_swagger_cli.http_client import configure_http_client
 
 app = typer.Typer(
     name="mcp-swagger",
@@ -18,6 +21,44 @@ app = typer.Typer(
 
 console = Console()
 
+STREAM_OPTION_HELP = (
+    "Stream large JSON spec files path item by path item instead of loading "
+    "the whole document into memory"
+)
+
+MMAP_OPTION_HELP = (
+    "Memory-map local spec files instead of reading them (the text is still "
+    "copied once for the decoder)"
+)
+
+LAZY_OPTION_HELP = (
+    "Index JSON specs and decode top-level members and path items only when "
+    "they are accessed"
+)
+
+INTERN_OPTION_HELP = (
+    "Share one copy of each distinct string across the parsed spec to cut "
+    "memory on large specs (costs one extra pass after decoding)"
+)
+
+SHARE_SCHEMAS_OPTION_HELP = (
+    "Hold one copy of each structurally identical schema across the operation "
+    "records, and write it once into generated servers (costs one extra pass "
+    "over each schema)"
+)
+
+REF_DEPTH_OPTION_HELP = (
+    "Expand at most this many levels of nested $refs in request bodies and schemas "
+    "(1 resolves only the top-level ref; default: all, up to cycles)"
+)
+
+HTTP2_OPTION_HELP = "Fetch URL specs and referenced documents over HTTP/2 (needs the 'h2' package)"
+
+CACHE_OPTION_HELP = (
+    "Reuse previously parsed specs from the on-disk cache (keyed by content hash) "
+    "and revalidate URL specs with ETag/Last-Modified"
+)
+
 
 def version_callback(value: bool) -> None:
     """Print version and exit."""
@@ -43,7 +84,7 @@ def callback() -> None:
 def create(
     spec: str = typer.Argument(
         ...,
-        help="URL or file path to Swagger/OpenAPI specification (JSON or YAML)",
+        help="URL or file path to Swagger/OpenAPI specification (JSON or YAML) or compiled IR, or - for stdin",
         show_default=False,
     ),
     output: Optional[Path] = typer.Option(
@@ -117,18 +158,65 @@ def create(
         None,
         "--tag",
         "-T",
-        help="Filter operations by tags (repeatable). Only operations with matching tags will be included.",
+        help=(
+            "Filter operations by tags (repeatable). Only operations with matching tags will be included. "
+            "Every path item is still decoded to read its operations' tags."
+        ),
     ),
     path_filter: Optional[list[str]] = typer.Option(
         None,
         "--path-filter",
-        help="Filter operations by path (repeatable). Only operations with paths containing the filter will be included.",
+        help=(
+            "Filter operations by path (repeatable). Only operations with paths containing the filter will be included. "
+            "Other path items are skipped undecoded with --lazy or --stream; otherwise the whole spec is decoded first."
+        ),
     ),
     max_operations: Optional[int] = typer.Option(
         None,
         "--max-operations",
         help="Maximum number of operations to include. If exceeded, requires --tag or --path-filter.",
     ),
+    ref_depth: Optional[int] = typer.Option(
+        None,
+        "--ref-depth",
+        min=0,
+        help=REF_DEPTH_OPTION_HELP,
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help=CACHE_OPTION_HELP,
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help=STREAM_OPTION_HELP,
+    ),
+    mmap: bool = typer.Option(
+        False,
+        "--mmap",
+        help=MMAP_OPTION_HELP,
+    ),
+    lazy: bool = typer.Option(
+        False,
+        "--lazy",
+        help=LAZY_OPTION_HELP,
+    ),
+    intern: bool = typer.Option(
+        False,
+        "--intern",
+        help=INTERN_OPTION_HELP,
+    ),
+    share_schemas: bool = typer.Option(
+        False,
+        "--share-schemas",
+        help=SHARE_SCHEMAS_OPTION_HELP,
+    ),
+    http2: bool = typer.Option(
+        False,
+        "--http2",
+        help=HTTP2_OPTION_HELP,
+    ),
 ) -> None:
     """
     Create an MCP server from a Swagger/OpenAPI specification.
@@ -148,6 +236,12 @@ def create(
     console.print(f"[bold cyan]MCP Swagger CLI[/bold cyan] v{__version__}")
     console.print()
     
+    if verbose:
+        from mcp_swagger_cli.parser import describe_yaml_loader
+        
+        console.print(f"[dim]YAML loader:[/dim] {describe_yaml_loader()}")
+        console.print()
+    
     # Resolve output path
     if output is None:
         output = Path.cwd() / "generated_mcp_server"
@@ -197,6 +291,8 @@ def create(
         )
         
         try:
+            if http2:
+                configure_http_client(http2=True)
             generator = MCPServerGenerator(
                 spec_path=spec,
                 server_name=name,
@@ -211,6 +307,14 @@ def create(
                 tags=tag,
                 path_filters=path_filter,
                 max_operations=max_operations,
+                cache=SpecCache() if cache else None,
+                http_cache=HTTPCache() if cache else None,
+                streaming=stream,
+                memory_map=mmap,
+                lazy=lazy,
+                intern_strings=intern,
+                ref_depth=ref_depth,
+                share_schemas=share_schemas,
             )
             progress.update(task_parse, completed=True)
         except Exception as e:
@@ -262,7 +366,7 @@ def create(
 def validate_spec(
     spec: str = typer.Argument(
         ...,
-        help="URL or file path to Swagger/OpenAPI specification",
+        help="URL or file path to Swagger/OpenAPI specification or compiled IR, or - for stdin",
         show_default=False,
     ),
     verbose: bool = typer.Option(
@@ -271,6 +375,36 @@ def validate_spec(
         "-v",
         help="Show detailed validation results",
     ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help=CACHE_OPTION_HELP,
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help=STREAM_OPTION_HELP,
+    ),
+    mmap: bool = typer.Option(
+        False,
+        "--mmap",
+        help=MMAP_OPTION_HELP,
+    ),
+    lazy: bool = typer.Option(
+        False,
+        "--lazy",
+        help=LAZY_OPTION_HELP,
+    ),
+    intern: bool = typer.Option(
+        False,
+        "--intern",
+        help=INTERN_OPTION_HELP,
+    ),
+    http2: bool = typer.Option(
+        False,
+        "--http2",
+        help=HTTP2_OPTION_HELP,
+    ),
 ) -> None:
     """
     Validate a Swagger/OpenAPI specification.
@@ -281,13 +415,29 @@ def validate_spec(
         
         mcp-swagger validate-spec ./api_spec.yaml
     """
-    from mcp_swagger_cli.parser import OpenAPIParser
+    from mcp_swagger_cli.ir import load_spec_source
+    from mcp_swagger_cli.parser import describe_yaml_loader
     
     console.print(f"[bold cyan]Validating specification...[/bold cyan]")
     console.print()
     
+    if verbose:
+        console.print(f"[dim]YAML loader:[/dim] {describe_yaml_loader()}")
+        console.print()
+    
     try:
-        parser = OpenAPIParser(spec_path=spec, validate=True)
+        if http2:
+            configure_http_client(http2=True)
+        parser = load_spec_source(
+            spec,
+            validate=True,
+            cache=SpecCache() if cache else None,
+            http_cache=HTTPCache() if cache else None,
+            streaming=stream,
+            memory_map=mmap,
+            lazy=lazy,
+            intern_strings=intern,
+        )
         spec_info = parser.get_spec_info()
         
         console.print(f"[bold green]✓ Specification is valid![/bold green]")
@@ -323,9 +473,39 @@ def validate_spec(
 def info(
     spec: str = typer.Argument(
         ...,
-        help="URL or file path to Swagger/OpenAPI specification",
+        help="URL or file path to Swagger/OpenAPI specification or compiled IR, or - for stdin",
         show_default=False,
     ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help=CACHE_OPTION_HELP,
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help=STREAM_OPTION_HELP,
+    ),
+    mmap: bool = typer.Option(
+        False,
+        "--mmap",
+        help=MMAP_OPTION_HELP,
+    ),
+    lazy: bool = typer.Option(
+        False,
+        "--lazy",
+        help=LAZY_OPTION_HELP,
+    ),
+    intern: bool = typer.Option(
+        False,
+        "--intern",
+        help=INTERN_OPTION_HELP,
+    ),
+    http2: bool = typer.Option(
+        False,
+        "--http2",
+        help=HTTP2_OPTION_HELP,
+    ),
 ) -> None:
     """
     Show information about a Swagger/OpenAPI specification.
@@ -340,13 +520,24 @@ def info(
     
         mcp-swagger info https://petstore.swagger.io/v2/swagger.json
     """
-    from mcp_swagger_cli.parser import OpenAPIParser
+    from mcp_swagger_cli.ir import load_spec_source
     
     console.print(f"[bold cyan]Loading specification...[/bold cyan]")
     console.print()
     
     try:
-        parser = OpenAPIParser(spec_path=spec, validate=False)
+        if http2:
+            configure_http_client(http2=True)
+        parser = load_spec_source(
+            spec,
+            validate=False,
+            cache=SpecCache() if cache else None,
+            http_cache=HTTPCache() if cache else None,
+            streaming=stream,
+            memory_map=mmap,
+            lazy=lazy,
+            intern_strings=intern,
+        )
         spec_info = parser.get_spec_info()
         
         # Title and version
@@ -390,6 +581,209 @@ def info(
         raise typer.Exit(1)
 
 
+@app.command("compile")
+def compile_spec(
+    spec: str = typer.Argument(
+        ...,
+        help="URL or file path to Swagger/OpenAPI specification, or - for stdin",
+        show_default=False,
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Output IR file (defaults to the spec file name with a .mcpir suffix)",
+        dir_okay=False,
+    ),
+    validate: bool = typer.Option(
+        True,
+        "--validate/--no-validate",
+        help="Validate specification before compiling",
+    ),
+    ref_depth: Optional[int] = typer.Option(
+        None,
+        "--ref-depth",
+        min=0,
+        help=REF_DEPTH_OPTION_HELP,
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help=CACHE_OPTION_HELP,
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help=STREAM_OPTION_HELP,
+    ),
+    mmap: bool = typer.Option(
+        False,
+        "--mmap",
+        help=MMAP_OPTION_HELP,
+    ),
+    lazy: bool = typer.Option(
+        False,
+        "--lazy",
+        help=LAZY_OPTION_HELP,
+    ),
+    intern: bool = typer.Option(
+        False,
+        "--intern",
+        help=INTERN_OPTION_HELP,
+    ),
+    share_schemas: bool = typer.Option(
+        False,
+        "--share-schemas",
+        help=SHARE_SCHEMAS_OPTION_HELP,
+    ),
+    http2: bool = typer.Option(
+        False,
+        "--http2",
+        help=HTTP2_OPTION_HELP,
+    ),
+) -> None:
+    """
+    Compile a Swagger/OpenAPI specification into a binary IR file.
+    
+    The IR holds the spec info, schemas and operation model, and loads in
+    milliseconds. Pass it to create, info or validate-spec in place of the spec.
+    
+    Examples:
+    
+        mcp-swagger compile ./api_spec.yaml -o ./api.mcpir
+        
+        mcp-swagger create ./api.mcpir -o ./server
+    """
+    from mcp_swagger_cli.ir import IR_SUFFIX, SpecIR
+    from mcp_swagger_cli.parser import OpenAPIParser
+    
+    if output is None:
+        stem = "spec" if spec == "-" else Path(spec.rstrip("/")).stem or "spec"
+        output = Path.cwd() / f"{stem}{IR_SUFFIX}"
+    
+    console.print(f"[bold cyan]Compiling specification...[/bold cyan]")
+    console.print()
+    
+    try:
+        if http2:
+            configure_http_client(http2=True)
+        parser = OpenAPIParser(
+            spec_path=spec,
+            validate=validate,
+            cache=SpecCache() if cache else None,
+            http_cache=HTTPCache() if cache else None,
+            streaming=stream,
+            memory_map=mmap,
+            lazy=lazy,
+            intern_strings=intern,
+            ref_depth=ref_depth,
+            share_schemas=share_schemas,
+        )
+        ir = SpecIR.from_parser(parser)
+        ir.dump(output)
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(1)
+    
+    console.print(f"[bold green]✓[/bold green] Compiled {len(ir.operations)} operations")
+    console.print(f"  [dim]Output:[/dim] {output}")
+
+
+@app.command("diff")
+def diff_specs(
+    old: str = typer.Argument(
+        ...,
+        help="URL or file path to the old Swagger/OpenAPI specification",
+        show_default=False,
+    ),
+    new: str = typer.Argument(
+        ...,
+        help="URL or file path to the new Swagger/OpenAPI specification",
+        show_default=False,
+    ),
+    exit_code: bool = typer.Option(
+        False,
+        "--exit-code",
+        help="Exit with status 1 if the specifications differ",
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help=CACHE_OPTION_HELP,
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help=STREAM_OPTION_HELP,
+    ),
+    mmap: bool = typer.Option(
+        False,
+        "--mmap",
+        help=MMAP_OPTION_HELP,
+    ),
+    lazy: bool = typer.Option(
+        False,
+        "--lazy",
+        help=LAZY_OPTION_HELP,
+    ),
+    http2: bool = typer.Option(
+        False,
+        "--http2",
+        help=HTTP2_OPTION_HELP,
+    ),
+) -> None:
+    """
+    Show which path items, operations and components differ between two specs.
+    
+    Both specs are fingerprinted into a Merkle tree of content hashes and only
+    the subtrees whose hashes differ are reported. Formatting and key order
+    do not count as changes.
+    
+    Examples:
+    
+        mcp-swagger diff ./api-v1.json ./api-v2.json
+        
+        mcp-swagger diff ./api.json https://example.com/openapi.json --exit-code
+    """
+    from mcp_swagger_cli.parser import OpenAPIParser
+    
+    try:
+        if http2:
+            configure_http_client(http2=True)
+        old_fingerprint, new_fingerprint = (
+            OpenAPIParser(
+                spec_path=spec,
+                validate=False,
+                cache=SpecCache() if cache else None,
+                http_cache=HTTPCache() if cache else None,
+                streaming=stream,
+                memory_map=mmap,
+                lazy=lazy,
+                fingerprint=True,
+            ).get_fingerprint()
+            for spec in (old, new)
+        )
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(1)
+    
+    changes = old_fingerprint.diff(new_fingerprint)
+    if not changes:
+        console.print("[bold green]✓[/bold green] No changes")
+        console.print(f"  [dim]Fingerprint:[/dim] {new_fingerprint.hexdigest}")
+        return
+    
+    markers = {"added": "[green]+[/green]", "removed": "[red]-[/red]", "changed": "[yellow]~[/yellow]"}
+    for change, names in changes:
+        console.print(f"  {markers[change]} {escape(' '.join(names))}", highlight=False)
+    console.print()
+    console.print(f"{len(changes)} change(s)")
+    console.print(f"  [dim]Old fingerprint:[/dim] {old_fingerprint.hexdigest}")
+    console.print(f"  [dim]New fingerprint:[/dim] {new_fingerprint.hexdigest}")
+    if exit_code:
+        raise typer.Exit(1)
+
+
 def main() -> None:
     """Main entry point for the CLI."""
     app()
@@ -0,0 +1,88 @@
+"""Flattening of ``allOf`` schema composition.
+
+Specs generated from class hierarchies describe most types as
+``allOf: [{$ref: Base}, {properties: ...}]``. Clients of the generated
+server need the effective schema: :class:`AllOfMerger` folds the components
+of an ``allOf`` into one schema, taking the union of their ``properties``
+and ``required`` lists; for other keywords the first component that sets
+one wins. Keywords next to ``allOf`` in the composed schema itself are
+applied last, on top of the merged components.
+
+Merged components are cached by the identity of the component objects. The
+dereferencer shares one object per ref target, so a base type used by
+hundreds of schemas is merged with the same siblings once per run.
+
+An ``allOf`` with a component that is still a ``$ref`` (one that does not
+resolve, closes a cycle or lies beyond the configured ref depth) is left
+as it is, since its constraints are unknown.
+"""
+
+from typing import Any
+
+
+def _merge_into(merged: dict[str, Any], schema: dict[str, Any], override: bool) -> None:
+    """Merge one schema into the accumulated result, in place."""
+    for key, value in schema.items():
+        if key == "properties" and isinstance(value, dict):
+            properties = merged.setdefault("properties", {})
+            for name, property_schema in value.items():
+                existing = properties.get(name)
+                if isinstance(existing, dict) and isinstance(property_schema, dict):
+                    property_schema = {**existing, **property_schema}
+                properties[name] = property_schema
+        elif key == "required" and isinstance(value, list):
+            required = merged.setdefault("required", [])
+            required.extend(name for name in value if name not in required)
+        elif override or key not in merged:
+            merged[key] = value
+
+
+class AllOfMerger:
+    """Flatten ``allOf`` schemas, caching merges by component identity."""
+
+    def __init__(self) -> None:
+        # (components, merged) by component ids; the components are kept so
+        # their ids are not reused while the entry exists
+        self._merged: dict[tuple[int, ...], tuple[list[Any], dict[str, Any]]] = {}
+
+    def __call__(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Flatten a schema's ``allOf``, if it has one that can be flattened.
+
+        Components are expected to be dereferenced and flattened already
+        (the dereferencer calls this bottom-up).
+
+        Returns:
+            The effective schema, or the schema itself if it is left as it is
+        """
+        components = schema.get("allOf")
+        if not isinstance(components, list) or not components:
+            return schema
+        if not all(isinstance(c, dict) and "$ref" not in c and "allOf" not in c for c in components):
+            return schema
+
+        merged = self.merge(components)
+        siblings = {key: value for key, value in schema.items() if key != "allOf"}
+        if not siblings:
+            return merged
+        result = {
+            key: list(value) if key == "required" else dict(value) if key == "properties" else value
+            for key, value in merged.items()
+        }
+        _merge_into(result, siblings, override=True)
+        return result
+
+    def merge(self, components: list[dict[str, Any]]) -> dict[str, Any]:
+        """Merge a list of ``allOf`` components into one schema (cached)."""
+        key = tuple(id(component) for component in components)
+        cached = self._merged.get(key)
+        if cached is not None:
+            return cached[1]
+
+        if len(components) == 1:
+            merged = components[0]
+        else:
+            merged = {}
+            for component in components:
+                _merge_into(merged, component, override=False)
+        self._merged[key] = (list(components), merged)
+        return merged
@@ -0,0 +1,80 @@
+"""Transparent decompression of compressed spec inputs.
+
+Archived specs are often stored as ``.json.gz``, ``.yaml.zst`` or ``.bz2``.
+Compression is detected from the leading magic bytes, which every supported
+codec has, so mislabeled files and bodies already decoded by the HTTP client
+(``Content-Encoding: gzip``) are handled correctly. The underlying format
+is then sniffed from the decompressed leading bytes, like any other spec.
+
+zstd support needs the optional ``zstandard`` package.
+"""
+
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+from typing import IO
+
+from mcp_swagger_cli.exceptions import SpecParseError
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+# Leading bytes of each supported compressed format
+_MAGIC_NUMBERS = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+
+# Number of leading bytes needed to recognize any supported format
+MAGIC_LENGTH = max(len(magic) for magic, _ in _MAGIC_NUMBERS)
+
+# Exceptions raised by the decompressors on corrupt or truncated input
+DECOMPRESSION_ERRORS: tuple[type[BaseException], ...] = (OSError, EOFError, lzma.LZMAError)
+if zstandard is not None:
+    DECOMPRESSION_ERRORS += (zstandard.ZstdError,)
+
+
+def detect_compression(head: bytes) -> str | None:
+    """Detect the compression codec from the leading bytes of the input."""
+    for magic, codec in _MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def open_decompressed(source: str | Path | IO[bytes], codec: str) -> IO[bytes]:
+    """Open a streaming decompressor over a file path or binary stream.
+
+    When given a path, closing the returned stream also closes the file; a
+    stream passed in stays owned by the caller.
+
+    Args:
+        source: Path to, or binary stream of, the compressed data
+        codec: Codec name as returned by :func:`detect_compression`
+
+    Returns:
+        A binary stream yielding the decompressed bytes
+
+    Raises:
+        SpecParseError: If the codec needs an optional package that is missing
+    """
+    if codec == "gzip":
+        return gzip.open(source, "rb")
+    if codec == "bz2":
+        return bz2.open(source, "rb")
+    if codec == "xz":
+        return lzma.open(source, "rb")
+    if codec == "zstd":
+        if zstandard is None:
+            raise SpecParseError(
+                "Spec is zstd-compressed; install the 'zstandard' package to read it"
+            )
+        if isinstance(source, (str, Path)):
+            return zstandard.ZstdDecompressor().stream_reader(open(source, "rb"), closefd=True)
+        return zstandard.ZstdDecompressor().stream_reader(source, closefd=False)
+    raise ValueError(f"Unsupported compression codec: {codec}")
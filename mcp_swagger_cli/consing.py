@@ -0,0 +1,96 @@
+"""Hash-consing of structurally identical schemas.
+
+Large vendor specs repeat the same inline shapes (pagination envelopes,
+error objects, ``{"type": "string", "format": "date-time"}``) hundreds of
+times, and each occurrence is its own tree of dicts and lists.
+:class:`HashConser` replaces every dict and list with the first structurally
+identical one it has seen, so equal subtrees are held once.
+
+The walk is bottom-up: once a node's children are shared instances, two
+nodes are identical exactly when they have the same keys in the same order
+and the same child objects. A node's key is therefore a flat tuple of its
+keys, scalar values (with their types, so ``1``, ``1.0`` and ``True`` stay
+apart) and child ids, never a serialization of the subtree. The cost is one
+pass over each node, and a node that is already a shared instance is not
+walked again.
+
+Children are replaced in place, so the input must not be mutated by anyone
+relying on its old identity; shared instances must be treated as read-only.
+Values other than dicts, lists and scalars (lazy views, for example) are
+left as they are and compared by identity.
+"""
+
+from typing import Any
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+class HashConser:
+    """Share one instance per structurally identical dict or list."""
+
+    __slots__ = ("_table", "_shared")
+
+    def __init__(self) -> None:
+        # Shared instance by structural key; keys hold the ids of shared
+        # children, which stay alive as parts of the shared instances
+        self._table: dict[tuple[Any, ...], Any] = {}
+        # Ids of the shared instances
+        self._shared: set[int] = set()
+
+    def __len__(self) -> int:
+        """Number of distinct shared instances."""
+        return len(self._table)
+
+    def __call__(self, node: Any) -> Any:
+        """Get the shared instance of a value, sharing its subtrees in place.
+
+        Args:
+            node: A decoded JSON/YAML value
+
+        Returns:
+            The shared instance structurally identical to the node (the node
+            itself the first time its structure is seen), or the node if it
+            is not a dict or list
+        """
+        if not isinstance(node, (dict, list)):
+            return node
+        return self._cons(node, {})
+
+    def _cons(self, node: Any, seen: dict[int, Any]) -> Any:
+        if id(node) in self._shared:
+            return node
+        done = seen.get(id(node), seen)
+        if done is not seen:
+            # Visited earlier in this walk (shared within the input), or a
+            # cycle back to a node still being walked
+            return done
+        seen[id(node)] = node
+
+        if isinstance(node, dict):
+            key: list[Any] = [dict]
+            for name, value in node.items():
+                key.append(name if type(name) is str else (type(name), name))
+                key.append(self._element(node, name, value, seen))
+        else:
+            key = [list]
+            for index, value in enumerate(node):
+                key.append(self._element(node, index, value, seen))
+
+        shared = self._table.setdefault(tuple(key), node)
+        if shared is node:
+            self._shared.add(id(node))
+        seen[id(node)] = shared
+        return shared
+
+    def _element(self, parent: Any, slot: Any, value: Any, seen: dict[int, Any]) -> Any:
+        """Share a child, store it back in place and return its part of the key."""
+        if isinstance(value, (dict, list)):
+            shared = self._cons(value, seen)
+            if shared is not value:
+                # Replacing the value of an existing key or index keeps the
+                # container's layout, so this is safe while iterating
+                parent[slot] = shared
+            return id(shared)
+        if isinstance(value, _SCALARS):
+            return (type(value), value)
+        return (object, id(value))
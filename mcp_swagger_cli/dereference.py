@@ -0,0 +1,158 @@
+"""Deep, memoized dereferencing of schemas.
+
+Resolving only the top-level ``$ref`` of a schema leaves the refs nested in
+its ``properties``, ``items``, ``additionalProperties`` and so on as raw
+``{"$ref": ...}`` dicts. :class:`Dereferencer` replaces refs at any depth by
+their targets, themselves dereferenced.
+
+Each ref target is dereferenced once and the result is shared by every
+referrer, so the work is linear in the size of the schemas plus the number
+of refs, however many times a target is used. Only ref targets (and nodes
+passed with ``shared=True``, such as the entries of the schema table) are
+memoized, so inline schemas of streamed path items are not kept alive.
+Containers without refs below them are returned as they are, not copied.
+
+The expansion can be bounded: with ``max_depth``, at most that many refs are
+expanded along any path down from the schema, and deeper refs are kept as
+they are (``max_depth=1`` resolves only a top-level ref). Results are then
+memoized per target and remaining depth.
+
+A ``compose`` hook, applied bottom-up to every dict that has an ``allOf``
+once its components are dereferenced, lets composition be flattened in the
+same walk (see :mod:`mcp_swagger_cli.composition`); its results are
+memoized along with the targets they belong to.
+
+Recursive schemas (a ``Node`` whose ``children`` are ``Node`` items) cannot
+be expanded in full. A ref back to a target that is still being
+dereferenced further up is kept as the original ``{"$ref": ...}`` dict: a
+back-reference, so the result is always a finite tree that can be
+serialized. Since results are shared, a target first reached from inside a
+cycle keeps that back-reference wherever else it is used.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+# Remaining ref levels to expand; None for unlimited
+Depth = int | None
+
+
+class Dereferencer:
+    """Replace ``$ref`` dicts at any depth by their dereferenced targets."""
+
+    def __init__(
+        self,
+        resolve: Callable[[dict[str, Any]], Any],
+        max_depth: Depth = None,
+        compose: Callable[[dict[str, Any]], Any] | None = None,
+        locate: Callable[[dict[str, Any]], str] | None = None,
+    ) -> None:
+        """Initialize the dereferencer.
+
+        Args:
+            resolve: Resolves one ``{"$ref": ...}`` dict to its target,
+                returning the dict itself when the ref cannot be resolved
+            max_depth: Most refs expanded along any path down from a schema,
+                or None for no limit
+            compose: Optional callable applied to each dict with an ``allOf``
+                after its children are dereferenced, returning its
+                replacement (e.g. an :class:`~mcp_swagger_cli.composition.AllOfMerger`)
+            locate: Optional callable giving the absolute form of a ``$ref``
+                dict's ref, so equal relative refs read from different
+                documents are memoized apart (defaults to the ref itself)
+        """
+        self._resolve = resolve
+        self.max_depth = max_depth
+        self._compose = compose
+        self._locate = locate
+        # Dereferenced target by ref string and remaining depth
+        self._refs: dict[tuple[str, Depth], Any] = {}
+        # (target, result) by target id and remaining depth; the target is
+        # kept so its id is not reused while the entry exists
+        self._targets: dict[tuple[int, Depth], tuple[Any, Any]] = {}
+        # Refs and containers being dereferenced further up the current walk
+        self._active_refs: set[str] = set()
+        self._active_containers: set[int] = set()
+
+    def __call__(self, node: Any, shared: bool = False) -> Any:
+        """Dereference a schema (or any decoded value).
+
+        Args:
+            node: The node to dereference
+            shared: Whether the node can also be the target of refs (an entry
+                of a component table), so its result is memoized and shared
+                with them
+
+        Returns:
+            The node with refs replaced, or the node itself if nothing below
+            it changed
+        """
+        if not isinstance(node, (dict, list)) or self.max_depth == 0:
+            return node
+        if shared:
+            return self._walk_target(node, self.max_depth)
+        return self._walk(node, self.max_depth)
+
+    def _walk_target(self, node: Any, depth: Depth) -> Any:
+        key = (id(node), depth)
+        done = self._targets.get(key)
+        if done is not None:
+            return done[1]
+        result = self._walk(node, depth)
+        self._targets[key] = (node, result)
+        return result
+
+    def _walk(self, node: Any, depth: Depth) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                if self._locate is not None:
+                    ref = self._locate(node)
+                return self._follow(node, ref, depth)
+
+        key = id(node)
+        if key in self._active_containers:
+            return node
+
+        self._active_containers.add(key)
+        try:
+            result = node
+            children = node.items() if isinstance(node, dict) else enumerate(node)
+            for index, child in children:
+                if not isinstance(child, (dict, list)):
+                    continue
+                new = self._walk(child, depth)
+                if new is not child:
+                    if result is node:
+                        result = dict(node) if isinstance(node, dict) else list(node)
+                    result[index] = new
+        finally:
+            self._active_containers.discard(key)
+        if self._compose is not None and isinstance(result, dict) and "allOf" in result:
+            result = self._compose(result)
+        return result
+
+    def _follow(self, node: dict[str, Any], ref: str, depth: Depth) -> Any:
+        if depth == 0:
+            return node
+        done = self._refs.get((ref, depth))
+        if done is not None:
+            return done
+        if ref in self._active_refs:
+            # Back-reference into a target being dereferenced further up
+            return node
+
+        target = self._resolve(node)
+        if target is node or not isinstance(target, (dict, list)):
+            # Unresolvable refs are not memoized: the spec may still grow
+            return node
+        if id(target) in self._active_containers:
+            return node
+
+        self._active_refs.add(ref)
+        try:
+            result = self._walk_target(target, None if depth is None else depth - 1)
+        finally:
+            self._active_refs.discard(ref)
+        self._refs[(ref, depth)] = result
+        return result
@@ -0,0 +1,171 @@
+"""Streamed, resumable downloads of remote specs.
+
+Response bodies are streamed chunk by chunk into a temporary spool file
+instead of being buffered in memory, and hashed as they arrive so the
+content address for the parsed-spec cache is known as soon as the last
+byte lands. A transfer cut off mid-body is resumed with an HTTP ``Range``
+request when the server advertises byte ranges and a validator to pin the
+representation (``If-Range``); otherwise it fails as before.
+"""
+
+import hashlib
+import tempfile
+from typing import IO
+
+import httpx
+
+# How many times an interrupted transfer is resumed before giving up
+DEFAULT_MAX_RESUMES = 3
+
+# Request headers that must not be combined with a Range resume
+_CONDITIONAL_HEADERS = ("if-none-match", "if-modified-since")
+
+
+class Download:
+    """A response whose body has been spooled to a temporary file.
+
+    Attributes:
+        response: The (closed) response of the first request; its status and
+            headers describe the download
+        file: Spool file holding the body, positioned at the start
+        digest: SHA-256 hex digest of the body
+        size: Body size in bytes
+        resumes: Number of Range requests needed to complete the body
+    """
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        file: IO[bytes],
+        digest: str,
+        size: int,
+        resumes: int,
+    ) -> None:
+        self.response = response
+        self.file = file
+        self.digest = digest
+        self.size = size
+        self.resumes = resumes
+
+    def close(self) -> None:
+        """Close (and so delete) the spool file."""
+        self.file.close()
+
+    def __enter__(self) -> "Download":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _resume_validator(response: httpx.Response) -> str | None:
+    """Get the If-Range validator if the response can be resumed, else None.
+
+    Resuming needs byte-range support, an unencoded body (offsets into a
+    gzip-encoded body would not match the decoded bytes already written) and
+    a strong ETag or a Last-Modified date to detect a changed representation.
+    """
+    if response.headers.get("accept-ranges", "").lower() != "bytes":
+        return None
+    if response.headers.get("content-encoding", "identity").lower() != "identity":
+        return None
+    etag = response.headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("last-modified")
+
+
+def _content_range_start(response: httpx.Response) -> int | None:
+    """Get the first byte offset of a 206 response's Content-Range."""
+    content_range = response.headers.get("content-range", "")
+    unit, _, spec = content_range.partition(" ")
+    start, _, _ = spec.partition("-")
+    if unit.lower() != "bytes" or not start.isdigit():
+        return None
+    return int(start)
+
+
+def _without_range(headers: dict[str, str]) -> dict[str, str]:
+    """Drop the Range and If-Range headers of a resume request."""
+    return {key: value for key, value in headers.items() if key.lower() not in ("range", "if-range")}
+
+
+def download(
+    client: httpx.Client,
+    url: str,
+    headers: dict[str, str] | None = None,
+    max_resumes: int = DEFAULT_MAX_RESUMES,
+) -> Download:
+    """Stream a URL's body to a spool file, hashing it on the fly.
+
+    Non-2xx responses (e.g. ``304 Not Modified`` or errors) are returned
+    with an empty body for the caller to handle.
+
+    Args:
+        client: HTTP client to send the requests with
+        url: URL to download
+        headers: Extra request headers for the first request
+        max_resumes: How many times an interrupted transfer is resumed
+
+    Returns:
+        The spooled download; the caller must close it
+
+    Raises:
+        httpx.HTTPError: If the transfer fails and cannot be resumed
+    """
+    spool = tempfile.TemporaryFile()
+    hasher = hashlib.sha256()
+    received = 0
+    resumes = 0
+    first_response: httpx.Response | None = None
+    validator: str | None = None
+    request_headers = dict(headers or {})
+
+    try:
+        while True:
+            try:
+                with client.stream("GET", url, headers=request_headers) as response:
+                    if first_response is None:
+                        first_response = response
+                        if not response.is_success:
+                            break
+                        validator = _resume_validator(response)
+                    elif response.status_code == 206 and _content_range_start(response) != received:
+                        # A range other than the one asked for is not the
+                        # rest of the body, and never the whole of it: ask
+                        # for the full body again
+                        request_headers = _without_range(request_headers)
+                        continue
+                    elif response.status_code != 206:
+                        # The server ignored the range or the spec changed
+                        # (If-Range failed): start over with the full body
+                        response.raise_for_status()
+                        spool.seek(0)
+                        spool.truncate()
+                        hasher = hashlib.sha256()
+                        received = 0
+
+                    # Chunks as they come off the network; a fixed chunk size
+                    # would hold back bytes that a resume could have kept
+                    for chunk in response.iter_bytes():
+                        spool.write(chunk)
+                        hasher.update(chunk)
+                        received += len(chunk)
+                break
+            except httpx.TransportError:
+                if first_response is None or validator is None or resumes >= max_resumes:
+                    raise
+                resumes += 1
+                request_headers = {
+                    key: value
+                    for key, value in request_headers.items()
+                    if key.lower() not in _CONDITIONAL_HEADERS
+                }
+                request_headers["Range"] = f"bytes={received}-"
+                request_headers["If-Range"] = validator
+    except BaseException:
+        spool.close()
+        raise
+
+    spool.seek(0)
+    return Download(first_response, spool, hasher.hexdigest(), received, resumes)
@@ -0,0 +1,67 @@
+"""Operation selection by tag and path prefix.
+
+The same predicate serves two purposes: the generator uses it to pick the
+operations of the generated server, and the parser uses it during ingestion
+so path items that cannot match are skipped before they are decoded (where
+the loading mode allows) and operations that do not match are never built,
+which spares their parameter and schema ref resolution.
+"""
+
+from collections.abc import Iterable
+
+
+class OperationFilter:
+    """Select operations by tag and/or path prefix.
+
+    An operation matches if it has one of the tags, or if its path equals
+    one of the path filters or lies under it (``/users`` matches ``/users``
+    and ``/users/{id}`` but not ``/usersabc``). With both kinds of filter
+    given, either match is enough; with neither, every operation matches.
+    """
+
+    __slots__ = ("tags", "path_filters")
+
+    def __init__(
+        self,
+        tags: Iterable[str] | None = None,
+        path_filters: Iterable[str] | None = None,
+    ) -> None:
+        """Initialize the filter.
+
+        Args:
+            tags: Tags to select operations by
+            path_filters: Path prefixes to select operations by; a leading
+                ``/`` is added if missing
+        """
+        self.tags = frozenset(tags or ())
+        self.path_filters = tuple(
+            pf if pf.startswith("/") else "/" + pf for pf in path_filters or ()
+        )
+
+    def __bool__(self) -> bool:
+        """Whether the filter restricts anything at all."""
+        return bool(self.tags or self.path_filters)
+
+    def __repr__(self) -> str:
+        return f"OperationFilter(tags={sorted(self.tags)}, path_filters={list(self.path_filters)})"
+
+    def matches_path(self, path: str) -> bool:
+        """Check whether a path falls under one of the path filters."""
+        return any(path == pf or path.startswith(pf + "/") for pf in self.path_filters)
+
+    def may_match_path(self, path: str) -> bool:
+        """Check whether any operation of a path item could match.
+
+        False means the whole path item can be skipped unread. With a tag
+        filter, the tags are only known once the path item is read, so every
+        path item may match.
+        """
+        return not self.path_filters or bool(self.tags) or self.matches_path(path)
+
+    def matches(self, path: str, tags: Iterable[str] | None) -> bool:
+        """Check whether an operation with the given path and tags is selected."""
+        if not self:
+            return True
+        if self.tags and tags and any(tag in tags for tag in self.tags):
+            return True
+        return self.matches_path(path)
@@ -0,0 +1,196 @@
+"""Merkle fingerprints of specs.
+
+A :class:`Fingerprint` is a tree of SHA-256 digests mirroring the spec: the
+root has one child per top-level member; ``paths`` has one per path item and
+each path item one per member (its operations, shared parameters, ...);
+``components`` has one per section and each section one per named component
+(schemas, parameters, ...); the Swagger 2.0 tables (``definitions``,
+``parameters``, ``responses``, ``securityDefinitions``) one per entry. Leaves
+hash the canonical JSON of their value (sorted keys, no whitespace), so
+reformatting or reordering a spec does not change its fingerprint; inner
+nodes hash their children's names and digests.
+
+Two fingerprints are compared top-down and only subtrees whose digests
+differ are descended into, so finding what changed between two versions of
+a large spec costs about as much as the change, not the spec, once both
+fingerprints exist. Fingerprints serialize to plain dicts for storing next
+to generated output or in a cache.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+# Mapping levels below a top-level member that get their own nodes
+_TREE_DEPTHS = {
+    "paths": 2,
+    "components": 2,
+    "definitions": 1,
+    "parameters": 1,
+    "responses": 1,
+    "securityDefinitions": 1,
+}
+
+# Domain separation between leaf and inner-node hashes
+_LEAF_PREFIX = b"\x00"
+_TREE_PREFIX = b"\x01"
+
+
+def _json_default(value: Any) -> Any:
+    # Lazy views and YAML-only types (dates, ...) have no JSON encoding
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def _string_keys(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {str(key): _string_keys(child) for key, child in value.items()}
+    if isinstance(value, list):
+        return [_string_keys(child) for child in value]
+    return value
+
+
+def _canonical(value: Any) -> bytes:
+    """Encode a value as canonical JSON: sorted keys, no whitespace, UTF-8."""
+    try:
+        encoded = json.dumps(
+            value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=_json_default
+        )
+    except TypeError:
+        # YAML allows non-string keys (``200:`` next to ``default:``), which
+        # cannot be sorted together; JSON would turn them into strings anyway
+        return _canonical(_string_keys(value))
+    return encoded.encode("utf-8")
+
+
+class Fingerprint:
+    """A node of a spec's Merkle tree.
+
+    Attributes:
+        digest: SHA-256 of the node (raw bytes)
+        children: Child nodes by member name, or None for a leaf
+    """
+
+    __slots__ = ("digest", "children")
+
+    def __init__(self, digest: bytes, children: dict[str, "Fingerprint"] | None = None) -> None:
+        self.digest = digest
+        self.children = children
+
+    @classmethod
+    def leaf(cls, value: Any) -> "Fingerprint":
+        """Fingerprint a value as a whole."""
+        return cls(hashlib.sha256(_LEAF_PREFIX + _canonical(value)).digest())
+
+    @classmethod
+    def tree(cls, children: Mapping[str, "Fingerprint"]) -> "Fingerprint":
+        """Combine child fingerprints into an inner node (order-independent)."""
+        hasher = hashlib.sha256(_TREE_PREFIX)
+        for name in sorted(children):
+            encoded = name.encode("utf-8")
+            hasher.update(len(encoded).to_bytes(4, "big"))
+            hasher.update(encoded)
+            hasher.update(children[name].digest)
+        return cls(hasher.digest(), dict(children))
+
+    @classmethod
+    def of(cls, value: Any, depth: int = 0) -> "Fingerprint":
+        """Fingerprint a value, giving ``depth`` levels of mappings their own nodes."""
+        if depth > 0 and isinstance(value, Mapping):
+            return cls.tree({str(key): cls.of(child, depth - 1) for key, child in value.items()})
+        return cls.leaf(value)
+
+    @property
+    def hexdigest(self) -> str:
+        """The digest as a hex string."""
+        return self.digest.hex()
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Fingerprint) and self.digest == other.digest
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __repr__(self) -> str:
+        return f"<Fingerprint {self.hexdigest[:12]}>"
+
+    def get(self, *names: str) -> "Fingerprint | None":
+        """Get the node at a path of member names, or None if there is none.
+
+        Example:
+            ``fingerprint.get("paths", "/users", "get")``
+        """
+        node: Fingerprint | None = self
+        for name in names:
+            if node is None or node.children is None:
+                return None
+            node = node.children.get(name)
+        return node
+
+    def diff(self, other: "Fingerprint") -> list[tuple[str, tuple[str, ...]]]:
+        """List what changed from this fingerprint to ``other``.
+
+        Returns:
+            ``(change, names)`` pairs, where change is ``"added"``,
+            ``"removed"`` or ``"changed"`` and names is the member path of the
+            deepest node that differs (e.g. ``("paths", "/users", "get")``)
+        """
+        return list(self._diff(other, ()))
+
+    def _diff(self, other: "Fingerprint", prefix: tuple[str, ...]) -> Iterator[tuple[str, tuple[str, ...]]]:
+        if self.digest == other.digest:
+            return
+        if self.children is None or other.children is None:
+            yield "changed", prefix
+            return
+        for name in sorted(self.children.keys() | other.children.keys()):
+            old = self.children.get(name)
+            new = other.children.get(name)
+            if old is None:
+                yield "added", prefix + (name,)
+            elif new is None:
+                yield "removed", prefix + (name,)
+            else:
+                yield from old._diff(new, prefix + (name,))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        data: dict[str, Any] = {"digest": self.hexdigest}
+        if self.children is not None:
+            data["children"] = {name: child.to_dict() for name, child in self.children.items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Fingerprint":
+        """Rebuild a fingerprint serialized with :meth:`to_dict`."""
+        children = data.get("children")
+        return cls(
+            bytes.fromhex(data["digest"]),
+            None if children is None else {name: cls.from_dict(child) for name, child in children.items()},
+        )
+
+
+def fingerprint_path_item(path_item: Any) -> Fingerprint:
+    """Fingerprint a path item, with a node per operation and shared member."""
+    return Fingerprint.of(path_item, _TREE_DEPTHS["paths"] - 1)
+
+
+def fingerprint_spec(spec: Mapping[str, Any], paths: Mapping[str, Fingerprint]) -> Fingerprint:
+    """Build the Merkle tree of a spec.
+
+    Args:
+        spec: The spec's top-level members; ``paths`` is ignored in favour of
+            the ``paths`` argument
+        paths: Fingerprints of the path items to cover (see
+            :func:`fingerprint_path_item`), so they can be taken as path
+            items are read and need not be kept
+    """
+    members = {
+        key: Fingerprint.of(value, _TREE_DEPTHS.get(key, 0))
+        for key, value in spec.items()
+        if key != "paths"
+    }
+    members["paths"] = Fingerprint.tree(paths)
+    return Fingerprint.tree(members)
@@ -1,5 +1,6 @@
 """Generator module for creating MCP servers from OpenAPI specs."""
 
+import copy
 import re
 import shutil
 from pathlib import Path
@@ -7,8 +8,17 @@ from typing import Any
 
 import jinja2
 
+from mcp_swagger_cli.cache import HTTPCache, SpecCache
+from mcp_swagger_cli.consing import HashConser
 from mcp_swagger_cli.exceptions import GeneratorError, TemplateError
+from mcp_swagger_cli.filters import OperationFilter
+from mcp_swagger_cli.ir import load_spec_source
 from mcp_swagger_cli.parser import OpenAPIParser
+from mcp_swagger_cli.reachability import reachable_schemas
+
+# Shortest literal worth a named constant; a name like ``_SCHEMA_12`` is not
+# much shorter than ``{'type': 'string'}``, so small parts stay inline
+_MIN_SHARED_LITERAL_LENGTH = 64
 
 
 class MCPServerGenerator:
@@ -29,11 +39,20 @@ class MCPServerGenerator:
         tags: list[str] | None = None,
         path_filters: list[str] | None = None,
         max_operations: int | None = None,
+        cache: SpecCache | None = None,
+        http_cache: HTTPCache | None = None,
+        streaming: bool = False,
+        memory_map: bool = False,
+        lazy: bool = False,
+        intern_strings: bool = False,
+        ref_depth: int | None = None,
+        share_schemas: bool = False,
     ) -> None:
         """Initialize the generator.
         
         Args:
-            spec_path: Path or URL to the OpenAPI spec
+            spec_path: Path or URL to the OpenAPI spec, or path to an IR file
+                built from one (``mcp-swagger compile``)
             server_name: Name for the generated server
             transport: Transport type (stdio or sse)
             base_url: Base URL for API requests
@@ -46,6 +65,17 @@ class MCPServerGenerator:
             tags: Filter operations by tags (only include operations with matching tags)
             path_filters: Filter operations by path (only include operations with paths containing the filter)
             max_operations: Maximum number of operations to include (requires tags or path_filters if exceeded)
+            cache: Optional content-addressed cache of parsed specs
+            http_cache: Optional revalidation cache for URL-sourced specs
+            streaming: Stream local JSON specs instead of loading the whole tree
+            memory_map: Memory-map local spec files instead of reading them
+            lazy: Decode JSON spec members and path items only when accessed
+            intern_strings: Share one copy of each distinct string across the parsed spec
+            ref_depth: Most nested refs expanded in request bodies and schema
+                resources (None for all)
+            share_schemas: Share one instance per structurally identical
+                schema across the operation records, and write structurally
+                identical schema parts once into the generated server
         """
         self.spec_path = spec_path
         self.server_name = self._sanitize_name(server_name)
@@ -59,10 +89,25 @@ class MCPServerGenerator:
         self.tags = tags or []
         self.path_filters = path_filters or []
         self.max_operations = max_operations
-        
-        # Parse the spec
-        self.parser = OpenAPIParser(spec_path=spec_path, validate=validate)
-        self.spec = self.parser.spec
+        self.share_schemas = share_schemas
+        self.operation_filter = OperationFilter(self.tags, self.path_filters)
+        
+        # Parse the spec (or load its precompiled IR). The filter is pushed
+        # into the parser so operations that cannot be selected are never built
+        self.parser = load_spec_source(
+            spec_path,
+            validate=validate,
+            cache=cache,
+            http_cache=http_cache,
+            streaming=streaming,
+            memory_map=memory_map,
+            lazy=lazy,
+            intern_strings=intern_strings,
+            ref_depth=ref_depth,
+            share_schemas=share_schemas,
+            operation_filter=self.operation_filter,
+        )
+        self.spec = self.parser.spec if isinstance(self.parser, OpenAPIParser) else {}
         self.spec_info = self.parser.get_spec_info()
         
         # Set default base_url from spec if not provided
@@ -111,6 +156,81 @@ class MCPServerGenerator:
         else:
             return repr(value)
 
+    @staticmethod
+    def _to_shared_python_values(
+        value: Any, prefix: str, cons: bool = False
+    ) -> tuple[list[tuple[str, str]], str]:
+        """Convert a value to a Python literal, defining repeated parts once.
+        
+        Every dict or list that occurs more than once in the value and whose
+        literal is at least ``_MIN_SHARED_LITERAL_LENGTH`` characters long is
+        rendered as a named constant and referred to by name. Occurrences
+        are counted by identity, which already covers dereferenced refs;
+        with ``cons``, structurally identical parts are shared first (see
+        :mod:`mcp_swagger_cli.consing`), on a copy so the value is left as is.
+        
+        Args:
+            value: The value to render
+            prefix: Prefix of the constant names
+            cons: Whether to share structurally identical parts
+        
+        Returns:
+            ``(constants, literal)``: ``(name, literal)`` pairs in definition
+            order (parts before the constants using them), and the literal
+            of the value itself
+        """
+        if not isinstance(value, (dict, list)):
+            return [], MCPServerGenerator._to_python_value(value)
+        if cons:
+            value = HashConser()(copy.deepcopy(value))
+        counts: dict[int, int] = {}
+        pending = [value]
+        while pending:
+            node = pending.pop()
+            seen = counts.get(id(node), 0)
+            counts[id(node)] = seen + 1
+            if not seen:
+                children = node.values() if isinstance(node, dict) else node
+                pending.extend(child for child in children if isinstance(child, (dict, list)))
+        
+        # Literals (or constant names) by node id, built children first
+        # without recursion, so long ref chains do not exhaust the stack
+        constants: list[tuple[str, str]] = []
+        literals: dict[int, str] = {}
+        expanding: set[int] = set()
+        stack: list[tuple[Any, bool]] = [(value, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in literals:
+                continue
+            children = list(node.values() if isinstance(node, dict) else node)
+            if not expanded:
+                expanding.add(id(node))
+                stack.append((node, True))
+                for child in reversed(children):
+                    if isinstance(child, (dict, list)) and id(child) not in literals:
+                        if id(child) in expanding:
+                            raise GeneratorError("Cannot render schemas that contain themselves")
+                        stack.append((child, False))
+                continue
+            expanding.discard(id(node))
+            rendered = [
+                literals[id(child)] if isinstance(child, (dict, list))
+                else MCPServerGenerator._to_python_value(child)
+                for child in children
+            ]
+            if isinstance(node, dict):
+                literal = "{" + ", ".join(f"{repr(k)}: {v}" for k, v in zip(node, rendered)) + "}"
+            else:
+                literal = "[" + ", ".join(rendered) + "]"
+            if counts[id(node)] >= 2 and len(literal) >= _MIN_SHARED_LITERAL_LENGTH:
+                name = f"{prefix}{len(constants)}"
+                constants.append((name, literal))
+                literal = name
+            literals[id(node)] = literal
+        
+        return constants, literals[id(value)]
+    
     @staticmethod
     def _sanitize_name(name: str) -> str:
         """Sanitize a name to be a valid Python identifier."""
@@ -267,6 +387,15 @@ class MCPServerGenerator:
         # Filter operations based on tags and path_filters
         filtered_operations = self._filter_operations(operations)
         
+        # A filtered server only carries the schemas its operations reach
+        if self.tags or self.path_filters:
+            schemas = self._reachable_schemas(filtered_operations, schemas)
+        
+        # Schema parts repeated across schemas are defined once
+        schema_constants, schemas_literal = self._to_shared_python_values(
+            schemas, "_SCHEMA_", cons=self.share_schemas
+        )
+        
         # Prepare context
         context = {
             "server_name": self.server_name,
@@ -277,6 +406,8 @@ class MCPServerGenerator:
             "transport": self.transport,
             "operations": filtered_operations,
             "schemas": schemas,
+            "schema_constants": schema_constants,
+            "schemas_literal": schemas_literal,
             "schema_names": list(schemas.keys()),
             "path_count": self.spec_info.get("path_count", 0),
             "operation_count": len(filtered_operations),
@@ -319,49 +450,14 @@ class MCPServerGenerator:
                 )
             return operations
         
-        # Apply filtering
-        filtered = []
-        for op in operations:
-            op_tags = op.get("tags", [])
-            op_path = op.get("path", "")
-            
-            # Check tag filter: keep if any op.tags intersects with self.tags
-            tag_match = False
-            if self.tags:
-                # If tags specified, operation must have at least one matching tag
-                if op_tags and any(tag in op_tags for tag in self.tags):
-                    tag_match = True
-            
-            # Check path filter: keep if operation path matches filter as a path segment
-            path_match = False
-            if self.path_filters:
-                # If path_filters specified, operation path must match filter as a proper path prefix
-                # This means: exact match OR filter is a parent path (followed by /)
-                # E.g., filter "/users" matches "/users" and "/users/{id}" but NOT "/usersabc"
-                for pf in self.path_filters:
-                    # Normalize filter to ensure it starts with /
-                    if not pf.startswith('/'):
-                        pf = '/' + pf
-                    # Match if path equals filter OR path starts with filter + "/"
-                    if op_path == pf or op_path.startswith(pf + '/'):
-                        path_match = True
-                        break
-            
-            # Include operation if either filter matches (OR logic)
-            # If only one filter type is specified, that filter must match
-            # If both are specified, operation matches if either matches
-            if self.tags and self.path_filters:
-                # Both filters present: OR logic
-                if tag_match or path_match:
-                    filtered.append(op)
-            elif self.tags:
-                # Only tags filter: must match tags
-                if tag_match:
-                    filtered.append(op)
-            elif self.path_filters:
-                # Only path filter: must match path
-                if path_match:
-                    filtered.append(op)
+        # Apply filtering (tags OR path prefixes; see OperationFilter). The
+        # parser already applied the same filter while loading, except for
+        # operations read from a compiled IR
+        filtered = [
+            op
+            for op in operations
+            if self.operation_filter.matches(op.get("path", ""), op.get("tags", []))
+        ]
         
         # Check if filtered operations exceed max_operations
         if self.max_operations is not None and len(filtered) > self.max_operations:
@@ -373,6 +469,22 @@ class MCPServerGenerator:
         
         return filtered
     
+    def _reachable_schemas(
+        self, operations: list[dict[str, Any]], schemas: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Keep the schemas the operations refer to, directly or through other schemas.
+        
+        Args:
+            operations: The operations of the generated server
+            schemas: All schemas, from the parser
+            
+        Returns:
+            The reachable schemas, in their original order
+        """
+        roots = (name for operation in operations for name in operation["schema_refs"])
+        reached = reachable_schemas(roots, self.parser.get_schema_dependencies())
+        return {name: schema for name, schema in schemas.items() if name in reached}
+    
     def _generate_pyproject_toml(self, output_dir: Path) -> None:
         """Generate the pyproject.toml file."""
         # Sanitize description for TOML (strip newlines, escape quotes, truncate)
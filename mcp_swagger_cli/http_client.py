@@ -0,0 +1,113 @@
+"""Shared HTTP client for spec and external-document fetches.
+
+Every URL fetch in the process (specs, referenced documents, batch loads)
+goes through one pooled ``httpx.Client``, so repeated fetches from the same
+host reuse kept-alive connections instead of paying a TCP/TLS handshake per
+document. The pool is created on first use; :func:`configure_http_client`
+changes its limits, timeout or HTTP/2 support.
+
+HTTP/2 needs the optional ``h2`` package (``pip install 'httpx[http2]'``).
+"""
+
+import atexit
+import threading
+from typing import Any
+
+import httpx
+
+from mcp_swagger_cli.exceptions import MCPSwaggerError
+
+try:
+    import h2
+except ImportError:  # pragma: no cover - optional dependency
+    h2 = None
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+# Keyword arguments for new clients, sync and async
+_client_options: dict[str, Any] = {}
+_http_client: httpx.Client | None = None
+_lock = threading.Lock()
+
+
+def _build_client_options(
+    timeout: float = DEFAULT_TIMEOUT,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+) -> dict[str, Any]:
+    """Build ``httpx`` client keyword arguments from the pool settings."""
+    if http2 and h2 is None:
+        raise MCPSwaggerError(
+            "HTTP/2 needs the optional 'h2' package; install it with: pip install 'httpx[http2]'"
+        )
+    return {
+        "timeout": timeout,
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        "http2": http2,
+    }
+
+
+def configure_http_client(
+    timeout: float = DEFAULT_TIMEOUT,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+) -> None:
+    """Configure the shared client. The current pool, if any, is closed.
+
+    Args:
+        timeout: Timeout in seconds for each request
+        max_connections: Maximum number of open connections
+        max_keepalive_connections: Maximum number of idle connections kept alive
+        keepalive_expiry: Seconds an idle connection is kept alive
+        http2: Whether to negotiate HTTP/2 with servers that support it
+
+    Raises:
+        MCPSwaggerError: If HTTP/2 is requested without the ``h2`` package
+    """
+    global _client_options, _http_client
+    options = _build_client_options(
+        timeout, max_connections, max_keepalive_connections, keepalive_expiry, http2
+    )
+    with _lock:
+        _client_options = options
+        client, _http_client = _http_client, None
+    if client is not None:
+        client.close()
+
+
+def client_options() -> dict[str, Any]:
+    """Get the keyword arguments for creating a client, e.g. an async one."""
+    with _lock:
+        return dict(_client_options or _build_client_options())
+
+
+def get_http_client() -> httpx.Client:
+    """Get or create the shared HTTP client."""
+    global _http_client
+    with _lock:
+        if _http_client is None:
+            _http_client = httpx.Client(**(_client_options or _build_client_options()))
+        return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client; the next fetch opens a new pool."""
+    global _http_client
+    with _lock:
+        client, _http_client = _http_client, None
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_http_client)
@@ -0,0 +1,87 @@
+"""Deduplication of the strings of a parsed spec.
+
+A decoded spec holds one string object per occurrence: every ``"type"``,
+``"string"``, ``"application/json"`` and ``"description"`` across thousands
+of schemas and parameters is its own copy (the JSON decoder shares keys
+within one document, YAML does not share anything). :class:`StringInterner`
+walks a decoded tree and replaces equal strings with one shared object, so a
+large spec, and the operation records built from it, hold each distinct
+string once.
+
+Keys and values go through one table owned by the interner, so they are
+shared across every document decoded with it (the root spec, lazily decoded
+members, streamed path items, referenced documents) without being kept
+alive after the parser is gone, as :func:`sys.intern` would keep them.
+Dicts are only rebuilt when one of their keys is a duplicate, which for JSON
+input is rare since the decoder already shares keys within a document.
+
+Interning costs one walk of the tree after decoding, so it is opt-in.
+"""
+
+from typing import Any
+
+
+class StringInterner:
+    """Replace equal strings in decoded trees with one shared object."""
+
+    __slots__ = ("_strings",)
+
+    def __init__(self) -> None:
+        self._strings: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """Number of distinct string values seen so far."""
+        return len(self._strings)
+
+    def string(self, value: str) -> str:
+        """Get the shared copy of a string value."""
+        return self._strings.setdefault(value, value)
+
+    def __call__(self, node: Any) -> Any:
+        """Intern the keys and string values of a decoded tree, in place.
+
+        Dicts and lists keep their identity, so nodes shared within the tree
+        (YAML aliases) stay shared and are walked once.
+
+        Args:
+            node: A decoded JSON/YAML value
+
+        Returns:
+            The node, or the shared copy of it if it is a string; values
+            other than strings, dicts and lists are returned unchanged
+        """
+        if isinstance(node, str):
+            return self.string(node)
+        if isinstance(node, (dict, list)):
+            self._walk(node, set())
+        return node
+
+    def _walk(self, node: Any, seen: set[int]) -> None:
+        if id(node) in seen:
+            return
+        seen.add(id(node))
+        strings = self._strings
+        if isinstance(node, dict):
+            rekey = False
+            for key, value in node.items():
+                if isinstance(key, str) and strings.setdefault(key, key) is not key:
+                    rekey = True
+                if isinstance(value, str):
+                    shared = strings.setdefault(value, value)
+                    if shared is not value:
+                        # Replacing the value of an existing key keeps the
+                        # dict's layout, so this is safe while iterating
+                        node[key] = shared
+                elif isinstance(value, (dict, list)):
+                    self._walk(value, seen)
+            if rekey:
+                items = list(node.items())
+                node.clear()
+                for key, value in items:
+                    node[strings[key] if isinstance(key, str) else key] = value
+        else:
+            for i, value in enumerate(node):
+                if isinstance(value, str):
+                    node[i] = strings.setdefault(value, value)
+                elif isinstance(value, (dict, list)):
+                    self._walk(value, seen)
@@ -0,0 +1,441 @@
+"""Compact, versioned intermediate representation (IR) of a parsed spec.
+
+Building operations means loading the spec, resolving refs and walking every
+path item. The IR stores the result - spec info, schemas and the operation
+model (parameters, request bodies, responses) - so later runs can generate
+servers or print info from it directly, without the raw spec.
+
+On disk an IR file is a short header (magic bytes and format version)
+followed by a ``marshal`` payload of plain tuples, one row per operation,
+which loads back in milliseconds. In memory, rows become ``__slots__``
+records. ``SpecIR`` offers the same ``get_spec_info``, ``get_operations``,
+``get_schemas`` and ``get_schema_dependencies`` methods as
+:class:`~mcp_swagger_cli.parser.OpenAPIParser`.
+"""
+
+import datetime
+import marshal
+import struct
+from pathlib import Path
+from typing import Any
+
+from mcp_swagger_cli.exceptions import SpecNotFoundError, SpecParseError
+from mcp_swagger_cli.parser import OpenAPIParser
+
+# Leading bytes of every IR file
+IR_MAGIC = b"MCPIR\x00"
+
+# Bumped whenever the row layout changes; older files are rejected
+IR_VERSION = 3
+
+# Conventional suffix for IR files
+IR_SUFFIX = ".mcpir"
+
+_HEADER = struct.Struct(f">{len(IR_MAGIC)}sH")
+
+# YAML-native values marshal cannot store, written as ISO 8601 strings
+_ISO_TYPES = (datetime.date, datetime.time)
+
+
+def _marshallable(value: Any, done: dict[int, Any]) -> Any:
+    """Copy a payload with dates and times replaced by ISO strings.
+
+    Containers shared within the payload stay shared in the copy.
+
+    Raises:
+        SpecParseError: If the payload holds another value marshal cannot store
+    """
+    if isinstance(value, (dict, list, tuple)):
+        copied = done.get(id(value))
+        if copied is not None:
+            return copied
+        if isinstance(value, dict):
+            copied = done[id(value)] = {}
+            for key, child in value.items():
+                copied[_marshallable(key, done)] = _marshallable(child, done)
+        elif isinstance(value, list):
+            copied = done[id(value)] = []
+            copied.extend(_marshallable(child, done) for child in value)
+        else:
+            copied = done[id(value)] = tuple(_marshallable(child, done) for child in value)
+        return copied
+    if isinstance(value, _ISO_TYPES):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    raise SpecParseError(f"Cannot store {type(value).__name__} value {value!r} in an IR file")
+
+
+class ParameterIR:
+    """A non-body parameter of an operation."""
+
+    __slots__ = ("name", "location", "required", "type", "description", "default", "enum", "union")
+
+    def __init__(
+        self,
+        name: str,
+        location: str,
+        required: bool,
+        type: Any,
+        description: str,
+        default: Any,
+        enum: Any,
+        union: Any,
+    ) -> None:
+        self.name = name
+        self.location = location
+        self.required = required
+        self.type = type
+        self.description = description
+        self.default = default
+        self.enum = enum
+        self.union = union
+
+    @classmethod
+    def from_dict(cls, param: dict[str, Any]) -> "ParameterIR":
+        return cls(
+            param["name"],
+            param["in"],
+            param["required"],
+            param["type"],
+            param["description"],
+            param["default"],
+            param["enum"],
+            param["union"],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "in": self.location,
+            "required": self.required,
+            "type": self.type,
+            "description": self.description,
+            "default": self.default,
+            "enum": self.enum,
+            "union": self.union,
+        }
+
+
+class RequestBodyIR:
+    """The request body of an operation."""
+
+    __slots__ = ("required", "description", "schema", "union")
+
+    def __init__(self, required: bool, description: str, schema: Any, union: Any) -> None:
+        self.required = required
+        self.description = description
+        self.schema = schema
+        self.union = union
+
+    @classmethod
+    def from_dict(cls, body: dict[str, Any]) -> "RequestBodyIR":
+        return cls(body["required"], body["description"], body["schema"], body["union"])
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "required": self.required,
+            "description": self.description,
+            "schema": self.schema,
+            "union": self.union,
+        }
+
+
+class ResponseIR:
+    """One response of an operation."""
+
+    __slots__ = ("status", "description", "schema")
+
+    def __init__(self, status: str, description: str, schema: Any) -> None:
+        self.status = status
+        self.description = description
+        self.schema = schema
+
+
+class OperationIR:
+    """An operation, as produced by ``OpenAPIParser.get_operations``."""
+
+    __slots__ = (
+        "path",
+        "method",
+        "operation_id",
+        "summary",
+        "description",
+        "tags",
+        "deprecated",
+        "parameters",
+        "request_body",
+        "responses",
+        "security",
+        "consumes",
+        "schema_refs",
+    )
+
+    def __init__(
+        self,
+        path: str,
+        method: str,
+        operation_id: str,
+        summary: str,
+        description: str,
+        tags: list[str],
+        deprecated: bool,
+        parameters: list[ParameterIR],
+        request_body: RequestBodyIR | None,
+        responses: list[ResponseIR],
+        security: Any,
+        consumes: Any,
+        schema_refs: list[str],
+    ) -> None:
+        self.path = path
+        self.method = method
+        self.operation_id = operation_id
+        self.summary = summary
+        self.description = description
+        self.tags = tags
+        self.deprecated = deprecated
+        self.parameters = parameters
+        self.request_body = request_body
+        self.responses = responses
+        self.security = security
+        self.consumes = consumes
+        self.schema_refs = schema_refs
+
+    @classmethod
+    def from_dict(cls, operation: dict[str, Any]) -> "OperationIR":
+        """Build a record from a parser operation dict."""
+        body = operation["request_body"]
+        return cls(
+            operation["path"],
+            operation["method"],
+            operation["operation_id"],
+            operation["summary"],
+            operation["description"],
+            operation["tags"],
+            operation["deprecated"],
+            [ParameterIR.from_dict(param) for param in operation["parameters"]],
+            RequestBodyIR.from_dict(body) if body is not None else None,
+            [
+                ResponseIR(status, response["description"], response["schema"])
+                for status, response in operation["responses"].items()
+            ],
+            operation["security"],
+            operation["consumes"],
+            operation["schema_refs"],
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert back to the parser's operation dict."""
+        return {
+            "path": self.path,
+            "method": self.method,
+            "operation_id": self.operation_id,
+            "summary": self.summary,
+            "description": self.description,
+            "tags": self.tags,
+            "deprecated": self.deprecated,
+            "parameters": [param.to_dict() for param in self.parameters],
+            "request_body": self.request_body.to_dict() if self.request_body else None,
+            "responses": {
+                response.status: {"description": response.description, "schema": response.schema}
+                for response in self.responses
+            },
+            "security": self.security,
+            "consumes": self.consumes,
+            "schema_refs": self.schema_refs,
+        }
+
+    def to_row(self) -> tuple:
+        """Flatten into a tuple of plain values for serialization."""
+        body = self.request_body
+        return (
+            self.path,
+            self.method,
+            self.operation_id,
+            self.summary,
+            self.description,
+            self.tags,
+            self.deprecated,
+            tuple(
+                (p.name, p.location, p.required, p.type, p.description, p.default, p.enum, p.union)
+                for p in self.parameters
+            ),
+            (body.required, body.description, body.schema, body.union) if body else None,
+            tuple((r.status, r.description, r.schema) for r in self.responses),
+            self.security,
+            self.consumes,
+            self.schema_refs,
+        )
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "OperationIR":
+        """Rebuild a record from :meth:`to_row` output."""
+        (path, method, operation_id, summary, description, tags, deprecated,
+         parameters, body, responses, security, consumes, schema_refs) = row
+        return cls(
+            path,
+            method,
+            operation_id,
+            summary,
+            description,
+            tags,
+            deprecated,
+            [ParameterIR(*param) for param in parameters],
+            RequestBodyIR(*body) if body is not None else None,
+            [ResponseIR(*response) for response in responses],
+            security,
+            consumes,
+            schema_refs,
+        )
+
+
+class SpecIR:
+    """The operation model of a spec, detached from the raw document."""
+
+    __slots__ = ("source", "spec_info", "schemas", "schema_dependencies", "operations")
+
+    def __init__(
+        self,
+        source: str,
+        spec_info: dict[str, Any],
+        schemas: dict[str, Any],
+        schema_dependencies: dict[str, list[str]],
+        operations: list[OperationIR],
+    ) -> None:
+        """Initialize the IR.
+
+        Args:
+            source: Path or URL of the spec the IR was built from
+            spec_info: Output of ``get_spec_info``
+            schemas: Output of ``get_schemas``
+            schema_dependencies: Output of ``get_schema_dependencies``
+            operations: Operation records
+        """
+        self.source = source
+        self.spec_info = spec_info
+        self.schemas = schemas
+        self.schema_dependencies = schema_dependencies
+        self.operations = operations
+
+    @classmethod
+    def from_parser(cls, parser: OpenAPIParser) -> "SpecIR":
+        """Build the IR from a loaded parser."""
+        return cls(
+            parser.spec_path,
+            parser.get_spec_info(),
+            dict(parser.get_schemas()),
+            parser.get_schema_dependencies(),
+            [OperationIR.from_dict(operation) for operation in parser.get_operations()],
+        )
+
+    def get_spec_info(self) -> dict[str, Any]:
+        """Get the spec information recorded when the IR was built."""
+        return self.spec_info
+
+    def get_operations(self) -> list[dict[str, Any]]:
+        """Get all operations, in the parser's dict form."""
+        return [operation.to_dict() for operation in self.operations]
+
+    def get_schemas(self) -> dict[str, dict[str, Any]]:
+        """Get all schemas recorded when the IR was built."""
+        return self.schemas
+
+    def get_schema_dependencies(self) -> dict[str, list[str]]:
+        """Get the names of the schemas each named schema refers to directly."""
+        return self.schema_dependencies
+
+    def dumps(self) -> bytes:
+        """Serialize to the binary IR format.
+
+        Dates and times (unquoted in YAML specs) are stored as ISO 8601
+        strings, as they would read from a JSON spec.
+
+        Raises:
+            SpecParseError: If the IR holds a value that cannot be stored
+        """
+        payload = (
+            self.source,
+            self.spec_info,
+            self.schemas,
+            self.schema_dependencies,
+            tuple(operation.to_row() for operation in self.operations),
+        )
+        try:
+            data = marshal.dumps(payload)
+        except ValueError:
+            # Only specs with YAML-native values pay for the extra copy
+            data = marshal.dumps(_marshallable(payload, {}))
+        return _HEADER.pack(IR_MAGIC, IR_VERSION) + data
+
+    @classmethod
+    def loads(cls, data: bytes) -> "SpecIR":
+        """Deserialize from the binary IR format.
+
+        Raises:
+            SpecParseError: If the data is not an IR of the supported version
+        """
+        if not is_ir(data):
+            raise SpecParseError("Not an IR file (bad magic bytes)")
+        _, version = _HEADER.unpack_from(data)
+        if version != IR_VERSION:
+            raise SpecParseError(
+                f"Unsupported IR version {version} (expected {IR_VERSION}); rebuild it from the spec"
+            )
+        try:
+            source, spec_info, schemas, schema_dependencies, rows = marshal.loads(memoryview(data)[_HEADER.size:])
+            operations = [OperationIR.from_row(row) for row in rows]
+        except (EOFError, ValueError, TypeError) as e:
+            raise SpecParseError(f"Corrupt IR file: {e}")
+        return cls(source, spec_info, schemas, schema_dependencies, operations)
+
+    def dump(self, path: str | Path) -> None:
+        """Write the IR to a file."""
+        Path(path).write_bytes(self.dumps())
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SpecIR":
+        """Read an IR file.
+
+        Raises:
+            SpecNotFoundError: If the file does not exist
+            SpecParseError: If the file is not a valid IR
+        """
+        try:
+            data = Path(path).read_bytes()
+        except FileNotFoundError:
+            raise SpecNotFoundError(f"IR file not found: {path}")
+        except OSError as e:
+            raise SpecParseError(f"Failed to read IR file: {e}")
+        return cls.loads(data)
+
+
+def is_ir(head: bytes) -> bool:
+    """Check whether data starts with the IR magic bytes."""
+    return head.startswith(IR_MAGIC)
+
+
+def is_ir_file(path: str) -> bool:
+    """Check whether a local path is an IR file (by its magic bytes)."""
+    try:
+        with open(path, "rb") as f:
+            return is_ir(f.read(len(IR_MAGIC)))
+    except OSError:
+        return False
+
+
+def load_spec_source(spec_path: str, **parser_kwargs: Any) -> "SpecIR | OpenAPIParser":
+    """Load a spec, or an IR file built from one.
+
+    Args:
+        spec_path: URL or file path to a spec or an IR file
+        **parser_kwargs: :class:`~mcp_swagger_cli.parser.OpenAPIParser`
+            arguments, ignored for IR files
+
+    Returns:
+        A :class:`SpecIR` or an ``OpenAPIParser``; both provide
+        ``get_spec_info``, ``get_operations``, ``get_schemas`` and
+        ``get_schema_dependencies``
+    """
+    if Path(spec_path).is_file() and is_ir_file(spec_path):
+        return SpecIR.load(spec_path)
+    return OpenAPIParser(spec_path=spec_path, **parser_kwargs)
@@ -0,0 +1,148 @@
+"""Lazy, offset-indexed view of a JSON spec.
+
+An eager decode builds the whole spec tree even when a command only looks at
+``info`` or a handful of paths. :class:`LazyObject` keeps the spec text and
+an index of where each top-level member, and each path item under ``paths``,
+starts and ends; a member is decoded the first time it is accessed and kept
+from then on. The view is a read-only ``Mapping``, so code written against
+the parsed dict keeps working.
+
+Building the index still has to scan every value once, so a cold load costs
+about as much time as an eager decode but holds only the text and the index
+in memory. The index is small and can be cached per spec digest, which makes
+warm loads skip the scan entirely.
+"""
+
+import json
+import re
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any, Union
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# Members whose values are indexed one level deeper (path by path)
+_NESTED_MEMBERS = ("paths",)
+
+# Offsets of a member value: (start, end), or a nested index
+SpecIndex = dict[str, Union[tuple[int, int], "SpecIndex"]]
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _index_object(text: str, pos: int, nested: tuple[str, ...]) -> tuple[SpecIndex, int]:
+    """Index the members of the object starting at ``pos``.
+
+    Returns:
+        The member index and the position just past the closing brace
+    """
+    if not text.startswith("{", pos):
+        raise json.JSONDecodeError("Expecting '{'", text, pos)
+    pos = _skip_whitespace(text, pos + 1)
+    index: SpecIndex = {}
+    if text.startswith("}", pos):
+        return index, pos + 1
+
+    while True:
+        key, pos = _DECODER.raw_decode(text, pos)
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, pos)
+        pos = _skip_whitespace(text, pos)
+        if not text.startswith(":", pos):
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+        pos = _skip_whitespace(text, pos + 1)
+
+        if key in nested and text.startswith("{", pos):
+            index[key], pos = _index_object(text, pos, ())
+        else:
+            start = pos
+            # Decoded only to find the end; the value is dropped right away
+            _, pos = _DECODER.raw_decode(text, pos)
+            index[key] = (start, pos)
+
+        pos = _skip_whitespace(text, pos)
+        delimiter = text[pos:pos + 1]
+        pos += 1
+        if delimiter == "}":
+            return index, pos
+        if delimiter != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, pos - 1)
+        pos = _skip_whitespace(text, pos)
+
+
+def index_spec(text: str) -> SpecIndex:
+    """Index the offsets of a JSON spec's top-level members and path items.
+
+    Raises:
+        json.JSONDecodeError: If the text is not a single JSON object
+    """
+    index, end = _index_object(text, _skip_whitespace(text, 0), _NESTED_MEMBERS)
+    end = _skip_whitespace(text, end)
+    if end != len(text):
+        raise json.JSONDecodeError("Extra data", text, end)
+    return index
+
+
+class LazyObject(Mapping[str, Any]):
+    """Read-only mapping over a JSON object that decodes members on access."""
+
+    __slots__ = ("_text", "_index", "_values", "_hook")
+
+    def __init__(
+        self,
+        text: str,
+        index: SpecIndex,
+        hook: Callable[[Any], Any] | None = None,
+    ) -> None:
+        """Initialize the view.
+
+        Args:
+            text: The full JSON text the offsets refer to
+            index: Member offsets, as built by :func:`index_spec`
+            hook: Optional callable applied to each member as it is decoded
+                (and passed on to nested views), e.g. a string interner
+        """
+        self._text = text
+        self._index = index
+        self._values: dict[str, Any] = {}
+        self._hook = hook
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        entry = self._index[key]
+        if isinstance(entry, dict):
+            value = LazyObject(self._text, entry, self._hook)
+        else:
+            value = _DECODER.raw_decode(self._text, entry[0])[0]
+            if self._hook is not None:
+                value = self._hook(value)
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __repr__(self) -> str:
+        return f"<LazyObject {len(self._index)} members, {len(self._values)} decoded>"
+
+    def is_decoded(self, key: str) -> bool:
+        """Check whether a member has been decoded yet."""
+        return key in self._values
+
+    def materialize(self) -> dict[str, Any]:
+        """Decode every member into a plain dict."""
+        return {
+            key: value.materialize() if isinstance(value, LazyObject) else value
+            for key, value in self.items()
+        }
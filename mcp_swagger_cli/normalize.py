@@ -0,0 +1,253 @@
+"""Dialect-independent model of Swagger 2.0 and OpenAPI 3.x specs.
+
+Swagger 2.0 and OpenAPI 3.x keep the same information in different places:
+``definitions`` vs ``components/schemas``, ``host``/``basePath`` vs
+``servers``, ``in: body`` parameters vs ``requestBody``, response schemas
+directly on the response vs under ``content``. :func:`normalize_spec` reads
+the top-level tables once into a :class:`SpecModel`, and
+:func:`normalize_operation` brings each operation into a single shape as it
+is built, so the parser walks one layout instead of branching on the dialect
+(and re-walking ``.get`` chains into the top-level tables) per operation.
+
+Path items are normalized one at a time, when their operations are built,
+so lazy, streaming and filtered loading keep skipping what they skip.
+"""
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from mcp_swagger_cli.refs import PointerIndex
+
+# Methods that carry operations, in the order operations are reported
+OPERATION_METHODS = ("get", "post", "put", "delete", "patch", "options", "head")
+
+# Request body media types whose fields become form parameters
+FORM_CONTENT_TYPES = ("multipart/form-data", "application/x-www-form-urlencoded")
+
+# Longest chain of local ref-to-ref aliases followed
+_MAX_LOCAL_HOPS = 32
+
+
+def _table(node: Any, key: str) -> Mapping[str, Any]:
+    """Get a member of a mapping if it is itself a mapping, else an empty one."""
+    value = node.get(key) if isinstance(node, Mapping) else None
+    return value if isinstance(value, Mapping) else {}
+
+
+def _server_objects(spec: Mapping[str, Any]) -> list[Any]:
+    """Get the servers of a spec, deriving one from Swagger 2.0 host/basePath."""
+    servers = spec.get("servers", [])
+    if servers:
+        return list(servers)
+    host = spec.get("host", "")
+    if not host:
+        return []
+    schemes = spec.get("schemes", ["https"])
+    scheme = schemes[0] if schemes else "https"
+    return [{"url": f"{scheme}://{host}{spec.get('basePath', '/')}"}]
+
+
+class SpecModel:
+    """The top-level tables of a spec, in one shape for both dialects.
+
+    Attributes:
+        version: The ``openapi`` or ``swagger`` version string
+        info: The ``info`` object
+        servers: Server objects (``{"url": ...}``); for Swagger 2.0, derived
+            from ``schemes``, ``host`` and ``basePath``
+        schemas: Named schemas (``components/schemas`` or ``definitions``)
+        security_schemes: ``components/securitySchemes`` or ``securityDefinitions``
+        consumes: Global request media types (Swagger 2.0 ``consumes``)
+        pointers: JSON-pointer index of the spec, for local refs
+    """
+
+    __slots__ = (
+        "version",
+        "info",
+        "servers",
+        "schemas",
+        "security_schemes",
+        "consumes",
+        "pointers",
+    )
+
+    def __init__(self, spec: Mapping[str, Any]) -> None:
+        components = _table(spec, "components")
+        definitions = _table(spec, "definitions")
+
+        self.version = spec.get("openapi") or spec.get("swagger", "")
+        self.info = spec.get("info", {})
+        self.servers = _server_objects(spec)
+        self.schemas = _table(components, "schemas") if components else definitions
+        self.security_schemes = (
+            _table(components, "securitySchemes") or _table(spec, "securityDefinitions")
+        )
+        self.consumes = spec.get("consumes", [])
+        self.pointers = PointerIndex(spec)
+
+    @property
+    def server_urls(self) -> list[str]:
+        """Get the server URLs."""
+        return [
+            server.get("url", "") if isinstance(server, Mapping) else str(server)
+            for server in self.servers
+        ]
+
+    def resolve_local(self, ref: str, default: Any) -> Any:
+        """Look up a local ref: any JSON pointer into the spec.
+
+        Covers ``#/components/...`` and ``#/definitions/...`` as well as
+        pointers such as ``#/paths/~1users/get/responses/200``.
+
+        Returns:
+            The target, or ``default`` if the ref is not local or does not resolve
+        """
+        if not ref.startswith("#"):
+            return default
+        try:
+            return self.pointers.resolve(ref[1:])
+        except KeyError:
+            return default
+
+    def follow(self, node: Any) -> Any:
+        """Follow a node's local ``$ref`` (and ref-to-ref aliases) to its target.
+
+        Returns:
+            The target, or the node itself if it is not a resolvable local ref
+        """
+        for _ in range(_MAX_LOCAL_HOPS):
+            ref = node.get("$ref") if isinstance(node, Mapping) else None
+            if not isinstance(ref, str):
+                break
+            target = self.resolve_local(ref, None)
+            if not isinstance(target, Mapping):
+                break
+            node = target
+        return node
+
+
+def normalize_spec(spec: Mapping[str, Any]) -> SpecModel:
+    """Read the top-level tables of a Swagger 2.0 or OpenAPI 3.x spec."""
+    return SpecModel(spec)
+
+
+class BodyModel:
+    """A request body: a 3.x ``requestBody`` or a 2.0 ``in: body`` parameter.
+
+    Attributes:
+        required: Whether the body is required
+        description: Body description
+        schema: Body schema, unresolved
+        form: Whether the schema describes form fields (3.x form media types)
+    """
+
+    __slots__ = ("required", "description", "schema", "form")
+
+    def __init__(self, required: bool, description: str, schema: Any, form: bool = False) -> None:
+        self.required = required
+        self.description = description
+        self.schema = schema
+        self.form = form
+
+
+class OperationModel:
+    """An operation in a single shape for both dialects.
+
+    Attributes:
+        operation: The raw operation object
+        parameters: Path-level then operation-level parameters, excluding a
+            2.0 body parameter, unresolved
+        body: The request body, or None
+        consumes: Effective request media types
+        responses: ``(status, description, schema)`` per response
+    """
+
+    __slots__ = ("operation", "parameters", "body", "consumes", "responses")
+
+    def __init__(
+        self,
+        operation: Mapping[str, Any],
+        parameters: list[Any],
+        body: BodyModel | None,
+        consumes: Any,
+        responses: list[tuple[str, str, Any]],
+    ) -> None:
+        self.operation = operation
+        self.parameters = parameters
+        self.body = body
+        self.consumes = consumes
+        self.responses = responses
+
+
+def _request_body(request_body: Mapping[str, Any], resolve: Callable[[Any], Any]) -> BodyModel | None:
+    """Normalize a resolved 3.x ``requestBody``, preferring JSON over form media types."""
+    required = request_body.get("required", False)
+    description = request_body.get("description", "")
+    content = request_body.get("content", {})
+    if "application/json" in content:
+        return BodyModel(required, description, resolve(content["application/json"]).get("schema", {}))
+    for media_type in FORM_CONTENT_TYPES:
+        if media_type in content:
+            return BodyModel(required, description, resolve(content[media_type]).get("schema", {}), form=True)
+    return None
+
+
+def normalize_operation(
+    model: SpecModel,
+    path_item: Mapping[str, Any],
+    operation: Mapping[str, Any],
+    resolve: Callable[[Any], Any] | None = None,
+) -> OperationModel:
+    """Bring one operation of a path item into the dialect-independent shape.
+
+    Request bodies, responses and their media type objects may be refs
+    (``#/components/requestBodies/...``, ``#/components/responses/...``,
+    2.0 ``#/parameters/...`` body parameters); they are resolved before
+    being read.
+
+    Args:
+        model: Top-level tables of the spec
+        path_item: The path item holding the operation
+        operation: The raw operation object
+        resolve: Resolves a node's ``$ref``, returning the node itself when
+            it has none or it does not resolve; defaults to local refs only
+            (:meth:`SpecModel.follow`)
+    """
+    if resolve is None:
+        resolve = model.follow
+    parameters = []
+    body = None
+    for param in path_item.get("parameters", []) + operation.get("parameters", []):
+        resolved = resolve(param)
+        if resolved.get("in") == "body":
+            if body is None:
+                body = BodyModel(
+                    resolved.get("required", False),
+                    resolved.get("description", ""),
+                    resolved.get("schema", {}),
+                )
+        else:
+            parameters.append(param)
+
+    # Operation-level consumes overrides the global one (2.0); for 3.x the
+    # media types come from the request body
+    consumes = operation.get("consumes", model.consumes)
+    request_body = operation.get("requestBody")
+    if request_body is not None:
+        request_body = resolve(request_body)
+        media_types = list(request_body.get("content", {}).keys())
+        if media_types and not consumes:
+            consumes = media_types
+        if body is None:
+            body = _request_body(request_body, resolve)
+
+    responses = []
+    for status, response in operation.get("responses", {}).items():
+        response = resolve(response)
+        if "content" in response:
+            schema = resolve(response["content"].get("application/json", {})).get("schema")
+        else:
+            schema = response.get("schema")
+        responses.append((status, response.get("description", ""), schema))
+
+    return OperationModel(operation, parameters, body, consumes, responses)
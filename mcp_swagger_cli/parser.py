@@ -1,8 +1,17 @@
 """Parser module for Swagger/OpenAPI specifications."""
 
+import asyncio
+import copy
+import io
 import json
+import mmap
+import re
+import stat
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 from urllib.parse import urlparse
 
 import httpx
@@ -10,65 +19,342 @@ import yaml
 from prance import BaseParser, ResolvingParser
 from prance.util.resolver import RESOLVE_HTTP, RESOLVE_FILES
 
+from mcp_swagger_cli.cache import HTTPCache, SpecCache, spec_digest
+from mcp_swagger_cli.composition import AllOfMerger
+from mcp_swagger_cli.consing import HashConser
+from mcp_swagger_cli.compression import (
+    DECOMPRESSION_ERRORS,
+    MAGIC_LENGTH,
+    detect_compression,
+    open_decompressed,
+)
+from mcp_swagger_cli.dereference import Dereferencer
+from mcp_swagger_cli.download import download
 from mcp_swagger_cli.exceptions import (
     SpecNotFoundError,
     SpecParseError,
     SpecValidationError,
 )
+from mcp_swagger_cli.filters import OperationFilter
+from mcp_swagger_cli.fingerprint import Fingerprint, fingerprint_path_item, fingerprint_spec
+from mcp_swagger_cli.http_client import client_options, get_http_client
+from mcp_swagger_cli.interning import StringInterner
+from mcp_swagger_cli.lazy import LazyObject, index_spec
+from mcp_swagger_cli.normalize import OPERATION_METHODS, SpecModel, normalize_operation, normalize_spec
+from mcp_swagger_cli.reachability import SchemaGraph
+from mcp_swagger_cli.refs import ExternalRefResolver, absolute_ref, find_external_refs, is_url
+from mcp_swagger_cli.streaming import stream_spec, stream_spec_once
+from mcp_swagger_cli.unions import UnionIndex, union_type
+
+# Longest chain of ref-to-ref aliases followed across external documents
+_MAX_REF_HOPS = 32
+
+# Leading bytes peeked from a stream to sniff the spec format
+SNIFF_LENGTH = 4096
+
+# Start of a JSON document after an optional UTF-8 BOM and JSON whitespace: a
+# ``[``, or a ``{`` followed by a quoted key or its closing brace (YAML flow
+# mappings usually start with a bare key). The whitespace after ``{`` is
+# bounded so sniffing never scans far into the document.
+_JSON_START = re.compile(rb'(?:\xef\xbb\xbf)?[ \t\r\n]*(?:\[|\{[ \t\r\n]{0,64}(?:["}]|\Z))')
+
+# Prefer the libyaml-backed loader, which is an order of magnitude faster on
+# large specs. PyYAML only exposes it when built against libyaml.
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YAMLLoader
+
+
+def _load_yaml(stream: Any) -> Any:
+    """Load YAML with the fastest available safe loader."""
+    return yaml.load(stream, Loader=_YAMLLoader)
+
+
+def _load_json(data: bytes | str) -> Any:
+    """Decode a spec sniffed as JSON, falling back to YAML.
+    
+    YAML flow style (``{openapi: 3.0.0, ...}``) can look like JSON from its
+    leading bytes. If the JSON decoder rejects the text, the YAML loader is
+    tried; when it fails too, the JSON error is raised.
+    """
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError as e:
+        try:
+            return _load_yaml(data)
+        except yaml.YAMLError:
+            raise e from None
+
+
+def _require_spec_object(spec: Any, source: str) -> Any:
+    """Check that a decoded root document is an OpenAPI or Swagger object.
+    
+    YAML reads almost any text as something (``{ invalid json }`` is a
+    one-key mapping), so a root spec that fell through to the YAML loader
+    is only accepted if it names its version.
+    """
+    if not isinstance(spec, Mapping) or not ("openapi" in spec or "swagger" in spec):
+        raise SpecParseError(f"The {source} is not an OpenAPI or Swagger document")
+    return spec
+
+
+def _sniff_is_yaml(data: bytes | mmap.mmap) -> bool:
+    """Tell from the leading bytes whether a spec is YAML rather than JSON.
+    
+    JSON comes first: a spec that starts (after any BOM and whitespace)
+    with ``[``, or with ``{`` and then a quoted key, goes to the JSON
+    decoder, which falls back to the YAML loader if the spec turns out to
+    be YAML after all (see :func:`_load_json`). Anything else, including
+    flow-style YAML with a bare first key and empty or all-whitespace data,
+    goes to the YAML loader, which also accepts most JSON. Only the leading
+    whitespace is scanned, so the cost does not grow with the size of the
+    spec. The file name and content type are not consulted; a JSON spec
+    saved as ``.txt`` or ``.yaml`` is still decoded as JSON.
+    
+    Args:
+        data: The raw (uncompressed) spec bytes, a memory map of them, or
+            just a head of them
+    """
+    return _JSON_START.match(data) is None
+
+
+def _peekable(stream: IO[bytes]) -> IO[bytes]:
+    """Wrap a binary stream in a buffered reader unless it already supports peek()."""
+    return stream if hasattr(stream, "peek") else io.BufferedReader(stream)
+
+
+def describe_yaml_loader() -> str:
+    """Describe which YAML loader is in use, for verbose reporting."""
+    if _YAMLLoader.__name__ == "CSafeLoader":
+        return "CSafeLoader (libyaml)"
+    return "SafeLoader (pure Python - install PyYAML with libyaml for faster loading)"
+
+
+def _read_response(
+    url: str,
+    response: httpx.Response,
+    cached: tuple[bytes, dict[str, str]] | None,
+    http_cache: HTTPCache | None,
+) -> bytes:
+    """Get the spec body from a (possibly conditional) response."""
+    if cached and response.status_code == 304:
+        return cached[0]
+    response.raise_for_status()
+    if http_cache is not None:
+        http_cache.put(url, response.content, response.headers)
+    return response.content
+
+
+@contextmanager
+def _open_url(
+    url: str,
+    http_cache: HTTPCache | None,
+) -> Iterator[tuple[bytes | mmap.mmap, str | None]]:
+    """Download a spec body through the shared client and map it for decoding.
+    
+    The body is streamed to a spool file and hashed on the way in, then
+    memory-mapped, so it is never buffered on the heap. Interrupted
+    transfers are resumed with Range requests where the server allows.
+    With an HTTP cache, the request is conditional on the stored validators.
+    
+    Yields:
+        The body (a memory map, or the cached bytes on ``304``) and its
+        SHA-256 digest when known
+    """
+    cached = http_cache.get(url) if http_cache is not None else None
+    request_headers = HTTPCache.conditional_headers(cached[1]) if cached else {}
+    try:
+        fetched = download(get_http_client(), url, request_headers)
+    except httpx.HTTPError as e:
+        raise SpecParseError(f"Failed to fetch spec from URL: {e}")
+    
+    with fetched:
+        response = fetched.response
+        if cached and response.status_code == 304:
+            yield cached[0], None
+            return
+        try:
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise SpecParseError(f"Failed to fetch spec from URL: {e}")
+        if http_cache is not None:
+            http_cache.put(url, fetched.file, response.headers)
+        
+        if fetched.size == 0:
+            yield b"", fetched.digest
+            return
+        with mmap.mmap(fetched.file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped, fetched.digest
+
+
+async def _afetch_url(
+    url: str,
+    http_cache: HTTPCache | None,
+    client: httpx.AsyncClient | None = None,
+) -> bytes:
+    """Fetch a spec body asynchronously, revalidating against the HTTP cache if given."""
+    cached = http_cache.get(url) if http_cache is not None else None
+    request_headers = HTTPCache.conditional_headers(cached[1]) if cached else {}
+    try:
+        if client is None:
+            async with httpx.AsyncClient(**client_options()) as own_client:
+                response = await own_client.get(url, headers=request_headers)
+        else:
+            response = await client.get(url, headers=request_headers)
+        return _read_response(url, response, cached, http_cache)
+    except httpx.HTTPError as e:
+        raise SpecParseError(f"Failed to fetch spec from URL: {e}")
 
 
 class OpenAPIParser:
     """Parser for Swagger/OpenAPI specifications."""
     
+    # URL body fetched ahead of __init__ by aload()
+    _prefetched: bytes | None = None
+    
     def __init__(
         self,
         spec_path: str,
         validate: bool = True,
         resolve_refs: bool = True,
+        cache: SpecCache | None = None,
+        http_cache: HTTPCache | None = None,
+        streaming: bool = False,
+        memory_map: bool = False,
+        lazy: bool = False,
+        operation_filter: OperationFilter | None = None,
+        intern_strings: bool = False,
+        fingerprint: bool = False,
+        ref_depth: int | None = None,
+        share_schemas: bool = False,
     ) -> None:
         """Initialize the parser with a spec path.
         
         Args:
             spec_path: URL or file path to the spec
             validate: Whether to validate the spec
-            resolve_refs: Whether to resolve JSON references
+            resolve_refs: Whether to resolve JSON references; external refs
+                (``./schemas/user.yaml#/User``, URLs) are prefetched in parallel
+            cache: Optional content-addressed cache of parsed specs
+            http_cache: Optional revalidation cache for URL-sourced specs
+            streaming: Stream local JSON specs path item by path item, building
+                operations as they are read instead of loading the whole tree
+            memory_map: Memory-map local spec files instead of reading them
+                into a buffer first; the text is still copied once to decode it
+            lazy: Index JSON specs by offset and decode top-level members and
+                path items only when accessed (see :mod:`mcp_swagger_cli.lazy`)
+            operation_filter: Only build (and report in :meth:`get_spec_info`)
+                operations it selects; path items that cannot match are
+                skipped unread in lazy mode and not kept while streaming
+            intern_strings: Share one object per distinct string across the
+                decoded spec and the operation records built from it (see
+                :mod:`mcp_swagger_cli.interning`)
+            fingerprint: Build the spec's Merkle fingerprint while loading
+                (see :meth:`get_fingerprint`); needed in streaming mode, where
+                path items are not kept
+            ref_depth: Most refs expanded along any path down from a request
+                body or schema table entry (1 resolves only the top-level
+                ref); None expands all of them, up to cycles
+            share_schemas: Share one instance per structurally identical
+                schema across the operation records (see
+                :mod:`mcp_swagger_cli.consing`)
         """
         self.spec_path = spec_path
         self.validate = validate
         self.resolve_refs = resolve_refs
+        self.cache = cache
+        self.http_cache = http_cache
+        self.streaming = streaming
+        self.memory_map = memory_map
+        self.lazy = lazy
+        self.operation_filter = operation_filter or None
+        self.ref_depth = ref_depth
+        self._interner = StringInterner() if intern_strings else None
+        self._conser = HashConser() if share_schemas else None
         self._spec: dict[str, Any] = {}
+        self._spec_model: SpecModel | None = None
+        self._dereferencer: Dereferencer | None = None
+        self._union_index: UnionIndex | None = None
+        self._schema_graph: SchemaGraph | None = None
+        self._operations: list[dict[str, Any]] | None = None
+        self._fingerprint: Fingerprint | None = None
+        # Path item fingerprints taken while streaming
+        self._path_fingerprints: dict[str, Fingerprint] | None = {} if fingerprint else None
         self._parser: BaseParser | ResolvingParser | None = None
+        # URI that relative external refs in the root document resolve against
+        self._base_uri = spec_path if is_url(spec_path) else str(Path(spec_path).resolve())
+        self._external_refs = ExternalRefResolver(self._load_document)
         self._load_spec()
+        if fingerprint:
+            self.get_fingerprint()
+    
+    @classmethod
+    async def aload(
+        cls,
+        spec_path: str,
+        client: httpx.AsyncClient | None = None,
+        **kwargs: Any,
+    ) -> "OpenAPIParser":
+        """Load a spec without blocking the event loop.
+        
+        URLs are fetched with ``httpx.AsyncClient``; decoding, and reading of
+        local files, runs in a worker thread.
+        
+        Args:
+            spec_path: URL or file path to the spec
+            client: Optional shared async client (a temporary one is used otherwise)
+            **kwargs: Other :class:`OpenAPIParser` arguments
+            
+        Returns:
+            OpenAPIParser instance
+        """
+        if urlparse(spec_path).scheme not in ("http", "https"):
+            return await asyncio.to_thread(cls, spec_path, **kwargs)
+        
+        parser = cls.__new__(cls)
+        parser._prefetched = await _afetch_url(spec_path, kwargs.get("http_cache"), client)
+        await asyncio.to_thread(parser.__init__, spec_path, **kwargs)
+        return parser
     
     def _load_spec(self) -> None:
         """Load and parse the specification."""
-        # Determine if it's a URL or file
+        # Determine if it's stdin, a URL or a file
         parsed = urlparse(self.spec_path)
         
-        if parsed.scheme in ("http", "https"):
+        if self.spec_path == "-":
+            self._load_from_stream(sys.stdin.buffer, "standard input")
+        elif parsed.scheme in ("http", "https"):
             self._load_from_url(self.spec_path)
         else:
             self._load_from_file(self.spec_path)
     
+    @contextmanager
+    def _open_url_body(self, url: str) -> Iterator[tuple[bytes | mmap.mmap, str | None]]:
+        """Open a URL body for decoding; see :func:`_open_url`."""
+        if self._prefetched is not None:
+            # Body already fetched asynchronously by aload()
+            body = self._prefetched
+            self._prefetched = None
+            yield body, None
+            return
+        with _open_url(url, self.http_cache) as opened:
+            yield opened
+    
     def _load_from_url(self, url: str) -> None:
-        """Load spec from a URL."""
-        try:
-            response = httpx.get(url, timeout=30.0)
-            response.raise_for_status()
-            
-            # Determine format from content-type or URL
-            content_type = response.headers.get("content-type", "")
-            if "yaml" in content_type or url.endswith((".yaml", ".yml")):
-                self._spec = yaml.safe_load(response.text)
-            else:
-                self._spec = response.json()
-                
-        except httpx.HTTPError as e:
-            raise SpecParseError(f"Failed to fetch spec from URL: {e}")
-        except json.JSONDecodeError as e:
-            raise SpecParseError(f"Invalid JSON in spec: {e}")
-        except yaml.YAMLError as e:
-            raise SpecParseError(f"Invalid YAML in spec: {e}")
+        """Load spec from a URL.
+        
+        With an HTTP cache, the request is made conditional on the stored
+        validators and the cached body is reused on ``304 Not Modified``.
+        """
+        with self._open_url_body(url) as (body, digest):
+            # Content-Encoding gzip/deflate is already undone by httpx; anything
+            # else still compressed is recognized by its magic bytes, and the
+            # format is sniffed from the (decompressed) leading bytes
+            codec = detect_compression(body[:MAGIC_LENGTH])
+            self._spec = self._decode_root(body, "spec", codec, digest)
+            if not codec:
+                self._prefetch_external_refs(body)
     
     def _load_from_file(self, path: str) -> None:
         """Load spec from a file."""
@@ -77,69 +363,402 @@ class OpenAPIParser:
         if not file_path.exists():
             raise SpecNotFoundError(f"Spec file not found: {path}")
         
+        if stat.S_ISFIFO(file_path.stat().st_mode):
+            try:
+                with open(file_path, "rb") as f:
+                    self._load_from_stream(f, "named pipe")
+            except OSError as e:
+                raise SpecParseError(f"Failed to read spec from named pipe: {e}")
+            return
+        
+        # Compression and format both come from the leading bytes, never
+        # from the suffix
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                if file_path.suffix in (".yaml", ".yml"):
-                    self._spec = yaml.safe_load(f)
-                else:
-                    self._spec = json.load(f)
-        except json.JSONDecodeError as e:
-            raise SpecParseError(f"Invalid JSON in spec file: {e}")
-        except yaml.YAMLError as e:
-            raise SpecParseError(f"Invalid YAML in spec file: {e}")
+            with open(file_path, "rb") as f:
+                head = f.read(SNIFF_LENGTH)
+        except OSError as e:
+            raise SpecParseError(f"Failed to read spec file: {e}")
+        codec = detect_compression(head)
+        
+        if self.streaming:
+            def open_stream() -> IO[bytes]:
+                if codec:
+                    return open_decompressed(file_path, codec)
+                return open(file_path, "rb")
+            
+            if codec:
+                try:
+                    with _peekable(open_stream()) as stream:
+                        head = stream.peek(SNIFF_LENGTH)
+                except DECOMPRESSION_ERRORS as e:
+                    raise SpecParseError(f"Failed to decompress spec file: {e}")
+            if not _sniff_is_yaml(head) and self._load_streaming(
+                lambda: stream_spec(open_stream, select=self._select_path), "spec file", fall_back=True
+            ):
+                return
+        
+        try:
+            if self.memory_map and file_path.stat().st_size > 0:
+                with open(file_path, "rb") as f, mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped:
+                    self._spec = self._decode_root(mapped, "spec file", codec)
+                    if not codec:
+                        self._prefetch_external_refs(mapped)
+                return
+            data = file_path.read_bytes()
         except OSError as e:
             raise SpecParseError(f"Failed to read spec file: {e}")
+        
+        self._spec = self._decode_root(data, "spec file", codec)
+        if not codec:
+            self._prefetch_external_refs(data)
+    
+    def _prefetch_external_refs(self, data: bytes | mmap.mmap) -> None:
+        """Start loading every document the raw spec references, in parallel.
+        
+        External refs are found with a textual scan of the raw bytes, so the
+        parsed tree is never walked. Specs without external refs pay only for
+        the scan; compressed and streamed specs skip the prefetch and load
+        referenced documents on first use instead. So do filtered loads, since
+        most refs usually sit in operations the filter drops.
+        """
+        if not self.resolve_refs or self.operation_filter:
+            return
+        refs = find_external_refs(data)
+        if refs:
+            self._external_refs.prefetch(refs, self._base_uri)
+    
+    def _load_document(self, uri: str) -> tuple[Any, bytes | None]:
+        """Load a document referenced by an external $ref.
+        
+        Args:
+            uri: URL or absolute file path of the document
+            
+        Returns:
+            The parsed document, and its raw bytes for scanning its own refs
+            (None if the document was compressed)
+        """
+        source = f"referenced document {uri}"
+        if is_url(uri):
+            with self._open_url_body(uri) as (body, digest):
+                codec = detect_compression(body[:MAGIC_LENGTH])
+                document = self._decode_spec(body, source, codec, digest)
+                return document, None if codec else bytes(body)
+        else:
+            try:
+                body = Path(uri).read_bytes()
+            except FileNotFoundError:
+                raise SpecNotFoundError(f"Referenced document not found: {uri}")
+            except OSError as e:
+                raise SpecParseError(f"Failed to read {source}: {e}")
+        
+        codec = detect_compression(body[:MAGIC_LENGTH])
+        return self._decode_spec(body, source, codec), None if codec else body
+    
+    def _resolve_external_ref(self, node: dict[str, Any], base: str | None = None) -> dict[str, Any]:
+        """Resolve a $ref into another document, following ref-to-ref aliases.
+        
+        The returned node is left as it is in its document; its own refs
+        resolve against that document through :meth:`_resolve_ref`. Pointers
+        that do not resolve leave the node as it is, like unknown local refs;
+        documents that cannot be loaded raise.
+        
+        Args:
+            node: The ``$ref`` dict
+            base: URI of the referenced document the node was read from, or
+                None for a node of the spec itself
+        
+        Raises:
+            SpecNotFoundError: If a referenced file does not exist
+            SpecParseError: If a referenced document cannot be fetched or parsed
+        """
+        if not self.resolve_refs:
+            return node
+        
+        base = self._base_uri if base is None else base
+        target: Any = node
+        for _ in range(_MAX_REF_HOPS):
+            ref = target.get("$ref") if isinstance(target, dict) else None
+            if not isinstance(ref, str) or (ref.startswith("#") and base == self._base_uri):
+                break
+            try:
+                target, base = self._external_refs.resolve(ref, base)
+            except KeyError:
+                return node
+        return target if isinstance(target, dict) else node
+    
+    def _locate_ref(self, node: dict[str, Any]) -> str:
+        """Get a ref in absolute form if it was read from a referenced document.
+        
+        ``#/User`` means different schemas in the spec and in
+        ``schemas/user.yaml``, so memos key refs by this form.
+        """
+        base = self._external_refs.base_of(node)
+        ref = node["$ref"]
+        return ref if base is None else absolute_ref(ref, base)
+    
+    def _load_from_stream(self, stream: IO[bytes], source: str) -> None:
+        """Load a spec from a stream that can be read only once (stdin, a pipe).
+        
+        The stream is read as it arrives, never spooled to disk. Compression
+        and the format are sniffed from the leading bytes, since there is no
+        suffix to go by. With streaming, JSON goes through the single-pass
+        streaming parser. The parsed-spec cache is bypassed.
+        
+        Args:
+            stream: Binary stream of the spec
+            source: Description of the source used in error messages
+        """
+        try:
+            stream = _peekable(stream)
+            codec = detect_compression(stream.peek(MAGIC_LENGTH)[:MAGIC_LENGTH])
+            if codec:
+                stream = _peekable(open_decompressed(stream, codec))
+            is_yaml = _sniff_is_yaml(stream.peek(SNIFF_LENGTH))
+        except DECOMPRESSION_ERRORS as e:
+            raise SpecParseError(f"Failed to read {source}: {e}")
+        
+        if self.streaming and not is_yaml:
+            self._load_streaming(lambda: stream_spec_once(stream, select=self._select_path), source)
+            return
+        
+        try:
+            spec = _load_yaml(stream) if is_yaml else _load_json(stream.read())
+        except json.JSONDecodeError as e:
+            raise SpecParseError(f"Invalid JSON in {source}: {e}")
+        except yaml.YAMLError as e:
+            raise SpecParseError(f"Invalid YAML in {source}: {e}")
+        except UnicodeDecodeError as e:
+            raise SpecParseError(f"Invalid encoding in {source}: {e}")
+        except DECOMPRESSION_ERRORS as e:
+            raise SpecParseError(f"Failed to read {source}: {e}")
+        self._spec = self._intern(_require_spec_object(spec, source))
+    
+    def _load_streaming(
+        self,
+        read_spec: Callable[[], tuple[dict[str, Any], Iterable[tuple[str, Any]]]],
+        source: str,
+        fall_back: bool = False,
+    ) -> bool:
+        """Load a JSON spec incrementally, building operations as path items arrive.
+        
+        Peak memory is bounded by the largest single path item plus the
+        top-level tables. ``spec["paths"]`` keeps only a skeleton of each path
+        item (methods and their tags) for :meth:`get_spec_info`. Streaming
+        bypasses the parsed-spec cache.
+        
+        Args:
+            read_spec: Callable starting the read and returning the spec header
+                and an iterator of path items (see :mod:`mcp_swagger_cli.streaming`)
+            source: Description of the source used in error messages
+            fall_back: Whether the caller can read the spec again, so invalid
+                JSON (flow-style YAML, say) is left to it instead of raising
+            
+        Returns:
+            True if the spec was loaded, False if it is not valid JSON and
+            ``fall_back`` is set
+        """
+        try:
+            header, path_items = read_spec()
+            self._spec = header
+            operations: list[dict[str, Any]] = []
+            skeleton: dict[str, Any] = {}
+            for path, path_item in path_items:
+                path_item = self._intern(path_item)
+                if self._path_fingerprints is not None:
+                    self._path_fingerprints[path] = fingerprint_path_item(path_item)
+                path_operations = self._build_path_operations(path, path_item)
+                operations.extend(path_operations)
+                skeleton[path] = {
+                    op["method"]: {"tags": op["tags"]} for op in path_operations
+                }
+        except json.JSONDecodeError as e:
+            if fall_back:
+                self._spec = {}
+                if self._path_fingerprints is not None:
+                    self._path_fingerprints = {}
+                return False
+            raise SpecParseError(f"Invalid JSON in {source}: {e}")
+        except UnicodeDecodeError as e:
+            raise SpecParseError(f"Invalid encoding in {source}: {e}")
+        except DECOMPRESSION_ERRORS as e:
+            raise SpecParseError(f"Failed to read {source}: {e}")
+        
+        self._spec["paths"] = skeleton
+        self._spec = self._intern(self._spec)
+        self._operations = operations
+        return True
+        # Re-read the top-level tables: members after "paths" were not known
+        # yet when the first path item was built
+        self._spec_model = None
+        self._dereferencer = None
+        self._union_index = None
+        self._schema_graph = None
+    
+    def _decode_root(
+        self,
+        data: bytes | mmap.mmap,
+        source: str,
+        codec: str | None = None,
+        digest: str | None = None,
+    ) -> Any:
+        """Decode the root spec, as a lazy view when requested (JSON only).
+        
+        Raises:
+            SpecParseError: If the document is not an OpenAPI or Swagger object
+        """
+        if self.lazy:
+            spec = self._decode_lazy(data, source, codec, digest)
+        else:
+            spec = self._decode_spec(data, source, codec, digest)
+        return _require_spec_object(spec, source)
+    
+    def _decode_lazy(
+        self,
+        data: bytes | mmap.mmap,
+        source: str,
+        codec: str | None = None,
+        digest: str | None = None,
+    ) -> Any:
+        """Build a lazy view of a JSON spec, reusing a cached offset index.
+        
+        YAML specs, recognized from their leading bytes, are decoded eagerly.
+        
+        Args:
+            data: Raw spec bytes, or a memory map of them
+            source: Description of the source used in error messages
+            codec: Compression codec of the raw bytes, if compressed
+            digest: SHA-256 of the raw bytes, if already computed while downloading
+        """
+        if self.cache is not None and digest is None:
+            digest = spec_digest(data)
+        
+        if codec:
+            compressed = data if isinstance(data, mmap.mmap) else io.BytesIO(data)
+            try:
+                with open_decompressed(compressed, codec) as stream:
+                    data = stream.read()
+            except DECOMPRESSION_ERRORS as e:
+                raise SpecParseError(f"Failed to decompress {source}: {e}")
+        if _sniff_is_yaml(data):
+            return self._decode_spec(data, source, digest=digest)
+        
+        index_key = None
+        cached_index = None
+        if self.cache is not None:
+            index_key = f"{digest}-lazy-index"
+            cached_index = self.cache.get(index_key)
+        
+        try:
+            text = str(data, "utf-8-sig")
+            index = cached_index if cached_index is not None else index_spec(text)
+        except json.JSONDecodeError:
+            # Not JSON after all (flow-style YAML, say): decode it eagerly
+            return self._decode_spec(data, source, digest=digest)
+        except UnicodeDecodeError as e:
+            raise SpecParseError(f"Invalid encoding in {source}: {e}")
+        
+        if index_key is not None and cached_index is None:
+            self.cache.put(index_key, index)
+        return LazyObject(text, index, self._interner)
+    
+    def _decode_spec(
+        self,
+        data: bytes | mmap.mmap,
+        source: str,
+        codec: str | None = None,
+        digest: str | None = None,
+    ) -> Any:
+        """Decode raw spec bytes, going through the parsed-spec cache if enabled.
+        
+        The format is sniffed from the leading (decompressed) bytes and the
+        bytes go straight to that decoder, once (YAML that looks like JSON is
+        decoded a second time, by the YAML loader).
+        
+        Args:
+            data: Raw spec bytes, or a memory map of them
+            source: Description of the source used in error messages
+            codec: Compression codec of the raw bytes, if compressed
+            digest: SHA-256 of the raw bytes, if already computed while downloading
+        """
+        if self.cache is None:
+            digest = None
+        elif digest is None:
+            digest = spec_digest(data)
+        if digest is not None:
+            cached = self.cache.get(digest)
+            if cached is not None:
+                return self._intern(cached)
+        
+        try:
+            if codec:
+                # Decompress as a stream straight into the decoder
+                compressed = data if isinstance(data, mmap.mmap) else io.BytesIO(data)
+                with _peekable(open_decompressed(compressed, codec)) as stream:
+                    is_yaml = _sniff_is_yaml(stream.peek(SNIFF_LENGTH))
+                    spec = _load_yaml(stream) if is_yaml else _load_json(stream.read())
+            else:
+                is_yaml = _sniff_is_yaml(data)
+                if not isinstance(data, bytes):
+                    # The decoders only accept bytes or str; str() copies the
+                    # text out of the mapped pages once, where reading the
+                    # file would also have held a bytes buffer
+                    data = str(data, "utf-8-sig")
+                spec = _load_yaml(data) if is_yaml else _load_json(data)
+        except json.JSONDecodeError as e:
+            raise SpecParseError(f"Invalid JSON in {source}: {e}")
+        except yaml.YAMLError as e:
+            raise SpecParseError(f"Invalid YAML in {source}: {e}")
+        except UnicodeDecodeError as e:
+            raise SpecParseError(f"Invalid encoding in {source}: {e}")
+        except DECOMPRESSION_ERRORS as e:
+            raise SpecParseError(f"Failed to decompress {source}: {e}")
+        
+        spec = self._intern(spec)
+        if digest is not None:
+            self.cache.put(digest, spec)
+        return spec
+    
+    def _intern(self, node: Any) -> Any:
+        """Deduplicate the strings of a decoded tree when interning is enabled."""
+        if self._interner is None:
+            return node
+        return self._interner(node)
+    
+    def _share(self, node: Any) -> Any:
+        """Get the shared instance of a schema when schema sharing is enabled.
+        
+        Consing rewrites the tree it walks, so it works on a copy: the spec and
+        the dereferencer's memoized schemas are left as they were.
+        """
+        if self._conser is None or not isinstance(node, (dict, list)):
+            return node
+        return self._conser(copy.deepcopy(node))
     
     @property
     def spec(self) -> dict[str, Any]:
-        """Get the parsed specification."""
+        """Get the parsed specification (a read-only lazy mapping in lazy mode)."""
         return self._spec
     
     def get_spec_info(self) -> dict[str, Any]:
         """Extract useful information from the spec."""
-        info = self._spec.get("info", {})
-        
-        # Determine OpenAPI version
-        openapi_version = self._spec.get("openapi") or self._spec.get("swagger", "")
-        
-        # Get paths
+        model = self._model
         paths = self._spec.get("paths", {})
         
         # Count operations
         operations = []
-        for path, path_item in paths.items():
+        for path, path_item in self._iter_path_items():
             if isinstance(path_item, dict):
-                for method in ["get", "post", "put", "delete", "patch", "options", "head"]:
-                    if method in path_item:
+                for method in OPERATION_METHODS:
+                    if method in path_item and self._select_operation(path, path_item[method]):
                         operations.append((path, method, path_item[method]))
         
-        # Get schemas - handle both OpenAPI 3.0 (components/schemas) and 2.0 (definitions)
-        components = self._spec.get("components", {}) or self._spec.get("definitions", {})
-        schemas = components.get("schemas", components) if isinstance(components, dict) else {}
+        # With a filter, only paths that have a selected operation count
+        if self.operation_filter:
+            paths = dict.fromkeys(path for path, _, _ in operations)
         
-        # Convert schema keys to list if it's a dict
-        if isinstance(schemas, dict):
-            schema_list = list(schemas.keys())
-        else:
-            schema_list = []
-        
-        # Get servers - handle both OpenAPI 3.x and Swagger 2.0
-        servers = self._spec.get("servers", [])
-        server_urls = []
-        if servers:
-            for server in servers:
-                if isinstance(server, dict):
-                    server_urls.append(server.get("url", ""))
-                else:
-                    server_urls.append(str(server))
-        else:
-            # Swagger 2.0 uses host and basePath
-            host = self._spec.get("host", "")
-            base_path = self._spec.get("basePath", "/")
-            schemes = self._spec.get("schemes", ["https"])
-            if host:
-                scheme = schemes[0] if schemes else "https"
-                server_urls.append(f"{scheme}://{host}{base_path}")
+        schema_list = list(model.schemas.keys())
         
         # Group paths by tag
         paths_by_tag: dict[str, list[tuple[str, list[str]]]] = {}
@@ -159,260 +778,297 @@ class OpenAPIParser:
                     paths_by_tag[tag].append((path, [method]))
         
         return {
-            "title": info.get("title", "Untitled API"),
-            "version": info.get("version", "1.0.0"),
-            "description": info.get("description", ""),
-            "openapi_version": openapi_version,
+            "title": model.info.get("title", "Untitled API"),
+            "version": model.info.get("version", "1.0.0"),
+            "description": model.info.get("description", ""),
+            "openapi_version": model.version,
             "path_count": len(paths),
             "operation_count": len(operations),
             "schema_count": len(schema_list),
             "paths": list(paths.keys()),
             "schemas": schema_list,
-            "servers": server_urls,
+            "servers": model.server_urls,
             "paths_by_tag": paths_by_tag,
         }
     
+    @property
+    def _model(self) -> SpecModel:
+        """The spec's top-level tables in dialect-independent form, read once."""
+        if self._spec_model is None:
+            self._spec_model = normalize_spec(self._spec)
+        return self._spec_model
+    
+    @property
+    def _dereference(self) -> Dereferencer:
+        """Deep dereferencer of schemas (see :mod:`mcp_swagger_cli.dereference`)."""
+        if self._dereferencer is None:
+            self._dereferencer = Dereferencer(
+                self._resolve_schema_ref, self.ref_depth, compose=AllOfMerger(), locate=self._locate_ref
+            )
+        return self._dereferencer
+    
+    @property
+    def _unions(self) -> UnionIndex:
+        """Describes oneOf/anyOf schemas (see :mod:`mcp_swagger_cli.unions`)."""
+        if self._union_index is None:
+            self._union_index = UnionIndex(self._resolve_schema_ref, self._dereference)
+        return self._union_index
+    
+    @property
+    def _graph(self) -> SchemaGraph:
+        """References to named schemas (see :mod:`mcp_swagger_cli.reachability`)."""
+        if self._schema_graph is None:
+            self._schema_graph = SchemaGraph(self._model.schemas, self._resolve_ref, self._locate_ref)
+        return self._schema_graph
+    
     def get_operations(self) -> list[dict[str, Any]]:
         """Get all operations from the spec with metadata."""
+        if self._operations is not None:
+            # Already built while streaming the spec
+            return list(self._operations)
+        
         operations = []
+        for path, path_item in self._iter_path_items():
+            operations.extend(self._build_path_operations(path, path_item))
+        
+        return operations
+    
+    def get_fingerprint(self) -> Fingerprint:
+        """Get the spec's Merkle fingerprint (see :mod:`mcp_swagger_cli.fingerprint`).
+        
+        Built on first use and kept. With an operation filter, only the path
+        items that may pass it are covered. In lazy mode, building it decodes
+        every covered path item.
+        
+        Raises:
+            SpecParseError: If the spec was streamed without ``fingerprint=True``,
+                so its path items are gone
+        """
+        if self._fingerprint is None:
+            if self._operations is not None:
+                if self._path_fingerprints is None:
+                    raise SpecParseError(
+                        "Streamed specs can only be fingerprinted when loaded with fingerprint=True"
+                    )
+                paths = self._path_fingerprints
+            else:
+                paths = {
+                    path: fingerprint_path_item(path_item)
+                    for path, path_item in self._iter_path_items()
+                }
+            self._fingerprint = fingerprint_spec(self._spec, paths)
+            self._path_fingerprints = None
+        return self._fingerprint
+    
+    def _select_path(self, path: str) -> bool:
+        """Check whether any operation of a path item may pass the operation filter."""
+        return self.operation_filter is None or self.operation_filter.may_match_path(path)
+    
+    def _select_operation(self, path: str, operation: Any) -> bool:
+        """Check whether an operation passes the operation filter."""
+        if self.operation_filter is None:
+            return True
+        tags = operation.get("tags", ["default"]) if isinstance(operation, dict) else None
+        return self.operation_filter.matches(path, tags)
+    
+    def _iter_path_items(self) -> Iterator[tuple[str, Any]]:
+        """Yield the path items that may pass the operation filter.
+        
+        Path items are looked up only after their path passes, so in lazy
+        mode the others are never decoded.
+        """
         paths = self._spec.get("paths", {})
+        for path in paths:
+            if self._select_path(path):
+                yield path, paths[path]
+    
+    def _build_path_operations(self, path: str, path_item: Any) -> list[dict[str, Any]]:
+        """Build operation records for the methods of a single path item."""
+        operations = []
+        if not isinstance(path_item, dict):
+            return operations
         
-        for path, path_item in paths.items():
-            if not isinstance(path_item, dict):
+        for method in OPERATION_METHODS:
+            if method not in path_item:
                 continue
             
-            for method in ["get", "post", "put", "delete", "patch", "options", "head"]:
-                if method not in path_item:
-                    continue
-                
-                operation = path_item[method]
-                
-                # Get path-level parameters (for both 2.0 and 3.0)
-                path_params = path_item.get("parameters", [])
-                operation_id = operation.get("operationId")
+            operation = path_item[method]
+            if not self._select_operation(path, operation):
+                continue
+            
+            # One shape for both dialects: body parameters become the body,
+            # response schemas are pulled out of their media types
+            normalized = normalize_operation(self._model, path_item, operation, self._resolve_ref)
+            operation_id = operation.get("operationId")
+            
+            # Generate operationId if not present
+            if not operation_id:
+                method_part = method.upper()
+                path_part = path.strip("/").replace("/", "_").replace("-", "_").replace("{", "").replace("}", "")
+                operation_id = f"{method_part}_{path_part}"
+            
+            params_list = []
+            for param in normalized.parameters:
+                # Handle $ref in parameters (OpenAPI 3.0 components/parameters)
+                if "$ref" in param:
+                    param = self._resolve_parameter_ref(param) or param
                 
-                # Generate operationId if not present
-                if not operation_id:
-                    method_part = method.upper()
-                    path_part = path.strip("/").replace("/", "_").replace("-", "_").replace("{", "").replace("}", "")
-                    operation_id = f"{method_part}_{path_part}"
+                # Handle $ref in schema within parameter - resolve BEFORE reading type
+                schema = param.get("schema", {})
+                if "$ref" in schema:
+                    schema = self._resolve_schema_ref(schema)
+                    param = {**param, "schema": schema}
                 
-                # Merge path-level and operation-level parameters
-                parameters = path_params + operation.get("parameters", [])
-                params_list = []
+                # oneOf/anyOf: keep every variant, indexed by discriminator
+                union = self._unions(schema)
                 
-                # Determine the effective consumes for this operation (Swagger 2.0)
-                # Operation-level consumes overrides global consumes
-                global_consumes = self._spec.get("consumes", [])
-                operation_consumes = operation.get("consumes", global_consumes)
-
-                # Also detect form/multipart from OpenAPI 3.x requestBody content types
-                if "requestBody" in operation:
-                    rb_content = operation["requestBody"].get("content", {})
-                    detected_types = list(rb_content.keys())
-                    if detected_types and not operation_consumes:
-                        operation_consumes = detected_types
-
-                # FIX Issue 2: Filter body params from params_list (only add non-body params)
-                for param in parameters:
-                    # Skip body parameters - they will be handled separately as request_body
-                    if param.get("in") == "body":
-                        continue
-                    
-                    # Handle $ref in parameters (OpenAPI 3.0 components/parameters)
-                    if "$ref" in param:
-                        param = self._resolve_parameter_ref(param) or param
-                    
-                    # Handle $ref in schema within parameter - resolve BEFORE reading type
-                    schema = param.get("schema", {})
-                    if "$ref" in schema:
-                        schema = self._resolve_schema_ref(schema)
-                        param = {**param, "schema": schema}
-                    
-                    # Handle oneOf/anyOf in schema (OpenAPI 3.0)
-                    if "oneOf" in schema or "anyOf" in schema:
-                        # Flatten to first option for now (basic support)
-                        if "oneOf" in schema and schema["oneOf"]:
-                            first = schema["oneOf"][0]
-                            if "$ref" in first:
-                                first = self._resolve_schema_ref(first)
-                            schema = {**schema, **first}
-                            del schema["oneOf"]
-                        elif "anyOf" in schema and schema["anyOf"]:
-                            first = schema["anyOf"][0]
-                            if "$ref" in first:
-                                first = self._resolve_schema_ref(first)
-                            schema = {**schema, **first}
-                            del schema["anyOf"]
-                        param = {**param, "schema": schema}
-                    
-                    # Now read type AFTER resolution
+                # Now read type AFTER resolution
+                if union is not None:
+                    type_val = union_type(union)
+                else:
                     type_val = schema.get("type", param.get("type", "string")) if schema else param.get("type", "string")
-                    
-                    params_list.append({
-                        "name": param.get("name"),
-                        "in": param.get("in"),
-                        "required": param.get("required", False),
-                        "type": type_val,
-                        "description": param.get("description", ""),
-                        "default": schema.get("default", param.get("default")) if schema else param.get("default"),
-                        "enum": schema.get("enum", param.get("enum")) if schema else param.get("enum"),
-                    })
                 
-                # FIX Issue 3: Resolve requestBody $ref in OpenAPI 3.x
-                request_body = None
-                if "requestBody" in operation:
-                    rb = operation["requestBody"]
-                    content = rb.get("content", {})
-                    # Prefer JSON, but also handle form/multipart
-                    if "application/json" in content:
-                        json_content = content["application/json"]
-                        schema = json_content.get("schema", {})
-                        # Resolve $ref if present in requestBody schema
-                        if "$ref" in schema:
-                            schema = self._resolve_schema_ref(schema)
-                        request_body = {
-                            "required": rb.get("required", False),
-                            "description": rb.get("description", ""),
-                            "schema": schema,
-                        }
-                    elif "multipart/form-data" in content or "application/x-www-form-urlencoded" in content:
-                        # For OpenAPI 3.x form/multipart, extract fields as formData params
-                        form_key = "multipart/form-data" if "multipart/form-data" in content else "application/x-www-form-urlencoded"
-                        form_schema = content[form_key].get("schema", {})
-                        if "$ref" in form_schema:
-                            form_schema = self._resolve_schema_ref(form_schema)
-                        # Add form fields as formData parameters so the template can handle them
-                        form_props = form_schema.get("properties", {})
-                        required_fields = form_schema.get("required", [])
-                        for field_name, field_schema in form_props.items():
-                            if "$ref" in field_schema:
-                                field_schema = self._resolve_schema_ref(field_schema)
-                            params_list.append({
-                                "name": field_name,
-                                "in": "formData",
-                                "required": field_name in required_fields,
-                                "type": field_schema.get("type", field_schema.get("format", "string")),
-                                "description": field_schema.get("description", ""),
-                                "default": field_schema.get("default"),
-                                "enum": field_schema.get("enum"),
-                            })
-                        request_body = {
-                            "required": rb.get("required", False),
-                            "description": rb.get("description", ""),
-                            "schema": form_schema,
-                        }
-                
-                # Handle body parameters (OpenAPI 2.0 style: in: body)
-                for param in parameters:
-                    if param.get("in") == "body":
-                        # Also resolve $ref in body param schema
-                        schema = param.get("schema", {})
-                        if "$ref" in schema:
-                            schema = self._resolve_schema_ref(schema)
-                        request_body = {
-                            "required": param.get("required", False),
-                            "description": param.get("description", ""),
-                            "schema": schema,
-                        }
-                        break
-                
-                # Get responses
-                responses = {}
-                for status, response in operation.get("responses", {}).items():
-                    responses[status] = {
-                        "description": response.get("description", ""),
-                        "schema": response.get("content", {}).get("application/json", {}).get("schema"),
-                    }
-                
-                # Get tags
-                tags = operation.get("tags", ["default"])
-                
-                operations.append({
-                    "path": path,
-                    "method": method,
-                    "operation_id": operation_id,
-                    "summary": operation.get("summary", ""),
-                    "description": operation.get("description", ""),
-                    "tags": tags,
-                    "deprecated": operation.get("deprecated", False),
-                    "parameters": params_list,
-                    "request_body": request_body,
-                    "responses": responses,
-                    "security": operation.get("security", []),
-                    "consumes": operation_consumes,
+                params_list.append({
+                    "name": param.get("name"),
+                    "in": param.get("in"),
+                    "required": param.get("required", False),
+                    "type": type_val,
+                    "description": param.get("description", ""),
+                    "default": schema.get("default", param.get("default")) if schema else param.get("default"),
+                    "enum": schema.get("enum", param.get("enum")) if schema else param.get("enum"),
+                    "union": self._share(union),
                 })
+            
+            request_body = None
+            body = normalized.body
+            if body is not None:
+                # Refs at any depth, not just the top-level one
+                schema = self._dereference(body.schema)
+                union = self._unions(self._resolve_schema_ref(body.schema))
+                if body.form:
+                    # Add form fields as formData parameters so the template can handle them
+                    form_props = schema.get("properties", {})
+                    required_fields = schema.get("required", [])
+                    for field_name, field_schema in form_props.items():
+                        if "$ref" in field_schema:
+                            field_schema = self._resolve_schema_ref(field_schema)
+                        field_union = self._unions(field_schema)
+                        params_list.append({
+                            "name": field_name,
+                            "in": "formData",
+                            "required": field_name in required_fields,
+                            "type": (
+                                union_type(field_union) if field_union is not None
+                                else field_schema.get("type", field_schema.get("format", "string"))
+                            ),
+                            "description": field_schema.get("description", ""),
+                            "default": field_schema.get("default"),
+                            "enum": field_schema.get("enum"),
+                            "union": self._share(field_union),
+                        })
+                request_body = {
+                    "required": body.required,
+                    "description": body.description,
+                    "schema": self._share(schema),
+                    "union": self._share(union),
+                }
+            
+            responses = {
+                status: {"description": description, "schema": self._share(schema)}
+                for status, description, schema in normalized.responses
+            }
+            
+            operations.append({
+                "path": path,
+                "method": method,
+                "operation_id": operation_id,
+                "summary": operation.get("summary", ""),
+                "description": operation.get("description", ""),
+                "tags": operation.get("tags", ["default"]),
+                "deprecated": operation.get("deprecated", False),
+                "parameters": params_list,
+                "request_body": request_body,
+                "responses": responses,
+                "security": operation.get("security", []),
+                "consumes": normalized.consumes,
+                # Named schemas the raw operation refers to directly
+                "schema_refs": self._intern(self._graph.refs(path_item.get("parameters"), operation)),
+            })
         
         return operations
     
     def _resolve_parameter_ref(self, param: dict[str, Any]) -> dict[str, Any] | None:
         """Resolve a $ref to a parameter definition."""
-        ref = param.get("$ref", "")
-        if not ref:
-            return param
-        
-        # Parse the reference path
-        if ref.startswith("#/components/parameters/"):
-            param_name = ref.split("/")[-1]
-            components = self._spec.get("components", {})
-            params = components.get("parameters", {})
-            return params.get(param_name, param)
-        elif ref.startswith("#/parameters/"):
-            # Swagger 2.0 style
-            param_name = ref.split("/")[-1]
-            params = self._spec.get("parameters", {})
-            return params.get(param_name, param)
-        
-        return param
+        return self._resolve_ref(param)
     
     def _resolve_schema_ref(self, schema: dict[str, Any]) -> dict[str, Any]:
         """Resolve a $ref to a schema definition."""
-        ref = schema.get("$ref", "")
-        if not ref:
-            return schema
-        
-        # Parse the reference path
-        if ref.startswith("#/components/schemas/"):
-            schema_name = ref.split("/")[-1]
-            components = self._spec.get("components", {})
-            schemas = components.get("schemas", {})
-            return schemas.get(schema_name, schema)
-        elif ref.startswith("#/definitions/"):
-            # Swagger 2.0 style
-            schema_name = ref.split("/")[-1]
-            definitions = self._spec.get("definitions", {})
-            return definitions.get(schema_name, schema)
-        
-        return schema
+        return self._resolve_ref(schema)
+    
+    def _resolve_ref(self, node: dict[str, Any]) -> dict[str, Any]:
+        """Resolve a $ref, local or external, following ref-to-ref aliases.
+        
+        Local refs may be any JSON pointer into the spec and are looked up
+        in its pointer index, so each is walked once however often it is
+        used. Refs that do not resolve leave the node as it is.
+        """
+        target = node
+        for _ in range(_MAX_REF_HOPS):
+            ref = target.get("$ref")
+            if not isinstance(ref, str) or not ref:
+                break
+            base = self._external_refs.base_of(target)
+            if base is not None or not ref.startswith("#"):
+                # Refs read from a referenced document are relative to it
+                return self._resolve_external_ref(target, base)
+            resolved = self._model.resolve_local(ref, None)
+            if not isinstance(resolved, Mapping):
+                break
+            target = resolved
+        return target
     
     def get_schemas(self) -> dict[str, dict[str, Any]]:
-        """Get all schemas from the spec."""
-        # Handle both OpenAPI 3.0 (components/schemas) and 2.0 (definitions)
-        components = self._spec.get("components", {}) or self._spec.get("definitions", {})
+        """Get all schemas from the spec (``components/schemas`` or ``definitions``).
         
-        if isinstance(components, dict):
-            return components.get("schemas", components)
+        Refs inside the schemas are replaced by their targets at any depth;
+        refs that close a cycle are kept as ``{"$ref": ...}`` back-references.
+        """
+        dereference = self._dereference
+        return {
+            name: dereference(schema, shared=True) for name, schema in self._model.schemas.items()
+        }
+    
+    def get_schema_dependencies(self) -> dict[str, list[str]]:
+        """Get the names of the schemas each named schema refers to directly.
         
-        return {}
+        With the ``schema_refs`` of operation records, this gives the
+        schemas a set of operations reaches (see
+        :func:`~mcp_swagger_cli.reachability.reachable_schemas`).
+        """
+        return self._graph.to_dict()
     
     def get_servers(self) -> list[dict[str, Any]]:
-        """Get server definitions from the spec."""
-        return self._spec.get("servers", [{"url": self._spec.get("host", "")}])
+        """Get server definitions from the spec (derived from ``host`` for Swagger 2.0)."""
+        return self._model.servers or [{"url": ""}]
     
     def get_security_schemes(self) -> dict[str, dict[str, Any]]:
-        """Get security schemes from the spec."""
-        components = self._spec.get("components", {})
-        if isinstance(components, dict):
-            return components.get("securitySchemes", {})
-        return {}
+        """Get security schemes from the spec (``securityDefinitions`` for Swagger 2.0)."""
+        return self._model.security_schemes
 
 
-def parse_spec(spec_path: str, validate: bool = True) -> OpenAPIParser:
+def parse_spec(
+    spec_path: str,
+    validate: bool = True,
+    cache: SpecCache | None = None,
+    http_cache: HTTPCache | None = None,
+) -> OpenAPIParser:
     """Parse a Swagger/OpenAPI specification.
     
     Args:
         spec_path: URL or file path to the spec
         validate: Whether to validate the spec
+        cache: Optional content-addressed cache of parsed specs
+        http_cache: Optional revalidation cache for URL-sourced specs
         
     Returns:
         OpenAPIParser instance
@@ -422,4 +1078,35 @@ def parse_spec(spec_path: str, validate: bool = True) -> OpenAPIParser:
         SpecParseError: If spec cannot be parsed
         SpecValidationError: If spec validation fails
     """
-    return OpenAPIParser(spec_path=spec_path, validate=validate)
+    return OpenAPIParser(
+        spec_path=spec_path, validate=validate, cache=cache, http_cache=http_cache
+    )
+
+
+async def load_specs(
+    spec_paths: Iterable[str],
+    concurrency: int = 8,
+    **kwargs: Any,
+) -> list[OpenAPIParser]:
+    """Load many specs concurrently.
+    
+    All URL fetches share one ``httpx.AsyncClient``, configured like the
+    shared sync client; at most ``concurrency`` specs are fetched and decoded
+    at a time.
+    
+    Args:
+        spec_paths: URLs or file paths of the specs
+        concurrency: Maximum number of specs loaded at once
+        **kwargs: Other :class:`OpenAPIParser` arguments
+        
+    Returns:
+        OpenAPIParser instances, in the order of ``spec_paths``
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async with httpx.AsyncClient(**client_options()) as client:
+        async def _load(spec_path: str) -> OpenAPIParser:
+            async with semaphore:
+                return await OpenAPIParser.aload(spec_path, client=client, **kwargs)
+        
+        return list(await asyncio.gather(*(_load(path) for path in spec_paths)))
@@ -0,0 +1,141 @@
+"""Which named schemas operations reach, for tree-shaking generated servers.
+
+A server generated for a few tags of a large spec needs only the schemas
+those operations use, directly or through other schemas. The references are
+taken from the raw spec, where ``$ref`` still names its target; dereferenced
+schemas no longer do.
+
+:class:`SchemaGraph` finds the named schemas (``components/schemas`` or
+``definitions`` entries) a raw node refers to. Refs to other components
+(shared parameters, responses, request bodies) are followed and scanned in
+turn. The targets of ``discriminator.mapping`` entries (refs or bare schema
+names) count as references too, since a union may use them without listing
+them. Refs whose pointer names a schema table entry count without being
+resolved, which also covers specs streamed with ``components`` after
+``paths``; other refs (external documents, odd pointers) count when their
+target is a table entry. Each schema's direct references are computed once;
+:func:`reachable_schemas` then takes the transitive closure from the
+references of the selected operations.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+from urllib.parse import unquote
+
+from mcp_swagger_cli.refs import unescape_pointer_token
+
+# JSON-pointer prefixes of the schema tables of both dialects
+_TABLE_POINTERS = ("#/components/schemas/", "#/definitions/")
+
+# Where bare schema names in a discriminator mapping point
+_SCHEMA_PREFIX = "#/components/schemas/"
+
+
+def _table_entry_name(ref: str) -> str | None:
+    """Get the schema name a ref to a schema table entry points to, if it does."""
+    for prefix in _TABLE_POINTERS:
+        if ref.startswith(prefix):
+            token = ref[len(prefix):]
+            if "/" not in token:
+                return unescape_pointer_token(unquote(token))
+    return None
+
+
+class SchemaGraph:
+    """Named schemas referenced from raw spec nodes."""
+
+    def __init__(
+        self,
+        schemas: Mapping[str, Any],
+        resolve: Callable[[dict[str, Any]], Any],
+        locate: Callable[[dict[str, Any]], str] | None = None,
+    ) -> None:
+        """Initialize the graph.
+
+        Args:
+            schemas: The spec's schema table, undereferenced
+            resolve: Resolves one ``{"$ref": ...}`` dict to its target,
+                returning the dict itself when the ref cannot be resolved
+            locate: Optional callable giving the absolute form of a ``$ref``
+                dict's ref, so a ref read from a referenced document is not
+                taken for an entry of the spec's own schema table
+        """
+        self._schemas = schemas
+        self._resolve = resolve
+        self._locate = locate
+        self._names = {id(schema): name for name, schema in schemas.items()}
+        # Direct references by schema name
+        self._dependencies: dict[str, list[str]] = {}
+
+    def refs(self, *nodes: Any) -> list[str]:
+        """Get the names of the schemas raw nodes refer to directly, sorted.
+
+        Schemas are not descended into, but refs to anything else are
+        followed, so a parameter ref counts the schemas of the parameter.
+        """
+        names: set[str] = set()
+        seen: set[int] = set()
+        pending = list(nodes)
+        while pending:
+            node = pending.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            if isinstance(node, Mapping):
+                ref = node.get("$ref")
+                if isinstance(ref, str):
+                    if self._locate is not None:
+                        ref = self._locate(node)
+                    self._follow(node, ref, names, pending)
+                    continue
+                discriminator = node.get("discriminator")
+                mapping = discriminator.get("mapping") if isinstance(discriminator, Mapping) else None
+                if isinstance(mapping, Mapping):
+                    # Mapped schemas are variants too, listed in oneOf or not
+                    for target in mapping.values():
+                        if isinstance(target, str):
+                            ref = target if "#" in target or "/" in target else _SCHEMA_PREFIX + target
+                            self._follow({"$ref": ref}, ref, names, pending)
+                pending.extend(value for value in node.values() if isinstance(value, (Mapping, list)))
+            elif isinstance(node, list):
+                pending.extend(value for value in node if isinstance(value, (Mapping, list)))
+        return sorted(names)
+
+    def _follow(self, node: Mapping[str, Any], ref: str, names: set[str], pending: list[Any]) -> None:
+        """Count a ref to a named schema, or queue its target to be scanned."""
+        name = _table_entry_name(ref)
+        target = node if name is not None else self._resolve(node)
+        if name is None:
+            name = self._names.get(id(target))
+        if name is not None:
+            names.add(name)
+        elif target is not node:
+            pending.append(target)
+
+    def dependencies(self, name: str) -> list[str]:
+        """Get the names of the schemas a named schema refers to directly."""
+        dependencies = self._dependencies.get(name)
+        if dependencies is None:
+            dependencies = self._dependencies[name] = self.refs(self._schemas.get(name))
+        return dependencies
+
+    def to_dict(self) -> dict[str, list[str]]:
+        """Get the direct references of every named schema."""
+        return {name: self.dependencies(name) for name in self._schemas}
+
+
+def reachable_schemas(roots: Iterable[str], dependencies: Mapping[str, Iterable[str]]) -> set[str]:
+    """Get the names of the schemas reachable from some roots, roots included.
+
+    Args:
+        roots: Schema names referred to directly (e.g. by operations)
+        dependencies: Direct references of each named schema
+    """
+    reached = set(roots)
+    pending = list(reached)
+    while pending:
+        for name in dependencies.get(pending.pop(), ()):
+            if name not in reached:
+                reached.add(name)
+                pending.append(name)
+    return reached
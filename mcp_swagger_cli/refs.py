@@ -0,0 +1,281 @@
+"""Resolution of ``$ref`` pointers, including refs into external documents.
+
+Specs split across many files reference each other with refs such as
+``./schemas/user.yaml#/User`` or ``https://example.com/common.json#/Error``.
+:class:`ExternalRefResolver` loads each referenced document once per run,
+however many times it is referenced, and can prefetch a whole tree of
+documents in parallel through a thread pool. :class:`PointerIndex` resolves
+JSON pointers within a document, local refs of the spec itself included.
+"""
+
+import os
+import re
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+from urllib.parse import unquote, urljoin, urlparse
+
+# External $ref values ("$ref" followed by a value not starting with "#"),
+# matched on raw bytes so documents never have to be walked to find them.
+# Covers JSON and YAML (double-quoted, single-quoted and plain values); the
+# literal "$ref" prefix lets the regex engine skip ahead quickly.
+_EXTERNAL_REF = re.compile(
+    rb"""\$ref['"]?\s*:\s*(?:"([^"#][^"]*)"|'([^'#][^']*)'|([^'"\s#][^\s,}\]]*))"""
+)
+
+# Default number of documents fetched at once during prefetch
+DEFAULT_MAX_WORKERS = 8
+
+
+def find_external_refs(data: bytes) -> set[str]:
+    """Find external ``$ref`` values in a raw JSON or YAML document.
+
+    This is a fast textual scan: it may over-report (e.g. a ``$ref`` quoted
+    in a description), which only costs a wasted prefetch.
+    """
+    return {
+        b"".join(groups).decode("utf-8", "replace")
+        for groups in _EXTERNAL_REF.findall(data)
+    }
+
+
+def split_ref(ref: str) -> tuple[str, str]:
+    """Split a ref into its document part and its JSON-pointer fragment."""
+    document, _, fragment = ref.partition("#")
+    return document, fragment
+
+
+def is_url(uri: str) -> bool:
+    """Check whether a document URI is an HTTP(S) URL."""
+    return urlparse(uri).scheme in ("http", "https")
+
+
+def join_uri(base: str, document: str) -> str:
+    """Resolve a ref's document part against the URI of the referring document.
+
+    Args:
+        base: URL or absolute file path of the referring document
+        document: Document part of the ref (relative or absolute)
+
+    Returns:
+        URL or normalized absolute file path of the referenced document
+    """
+    if not document:
+        return base
+    if is_url(document):
+        return document
+    if is_url(base):
+        return urljoin(base, document)
+    return os.path.normpath(os.path.join(os.path.dirname(base), unquote(document)))
+
+
+def unescape_pointer_token(token: str) -> str:
+    """Unescape one JSON-pointer reference token (RFC 6901)."""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+class PointerIndex:
+    """Memoized JSON-pointer lookups into one document.
+
+    Every pointer resolved is kept, along with each of its prefixes, so a
+    pointer is walked at most once and resolving a new pointer costs one
+    step from its longest known prefix: every ``#/components/schemas/...``
+    ref shares the walk to ``/components/schemas``. Lookups that fail are
+    not kept, so members added to the document later (a spec header filled
+    in while streaming) still resolve.
+
+    Pointers follow RFC 6901: tokens are unescaped (``~1`` to ``/``, ``~0``
+    to ``~``) after percent-decoding the URI fragment, ``""`` is the whole
+    document and ``/`` the member named ``""``.
+    """
+
+    __slots__ = ("document", "_nodes")
+
+    def __init__(self, document: Any) -> None:
+        self.document = document
+        self._nodes: dict[str, Any] = {"": document}
+
+    def __len__(self) -> int:
+        """Number of pointers indexed so far."""
+        return len(self._nodes)
+
+    def resolve(self, fragment: str) -> Any:
+        """Get the node a JSON-pointer fragment (``/a/b``, no ``#``) points to.
+
+        Raises:
+            KeyError: If the pointer does not resolve
+        """
+        try:
+            return self._nodes[fragment]
+        except KeyError:
+            pass
+        pointer = unquote(fragment)
+        if pointer != fragment:
+            node = self.resolve(pointer)
+        elif not pointer.startswith("/"):
+            raise KeyError(f"Unresolvable JSON pointer: #{fragment}")
+        else:
+            parent_pointer, _, token = pointer.rpartition("/")
+            parent = self.resolve(parent_pointer)
+            token = unescape_pointer_token(token)
+            if isinstance(parent, Mapping) and token in parent:
+                node = parent[token]
+            elif isinstance(parent, list) and token.isdigit() and int(token) < len(parent):
+                node = parent[int(token)]
+            else:
+                raise KeyError(f"Unresolvable JSON pointer: #{fragment}")
+        self._nodes[fragment] = node
+        return node
+
+
+def resolve_pointer(document: Any, fragment: str) -> Any:
+    """Follow a JSON-pointer fragment (``/a/b``) into a document, unmemoized.
+
+    Raises:
+        KeyError: If the pointer does not resolve
+    """
+    return PointerIndex(document).resolve(fragment)
+
+
+def absolute_ref(ref: str, base: str) -> str:
+    """Make a ref absolute against the URI of the document it appears in.
+
+    ``#/Address`` in ``/specs/schemas/user.yaml`` becomes
+    ``/specs/schemas/user.yaml#/Address``. Only used to tell refs apart and
+    to resolve them; the spec's nodes keep the refs their author wrote.
+    """
+    document, fragment = split_ref(ref)
+    return f"{join_uri(base, document)}#{fragment}"
+
+
+class ExternalRefResolver:
+    """Loads documents referenced by external refs, once per document.
+
+    Documents are cached by URI as futures, so concurrent requests for the
+    same document share one load. Nodes taken from a document are returned
+    as they are, relative refs included; the resolver remembers which
+    document each ``$ref`` dict of an indexed document came from
+    (:meth:`base_of`), so those refs resolve against it.
+    """
+
+    def __init__(
+        self,
+        load_document: Callable[[str], tuple[Any, bytes | None]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Initialize the resolver.
+
+        Args:
+            load_document: Loads a document URI and returns the parsed document
+                and its raw bytes (None if unavailable, e.g. when compressed)
+            max_workers: Number of documents fetched at once during prefetch
+        """
+        self._load_document = load_document
+        self._max_workers = max_workers
+        self._documents: dict[str, Future] = {}
+        self._indexes: dict[str, PointerIndex] = {}
+        # Document URI by id of each $ref dict of an indexed document; the
+        # documents stay loaded, so the ids are not reused
+        self._bases: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def _claim(self, uri: str) -> tuple[Future, bool]:
+        """Get the future for a document, and whether the caller must load it."""
+        with self._lock:
+            if uri in self._documents:
+                return self._documents[uri], False
+            future: Future = Future()
+            self._documents[uri] = future
+            return future, True
+
+    def _load_into(self, uri: str, future: Future) -> None:
+        """Load a document and settle its future."""
+        try:
+            future.set_result(self._load_document(uri))
+        except BaseException as e:
+            future.set_exception(e)
+
+    def prefetch(self, refs: Iterable[str], base: str) -> None:
+        """Load every document reachable from ``refs`` in parallel.
+
+        Documents are loaded in waves: the external refs of each loaded
+        document are scanned and their targets fetched in the next wave.
+        Load failures are deferred until the document is actually resolved.
+
+        Args:
+            refs: External refs found in the referring document
+            base: URI of the referring document
+        """
+        wave = {join_uri(base, split_ref(ref)[0]) for ref in refs}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while wave:
+                pending = {}
+                for uri in wave:
+                    future, owner = self._claim(uri)
+                    if owner:
+                        executor.submit(self._load_into, uri, future)
+                        pending[uri] = future
+
+                next_wave = set()
+                for uri, future in pending.items():
+                    if future.exception() is not None:
+                        continue
+                    raw = future.result()[1]
+                    if raw:
+                        next_wave.update(
+                            join_uri(uri, split_ref(ref)[0]) for ref in find_external_refs(raw)
+                        )
+                with self._lock:
+                    wave = next_wave - self._documents.keys()
+
+    def document(self, uri: str) -> Any:
+        """Get a parsed document, loading it now if it was not prefetched."""
+        future, owner = self._claim(uri)
+        if owner:
+            self._load_into(uri, future)
+        return future.result()[0]
+
+    def index(self, uri: str) -> PointerIndex:
+        """Get the pointer index of a document, loading it if needed."""
+        index = self._indexes.get(uri)
+        if index is None:
+            document = self.document(uri)
+            pending = [document]
+            while pending:
+                node = pending.pop()
+                if isinstance(node, dict):
+                    if isinstance(node.get("$ref"), str):
+                        self._bases.setdefault(id(node), uri)
+                    pending.extend(node.values())
+                elif isinstance(node, list):
+                    pending.extend(node)
+            index = self._indexes[uri] = PointerIndex(document)
+        return index
+
+    def base_of(self, node: Any) -> str | None:
+        """Get the URI of the referenced document a ``$ref`` dict was read from.
+
+        Returns:
+            The document URI, or None for nodes of the spec itself
+        """
+        return self._bases.get(id(node))
+
+    def resolve(self, ref: str, base: str) -> tuple[Any, str]:
+        """Resolve an external ref.
+
+        Args:
+            ref: The ``$ref`` value, e.g. ``./schemas/user.yaml#/User``
+            base: URI of the document containing the ref
+
+        Returns:
+            The target node, as it is in its document, and the URI of that
+            document (which its own relative refs resolve against)
+
+        Raises:
+            KeyError: If the pointer does not resolve in the loaded document
+            MCPSwaggerError: If the document cannot be loaded
+        """
+        document_part, fragment = split_ref(ref)
+        uri = join_uri(base, document_part)
+        return self.index(uri).resolve(fragment), uri
@@ -0,0 +1,253 @@
+"""Incremental JSON reading for large specifications.
+
+``json.load`` materializes a whole document before anything can look at it.
+For multi-hundred-megabyte specs that means the full tree is resident while
+``get_operations`` walks ``paths``. The reader here walks a JSON stream one
+object member at a time and decodes each member value with the C decoder, so
+only the current value (plus a read-ahead window) is held in memory.
+"""
+
+import io
+import json
+import re
+from collections.abc import Callable, Iterator, Mapping
+from typing import IO, Any
+
+# Read size for the first fill; later fills grow with the pending value
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class JSONStreamReader:
+    """Pull-based reader over a JSON text stream.
+
+    Containers are entered with :meth:`iter_object`, which yields member keys;
+    after each key the caller consumes the member value with
+    :meth:`read_value` (or descends into it with another :meth:`iter_object`).
+    """
+
+    def __init__(self, stream: IO[Any], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Initialize the reader.
+
+        Args:
+            stream: Binary (UTF-8) or text stream positioned at a JSON value
+            chunk_size: Minimum number of characters to read per fill
+        """
+        if isinstance(stream, io.TextIOBase):
+            self._stream = stream
+        else:
+            self._stream = io.TextIOWrapper(stream, encoding="utf-8-sig")
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read more input into the buffer. Returns False at end of stream."""
+        if self._eof:
+            return False
+        # Grow reads with the pending tail so re-decoding a large value after
+        # a refill stays amortized linear
+        pending = len(self._buf) - self._pos
+        chunk = self._stream.read(max(self._chunk_size, pending))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _skip_whitespace(self) -> None:
+        """Advance past whitespace, refilling as needed."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._fill():
+                return
+
+    def _next_char(self) -> str:
+        """Consume and return the next non-whitespace character ('' at EOF)."""
+        self._skip_whitespace()
+        if self._pos >= len(self._buf):
+            return ""
+        char = self._buf[self._pos]
+        self._pos += 1
+        return char
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        """Build a decode error at the current position."""
+        return json.JSONDecodeError(message, self._buf, self._pos)
+
+    def read_value(self) -> Any:
+        """Decode and return the next complete JSON value."""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Most likely a value cut off by the read window
+                if self._fill():
+                    continue
+                raise
+            # A scalar ending exactly at the window edge (e.g. a number) may
+            # continue in the next chunk
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """Consume the next JSON value without keeping it."""
+        self.read_value()
+
+    def iter_object(self) -> Iterator[str]:
+        """Enter the object at the current position and yield its member keys.
+
+        The caller must consume each member's value before advancing.
+        """
+        if self._next_char() != "{":
+            raise self._error("Expecting '{'")
+        self._skip_whitespace()
+        if self._buf.startswith("}", self._pos):
+            self._pos += 1
+            return
+
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise self._error("Expecting property name enclosed in double quotes")
+            if self._next_char() != ":":
+                raise self._error("Expecting ':' delimiter")
+            yield key
+            delimiter = self._next_char()
+            if delimiter == "}":
+                return
+            if delimiter != ",":
+                raise self._error("Expecting ',' delimiter")
+
+
+def read_spec_header(stream: IO[Any]) -> dict[str, Any]:
+    """Read every top-level member of a spec except ``paths``.
+
+    Path items are decoded one at a time and dropped, so memory stays bounded
+    by the largest path item plus the component tables.
+    """
+    reader = JSONStreamReader(stream)
+    header: dict[str, Any] = {}
+    for key in reader.iter_object():
+        if key == "paths":
+            for _ in reader.iter_object():
+                reader.skip_value()
+        else:
+            header[key] = reader.read_value()
+    return header
+
+
+def iter_path_items(
+    stream: IO[Any],
+    select: Callable[[str], bool] | None = None,
+) -> Iterator[tuple[str, Any]]:
+    """Yield ``(path, path_item)`` pairs from a spec stream as they are read.
+
+    Args:
+        stream: Binary (UTF-8) or text stream positioned at the spec
+        select: Optional predicate on the path; path items it rejects are
+            skipped and never yielded
+    """
+    reader = JSONStreamReader(stream)
+    for key in reader.iter_object():
+        if key == "paths":
+            for path in reader.iter_object():
+                if select is None or select(path):
+                    yield path, reader.read_value()
+                else:
+                    reader.skip_value()
+        else:
+            reader.skip_value()
+
+
+def stream_spec(
+    open_stream: Callable[[], IO[Any]],
+    select: Callable[[str], bool] | None = None,
+) -> tuple[dict[str, Any], Iterator[tuple[str, Any]]]:
+    """Stream a JSON spec in two passes over a re-openable source.
+
+    The first pass collects the top-level tables (``info``, ``components``,
+    ``definitions``...) so ``$ref`` targets are known regardless of where
+    ``paths`` sits in the document; the second pass yields path items.
+
+    Args:
+        open_stream: Callable returning a fresh stream positioned at the start
+        select: Optional predicate on the path selecting the path items to yield
+
+    Returns:
+        The spec header (without ``paths``) and an iterator of path items
+    """
+    with open_stream() as stream:
+        header = read_spec_header(stream)
+
+    def _path_items() -> Iterator[tuple[str, Any]]:
+        with open_stream() as stream:
+            yield from iter_path_items(stream, select)
+
+    return header, _path_items()
+
+
+# Top-level members that operations built from path items depend on, by
+# dialect: the ref tables, and for Swagger 2.0 also the global defaults
+# (media types, security definitions) operations inherit
+HEADER_MEMBERS = {
+    "openapi": ("components",),
+    "swagger": ("definitions", "parameters", "responses", "consumes", "produces", "securityDefinitions"),
+}
+
+
+def stream_spec_once(
+    stream: IO[Any],
+    header_members: Mapping[str, tuple[str, ...]] = HEADER_MEMBERS,
+    select: Callable[[str], bool] | None = None,
+) -> tuple[dict[str, Any], Iterator[tuple[str, Any]]]:
+    """Stream a JSON spec in a single pass, for sources that cannot be reopened.
+
+    The returned header is filled in while the iterator is consumed. When
+    every member operations depend on comes before ``paths``
+    (``components``, or for Swagger 2.0 ``definitions``, ``parameters``,
+    ``responses``, ``consumes``, ``produces`` and ``securityDefinitions``),
+    path items are yielded as they are read; otherwise they are held until
+    the end of the input, so refs into tables that follow ``paths`` still
+    resolve and the defaults are complete. A Swagger 2.0 spec missing any
+    of those members is therefore held in full.
+
+    Args:
+        stream: Binary (UTF-8) or text stream positioned at the spec
+        header_members: Top-level members path items depend on, by dialect
+            (``"swagger"`` when the header has a ``swagger`` version,
+            ``"openapi"`` otherwise)
+        select: Optional predicate on the path selecting the path items to
+            yield; rejected path items are skipped, and never held
+
+    Returns:
+        The spec header (without ``paths``) and an iterator of path items
+    """
+    header: dict[str, Any] = {}
+
+    def _path_items() -> Iterator[tuple[str, Any]]:
+        reader = JSONStreamReader(stream)
+        held: list[tuple[str, Any]] = []
+        for key in reader.iter_object():
+            if key != "paths":
+                header[key] = reader.read_value()
+                continue
+            dialect = "swagger" if "swagger" in header else "openapi"
+            ready = all(member in header for member in header_members[dialect])
+            for path in reader.iter_object():
+                if select is not None and not select(path):
+                    reader.skip_value()
+                elif ready:
+                    yield path, reader.read_value()
+                else:
+                    held.append((path, reader.read_value()))
+        yield from held
+
+    return header, _path_items()
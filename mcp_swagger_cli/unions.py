@@ -0,0 +1,155 @@
+"""Union schemas (``oneOf``/``anyOf``) and their discriminator index.
+
+A union is kept as a list of variants, each dereferenced, rather than
+collapsed into one of them. When the schema has an OpenAPI 3 ``discriminator``
+object, a value → variant index is built up front, so picking the variant
+of an instance (:func:`select_variant`) is one dict lookup instead of trying
+every alternative.
+
+Discriminator values come from ``discriminator.mapping``, whose targets are
+refs (``#/components/schemas/Cat``) or bare schema names (``Cat``), and for
+``$ref`` variants that no mapping entry points to, from the name of the
+schema they reference (the implicit mapping of the specification). A
+mapping target that is not one of the listed variants is resolved and
+added as a variant of its own.
+
+The description of a union is built once per schema object and shared by
+every operation that uses it.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+# Composition keywords describing a union, in order of precedence
+UNION_KEYWORDS = ("oneOf", "anyOf")
+
+# Where bare schema names in a discriminator mapping point
+_SCHEMA_PREFIX = "#/components/schemas/"
+
+
+def _schema_name(ref: str) -> str:
+    return ref.rsplit("/", 1)[-1]
+
+
+class UnionIndex:
+    """Describe union schemas, caching descriptions by schema identity."""
+
+    def __init__(
+        self,
+        resolve: Callable[[dict[str, Any]], Any],
+        dereference: Callable[[Any], Any],
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            resolve: Resolves one ``{"$ref": ...}`` dict to its target,
+                returning the dict itself when the ref cannot be resolved
+            dereference: Dereferences a variant at any depth
+        """
+        self._resolve = resolve
+        self._dereference = dereference
+        # (schema, description) by schema id; the schema is kept so its id is
+        # not reused while the entry exists
+        self._unions: dict[int, tuple[dict[str, Any], dict[str, Any] | None]] = {}
+
+    def __call__(self, schema: Any) -> dict[str, Any] | None:
+        """Describe a union schema.
+
+        Args:
+            schema: A schema whose top-level ``$ref``, if any, is resolved;
+                its variants may still be refs
+
+        Returns:
+            None if the schema is not a union, else a dict with ``keyword``
+            (``"oneOf"`` or ``"anyOf"``), ``variants`` (the dereferenced
+            variant schemas) and ``discriminator`` (None, or a dict with the
+            ``property`` name and a ``mapping`` of values to variant indexes)
+        """
+        if not isinstance(schema, dict):
+            return None
+        cached = self._unions.get(id(schema))
+        if cached is not None:
+            return cached[1]
+        union = self._describe(schema)
+        self._unions[id(schema)] = (schema, union)
+        return union
+
+    def _describe(self, schema: dict[str, Any]) -> dict[str, Any] | None:
+        for keyword in UNION_KEYWORDS:
+            alternatives = schema.get(keyword)
+            if isinstance(alternatives, list) and alternatives:
+                break
+        else:
+            return None
+
+        variants = [self._dereference(alternative) for alternative in alternatives]
+        discriminator = schema.get("discriminator")
+        if isinstance(discriminator, dict) and isinstance(discriminator.get("propertyName"), str):
+            mapping = self._index(alternatives, variants, discriminator.get("mapping"))
+            discriminator = {"property": discriminator["propertyName"], "mapping": mapping}
+        else:
+            discriminator = None
+        return {"keyword": keyword, "variants": variants, "discriminator": discriminator}
+
+    def _index(
+        self, alternatives: list[Any], variants: list[Any], explicit: Any
+    ) -> dict[str, int]:
+        """Map discriminator values to indexes in ``variants`` (appended to as needed)."""
+        by_ref = {}
+        for position, alternative in enumerate(alternatives):
+            if isinstance(alternative, dict) and isinstance(alternative.get("$ref"), str):
+                by_ref.setdefault(alternative["$ref"], position)
+
+        mapping: dict[str, int] = {}
+        if isinstance(explicit, dict):
+            for value, target in explicit.items():
+                if not isinstance(target, str):
+                    continue
+                ref = target if "#" in target or "/" in target else _SCHEMA_PREFIX + target
+                position = by_ref.get(ref)
+                if position is None:
+                    variant = self._resolve({"$ref": ref})
+                    if not isinstance(variant, dict) or "$ref" in variant:
+                        continue
+                    position = by_ref[ref] = len(variants)
+                    variants.append(self._dereference(variant))
+                mapping[str(value)] = position
+
+        mapped = set(mapping.values())
+        for ref, position in by_ref.items():
+            if position not in mapped:
+                mapping.setdefault(_schema_name(ref), position)
+        return mapping
+
+
+def union_type(union: dict[str, Any]) -> str | None:
+    """Get the JSON type shared by every variant of a union, if there is one.
+
+    ``"null"`` variants are ignored, so a nullable string is a string.
+    """
+    types = {
+        variant.get("type") if isinstance(variant, dict) and isinstance(variant.get("type"), str) else None
+        for variant in union["variants"]
+    }
+    types.discard("null")
+    if len(types) == 1:
+        (shared,) = types
+        return shared
+    return None
+
+
+def select_variant(union: dict[str, Any], instance: Any) -> Any | None:
+    """Pick the variant of a union an instance belongs to, by its discriminator.
+
+    Returns:
+        The variant schema, or None if the union has no discriminator or the
+        instance's discriminator value is not mapped
+    """
+    discriminator = union.get("discriminator")
+    if discriminator is None or not isinstance(instance, dict):
+        return None
+    value = instance.get(discriminator["property"])
+    position = discriminator["mapping"].get(value) if isinstance(value, str) else None
+    if position is None:
+        return None
+    return union["variants"][position]
@@ -0,0 +1,111 @@
+"""Shared fixtures for the test suite."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+
+class SpecRequestHandler(BaseHTTPRequestHandler):
+    """Serves a JSON spec with an ETag and honours If-None-Match.
+
+    ``documents`` maps request paths to documents served instead of ``spec``.
+    Connections are kept alive (HTTP/1.1); ``client_ports`` records the
+    client port of each request, so connection reuse can be checked.
+    ``Range`` requests are honoured (with ``If-Range``) unless
+    ``accept_ranges`` is off, and ``drop_after`` cuts the next body off after
+    that many bytes to simulate a dropped transfer. ``range_start``, when
+    set, makes a misbehaving server answer any ``Range`` request from that
+    offset instead of the one asked for.
+
+    Class attributes hold the served spec and per-test bookkeeping; the
+    ``spec_server`` fixture resets them.
+    """
+
+    protocol_version = "HTTP/1.1"
+    spec: dict[str, Any] = {}
+    documents: dict[str, Any] = {}
+    etag = '"v1"'
+    delay = 0.0
+    accept_ranges = True
+    drop_after: int | None = None
+    range_start: int | None = None
+    requests: list[dict[str, str]] = []
+    paths: list[str] = []
+    client_ports: list[int] = []
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        cls = type(self)
+        with cls.lock:
+            cls.requests.append(dict(self.headers))
+            cls.paths.append(self.path)
+            cls.client_ports.append(self.client_address[1])
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            time.sleep(cls.delay)
+            if self.headers.get("If-None-Match") == cls.etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = json.dumps(cls.documents.get(self.path, cls.spec)).encode()
+            start = 0
+            range_header = self.headers.get("Range", "")
+            if (
+                cls.accept_ranges
+                and range_header.startswith("bytes=")
+                and self.headers.get("If-Range", cls.etag) == cls.etag
+            ):
+                start = int(range_header[len("bytes="):].split("-")[0])
+                if cls.range_start is not None:
+                    start = cls.range_start
+            self.send_response(206 if start else 200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("ETag", cls.etag)
+            if cls.accept_ranges:
+                self.send_header("Accept-Ranges", "bytes")
+            if start:
+                self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+            self.send_header("Content-Length", str(len(body) - start))
+            self.end_headers()
+            payload = body[start:]
+            if cls.drop_after is not None:
+                payload = payload[:cls.drop_after]
+                cls.drop_after = None
+                self.close_connection = True
+            self.wfile.write(payload)
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def spec_server():
+    """Run a local stand-in HTTP server for spec fetches; yields its base URL."""
+    SpecRequestHandler.spec = {}
+    SpecRequestHandler.documents = {}
+    SpecRequestHandler.etag = '"v1"'
+    SpecRequestHandler.delay = 0.0
+    SpecRequestHandler.accept_ranges = True
+    SpecRequestHandler.drop_after = None
+    SpecRequestHandler.range_start = None
+    SpecRequestHandler.requests = []
+    SpecRequestHandler.paths = []
+    SpecRequestHandler.client_ports = []
+    SpecRequestHandler.in_flight = 0
+    SpecRequestHandler.max_in_flight = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SpecRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,149 @@
+"""Tests for the cache module."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from mcp_swagger_cli.cache import HTTPCache, SpecCache, spec_digest
+from mcp_swagger_cli.parser import OpenAPIParser
+
+from tests.conftest import SpecRequestHandler
+
+
+SAMPLE_SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Cached API", "version": "1.0.0"},
+    "paths": {
+        "/items": {
+            "get": {
+                "operationId": "listItems",
+                "responses": {"200": {"description": "OK"}},
+            },
+        },
+    },
+}
+
+
+class TestSpecCache:
+    """Tests for SpecCache class."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test storing and loading a parsed spec."""
+        cache = SpecCache(tmp_path)
+        key = spec_digest(b"spec")
+
+        assert cache.get(key) is None
+        cache.put(key, SAMPLE_SPEC)
+
+        assert cache.get(key) == SAMPLE_SPEC
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        """Test that an unreadable entry is dropped instead of raising."""
+        cache = SpecCache(tmp_path)
+        key = spec_digest(b"spec")
+        (tmp_path / f"{key}.pickle").write_bytes(b"not a pickle")
+
+        assert cache.get(key) is None
+        assert not (tmp_path / f"{key}.pickle").exists()
+
+    def test_lru_eviction(self, tmp_path: Path) -> None:
+        """Test that least recently used entries are evicted past max_bytes."""
+        cache = SpecCache(tmp_path)
+        cache.put("a", "x" * 1000)
+        cache.put("b", "y" * 1000)
+        entry_size = (tmp_path / "a.pickle").stat().st_size
+
+        # Make "a" older than "b", then touch it via a hit so "b" is the LRU
+        os.utime(tmp_path / "a.pickle", (1, 1))
+        os.utime(tmp_path / "b.pickle", (2, 2))
+        assert cache.get("a") is not None
+
+        cache.max_bytes = entry_size * 2
+        cache.put("c", "z" * 1000)
+
+        assert (tmp_path / "a.pickle").exists()
+        assert not (tmp_path / "b.pickle").exists()
+        assert (tmp_path / "c.pickle").exists()
+
+
+class TestParserCache:
+    """Tests for OpenAPIParser integration with SpecCache."""
+
+    def test_warm_load_skips_parsing(self, tmp_path: Path) -> None:
+        """Test that a cached spec is returned without decoding YAML again."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(yaml.dump(SAMPLE_SPEC))
+        cache = SpecCache(tmp_path / "cache")
+
+        cold = OpenAPIParser(str(spec_file), validate=False, cache=cache)
+
+        with patch("mcp_swagger_cli.parser._load_yaml", side_effect=AssertionError):
+            warm = OpenAPIParser(str(spec_file), validate=False, cache=cache)
+
+        assert warm.spec == cold.spec
+        assert warm.get_operations()[0]["operation_id"] == "listItems"
+
+    def test_changed_spec_is_reparsed(self, tmp_path: Path) -> None:
+        """Test that editing the spec changes its cache key."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SAMPLE_SPEC))
+        cache = SpecCache(tmp_path / "cache")
+        OpenAPIParser(str(spec_file), validate=False, cache=cache)
+
+        changed = {**SAMPLE_SPEC, "info": {"title": "Changed", "version": "2.0.0"}}
+        spec_file.write_text(json.dumps(changed))
+        parser = OpenAPIParser(str(spec_file), validate=False, cache=cache)
+
+        assert parser.spec["info"]["title"] == "Changed"
+        assert len(list((tmp_path / "cache").glob("*.pickle"))) == 2
+
+    def test_no_cache_by_default(self, tmp_path: Path) -> None:
+        """Test that the parser does not touch a cache unless given one."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SAMPLE_SPEC))
+
+        with patch.object(SpecCache, "put", side_effect=AssertionError):
+            parser = OpenAPIParser(str(spec_file), validate=False)
+
+        assert parser.cache is None
+
+
+class TestHTTPCache:
+    """Tests for HTTP revalidation of URL-sourced specs."""
+
+    def test_revalidates_with_etag(self, spec_server: str, tmp_path: Path) -> None:
+        """Test that a second fetch is conditional and reuses the body on 304."""
+        SpecRequestHandler.spec = SAMPLE_SPEC
+        url = f"{spec_server}/openapi.json"
+        http_cache = HTTPCache(tmp_path)
+
+        first = OpenAPIParser(url, validate=False, http_cache=http_cache)
+        second = OpenAPIParser(url, validate=False, http_cache=http_cache)
+
+        assert second.spec == first.spec == SAMPLE_SPEC
+        assert "If-None-Match" not in SpecRequestHandler.requests[0]
+        assert SpecRequestHandler.requests[1]["If-None-Match"] == '"v1"'
+
+    def test_changed_etag_refreshes_body(self, spec_server: str, tmp_path: Path) -> None:
+        """Test that a 200 response replaces the stored body and validators."""
+        SpecRequestHandler.spec = SAMPLE_SPEC
+        url = f"{spec_server}/openapi.json"
+        http_cache = HTTPCache(tmp_path)
+        OpenAPIParser(url, validate=False, http_cache=http_cache)
+
+        SpecRequestHandler.etag = '"v2"'
+        OpenAPIParser(url, validate=False, http_cache=http_cache)
+
+        body, meta = http_cache.get(url)
+        assert json.loads(body) == SAMPLE_SPEC
+        assert meta["etag"] == '"v2"'
+
+    def test_response_without_validators_is_not_stored(self, tmp_path: Path) -> None:
+        """Test that responses without ETag/Last-Modified are not cached."""
+        http_cache = HTTPCache(tmp_path)
+        http_cache.put("https://example.com/spec.json", b"{}", {})
+
+        assert http_cache.get("https://example.com/spec.json") is None
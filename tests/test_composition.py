@@ -0,0 +1,123 @@
+"""Tests for allOf flattening."""
+
+import json
+from pathlib import Path
+
+from mcp_swagger_cli.composition import AllOfMerger
+from mcp_swagger_cli.parser import OpenAPIParser
+
+BASE = {
+    "type": "object",
+    "description": "Base",
+    "required": ["id"],
+    "properties": {"id": {"type": "string"}, "name": {"type": "string"}},
+}
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Composed", "version": "1.0.0"},
+    "paths": {
+        f"/things{i}": {
+            "post": {
+                "operationId": f"createThing{i}",
+                "requestBody": {
+                    "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Thing"}}},
+                },
+                "responses": {},
+            },
+        }
+        for i in range(3)
+    },
+    "components": {
+        "schemas": {
+            "Base": BASE,
+            "Named": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Base"},
+                    {"required": ["name"], "properties": {"name": {"maxLength": 10}}},
+                ],
+            },
+            "Thing": {
+                "description": "A thing",
+                "allOf": [
+                    {"$ref": "#/components/schemas/Named"},
+                    {"properties": {"size": {"type": "integer"}}},
+                ],
+            },
+            "Node": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Base"},
+                    {"properties": {"child": {"$ref": "#/components/schemas/Node"}}},
+                ],
+            },
+            "Loop": {"allOf": [{"$ref": "#/components/schemas/Loop"}]},
+        },
+    },
+}
+
+
+class TestAllOfMerger:
+    """Tests for merging components."""
+
+    def test_properties_and_required_combined(self) -> None:
+        """Test that properties and required are united and other keywords come first-wins."""
+        merged = AllOfMerger()({
+            "allOf": [BASE, {"type": "string", "required": ["name", "id"], "properties": {"age": {}}}],
+        })
+
+        assert merged["type"] == "object"
+        assert merged["required"] == ["id", "name"]
+        assert list(merged["properties"]) == ["id", "name", "age"]
+        assert "allOf" not in merged
+        assert BASE["required"] == ["id"]
+
+    def test_siblings_override_and_cache(self) -> None:
+        """Test that keywords next to allOf win and merges are cached by component identity."""
+        merger = AllOfMerger()
+        extra = {"properties": {"age": {"type": "integer"}}}
+
+        first = merger({"allOf": [BASE, extra]})
+        second = merger({"allOf": [BASE, extra], "description": "Override"})
+
+        assert merger({"allOf": [BASE, extra]}) is first
+        assert second["description"] == "Override"
+        assert second["properties"] == first["properties"]
+        assert first["description"] == "Base"
+
+    def test_unresolved_component_left_alone(self) -> None:
+        """Test that an allOf with a remaining $ref is not flattened."""
+        schema = {"allOf": [BASE, {"$ref": "#/components/schemas/Missing"}]}
+
+        assert AllOfMerger()(schema) is schema
+
+
+class TestParserComposition:
+    """Tests for allOf flattening in OpenAPIParser."""
+
+    def test_nested_allof_flattened_once(self, tmp_path: Path) -> None:
+        """Test that bodies and schema entries get the flattened schema, shared across operations."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SPEC))
+        parser = OpenAPIParser(str(spec_file), validate=False)
+
+        bodies = [op["request_body"]["schema"] for op in parser.get_operations()]
+        schemas = parser.get_schemas()
+
+        thing = bodies[0]
+        assert all(body is thing for body in bodies)
+        assert schemas["Thing"] is thing
+        assert thing["description"] == "A thing"
+        assert thing["required"] == ["id", "name"]
+        assert thing["properties"]["name"] == {"type": "string", "maxLength": 10}
+        assert list(thing["properties"]) == ["id", "name", "size"]
+
+    def test_cycles_left_composed(self, tmp_path: Path) -> None:
+        """Test that recursive allOf schemas are flattened up to the back-reference."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SPEC))
+
+        schemas = OpenAPIParser(str(spec_file), validate=False).get_schemas()
+
+        assert schemas["Node"]["properties"]["child"] == {"$ref": "#/components/schemas/Node"}
+        assert schemas["Node"]["required"] == ["id"]
+        json.dumps(schemas)
@@ -0,0 +1,113 @@
+"""Tests for the compression module."""
+
+import bz2
+import gzip
+import json
+import lzma
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+import yaml
+
+from mcp_swagger_cli import compression
+from mcp_swagger_cli.compression import detect_compression
+from mcp_swagger_cli.exceptions import SpecParseError
+from mcp_swagger_cli.parser import OpenAPIParser
+
+from tests.test_parser import SAMPLE_OPENAPI_30
+
+
+class TestCompressionDetection:
+    """Tests for codec and format detection helpers."""
+
+    def test_detect_compression_by_magic(self) -> None:
+        """Test that each codec is recognized from its leading bytes."""
+        assert detect_compression(gzip.compress(b"{}")) == "gzip"
+        assert detect_compression(bz2.compress(b"{}")) == "bz2"
+        assert detect_compression(lzma.compress(b"{}")) == "xz"
+        assert detect_compression(b"\x28\xb5\x2f\xfd\x00") == "zstd"
+        assert detect_compression(b'{"openapi": "3.0.0"}') is None
+
+
+class TestCompressedSpecs:
+    """Tests for loading compressed specs through OpenAPIParser."""
+
+    @pytest.mark.parametrize(
+        ("name", "compress"),
+        [
+            ("openapi.json.gz", gzip.compress),
+            ("openapi.json.bz2", bz2.compress),
+            ("openapi.json.xz", lzma.compress),
+        ],
+    )
+    def test_compressed_json_file(self, tmp_path: Path, name: str, compress) -> None:
+        """Test loading compressed JSON files."""
+        spec_file = tmp_path / name
+        spec_file.write_bytes(compress(json.dumps(SAMPLE_OPENAPI_30).encode()))
+
+        parser = OpenAPIParser(str(spec_file), validate=False)
+
+        assert parser.spec == SAMPLE_OPENAPI_30
+
+    def test_compressed_yaml_file(self, tmp_path: Path) -> None:
+        """Test that the format is taken from the suffix under the compression suffix."""
+        spec_file = tmp_path / "openapi.yaml.bz2"
+        spec_file.write_bytes(bz2.compress(yaml.dump(SAMPLE_OPENAPI_30).encode()))
+
+        parser = OpenAPIParser(str(spec_file), validate=False)
+
+        assert parser.spec["info"]["title"] == "Test API"
+
+    def test_mislabeled_compressed_file(self, tmp_path: Path) -> None:
+        """Test that compression is detected by magic bytes, not by suffix."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_bytes(gzip.compress(json.dumps(SAMPLE_OPENAPI_30).encode()))
+
+        parser = OpenAPIParser(str(spec_file), validate=False, memory_map=True)
+
+        assert parser.spec == SAMPLE_OPENAPI_30
+
+    def test_compressed_file_streaming(self, tmp_path: Path) -> None:
+        """Test that streaming mode decompresses on the fly."""
+        spec_file = tmp_path / "openapi.json.gz"
+        spec_file.write_bytes(gzip.compress(json.dumps(SAMPLE_OPENAPI_30).encode()))
+
+        parser = OpenAPIParser(str(spec_file), validate=False, streaming=True)
+
+        assert len(parser.get_operations()) == 3
+
+    def test_corrupt_compressed_file(self, tmp_path: Path) -> None:
+        """Test that truncated compressed input raises SpecParseError."""
+        spec_file = tmp_path / "openapi.json.gz"
+        spec_file.write_bytes(gzip.compress(json.dumps(SAMPLE_OPENAPI_30).encode())[:40])
+
+        with pytest.raises(SpecParseError):
+            OpenAPIParser(str(spec_file), validate=False)
+
+    def test_zstd_without_zstandard(self, tmp_path: Path) -> None:
+        """Test that zstd input without the optional package gives a clear error."""
+        spec_file = tmp_path / "openapi.json.zst"
+        spec_file.write_bytes(b"\x28\xb5\x2f\xfd" + b"\x00" * 16)
+
+        with patch.object(compression, "zstandard", None):
+            with pytest.raises(SpecParseError, match="zstandard"):
+                OpenAPIParser(str(spec_file), validate=False)
+
+    def test_compressed_url_body(self) -> None:
+        """Test that a compressed body without Content-Encoding is decompressed."""
+        body = gzip.compress(yaml.dump(SAMPLE_OPENAPI_30).encode())
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(
+                200, content=body, headers={"content-type": "application/gzip"}
+            )
+        )
+
+        with patch(
+            "mcp_swagger_cli.parser.get_http_client",
+            return_value=httpx.Client(transport=transport),
+        ):
+            parser = OpenAPIParser("https://example.com/openapi.yaml.gz", validate=False)
+
+        assert parser.spec["info"]["title"] == "Test API"
@@ -0,0 +1,164 @@
+"""Tests for hash-consing of structurally identical schemas."""
+
+import copy
+import json
+from pathlib import Path
+from typing import Any
+
+from mcp_swagger_cli.consing import HashConser
+from mcp_swagger_cli.generator import MCPServerGenerator
+from mcp_swagger_cli.parser import OpenAPIParser
+
+ERROR = {"type": "object", "properties": {"code": {"type": "integer"}, "message": {"type": "string"}}}
+
+
+def module_schemas(source: str) -> dict[str, Any]:
+    """Evaluate the schema definitions of a generated main.py."""
+    lines = [line for line in source.splitlines() if line.startswith(("_SCHEMA_", "_ALL_SCHEMAS"))]
+    namespace: dict[str, Any] = {"Any": Any}
+    exec("\n".join(lines), namespace)
+    return namespace["_ALL_SCHEMAS"]
+
+
+def _spec(operations: int) -> dict[str, Any]:
+    paths = {}
+    for i in range(operations):
+        paths[f"/items{i}"] = {
+            "get": {
+                "operationId": f"getItems{i}",
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {"application/json": {"schema": {
+                            "type": "object",
+                            "properties": {"next": {"type": "string"}, "items": {"type": "array"}},
+                        }}},
+                    },
+                    "default": {
+                        "description": "Error",
+                        "content": {"application/json": {"schema": copy.deepcopy(ERROR)}},
+                    },
+                },
+            }
+        }
+    return {"openapi": "3.0.3", "info": {"title": "Items", "version": "1.0.0"}, "paths": paths}
+
+
+class TestHashConser:
+    """Tests for sharing identical subtrees."""
+
+    def test_identical_subtrees_shared(self) -> None:
+        """Test that equal dicts and lists become one instance, in place."""
+        tree = [copy.deepcopy(ERROR), copy.deepcopy(ERROR), {"wrapped": copy.deepcopy(ERROR)}]
+        conser = HashConser()
+
+        first, second, wrapper = conser(tree)
+        assert first is second is wrapper["wrapped"]
+        assert first["properties"]["code"] is conser({"type": "integer"})
+        assert tree == [ERROR, ERROR, {"wrapped": ERROR}]
+
+    def test_distinct_structures_kept_apart(self) -> None:
+        """Test that scalar types and key order distinguish structures."""
+        conser = HashConser()
+        values = [{"a": 1}, {"a": 1.0}, {"a": True}, {"a": "1"}, {"a": 1, "b": 2}, {"b": 2, "a": 1}]
+
+        shared = [conser(value) for value in values]
+        assert len({id(value) for value in shared}) == len(values)
+        assert conser([1, 2]) is not conser([2, 1])
+
+    def test_shared_instances_not_rewalked(self) -> None:
+        """Test that consing a shared instance again returns it as is."""
+        conser = HashConser()
+        shared = conser(copy.deepcopy(ERROR))
+        size = len(conser)
+
+        assert conser(shared) is shared
+        assert conser(copy.deepcopy(ERROR)) is shared
+        assert len(conser) == size
+
+
+class TestSharedSchemas:
+    """Tests for sharing in operation records and generated servers."""
+
+    def test_parser_records_share_schemas(self, tmp_path: Path) -> None:
+        """Test that identical inline schemas of different operations are one object."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(_spec(3)))
+
+        shared = OpenAPIParser(str(spec_file), validate=False, share_schemas=True).get_operations()
+        plain = OpenAPIParser(str(spec_file), validate=False).get_operations()
+
+        assert shared == plain
+        errors = [operation["responses"]["default"]["schema"] for operation in shared]
+        assert errors[0] is errors[1] is errors[2]
+        assert plain[0]["responses"]["default"]["schema"] is not plain[1]["responses"]["default"]["schema"]
+
+    def test_parser_spec_unchanged(self, tmp_path: Path) -> None:
+        """Test that sharing leaves the spec and resolved schemas untouched."""
+        spec = _spec(3)
+        spec["components"] = {"schemas": {"Error": copy.deepcopy(ERROR)}}
+        for i in range(3):
+            spec["paths"][f"/items{i}"]["get"]["responses"]["404"] = {
+                "description": "Missing",
+                "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Error"}}},
+            }
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(spec))
+
+        parser = OpenAPIParser(str(spec_file), validate=False, share_schemas=True)
+        operations = parser.get_operations()
+        paths = parser.spec["paths"]
+        inline = [paths[f"/items{i}"]["get"]["responses"]["default"] for i in range(3)]
+        records = [operation["responses"]["default"]["schema"] for operation in operations]
+
+        assert parser.spec == spec
+        assert parser.get_schemas() == spec["components"]["schemas"]
+        assert records[0] is records[1]
+        # The shared instance is a copy, not a node of the spec
+        assert all(
+            response["content"]["application/json"]["schema"] is not records[0] for response in inline
+        )
+        assert inline[0]["content"] is not inline[1]["content"]
+
+    def test_shared_python_values(self) -> None:
+        """Test that large repeated parts are rendered once, before their users."""
+        value = {"A": copy.deepcopy(ERROR), "B": {"error": copy.deepcopy(ERROR)}, "C": {"type": "integer"}}
+
+        constants, literal = MCPServerGenerator._to_shared_python_values(value, "_S", cons=True)
+        # {"type": "integer"} occurs three times but is too small to name
+        assert constants == [("_S0", repr(ERROR))]
+        assert literal == "{'A': _S0, 'B': {'error': _S0}, 'C': {'type': 'integer'}}"
+        # Consing works on a copy
+        assert value["A"] is not value["B"]["error"]
+
+        namespace: dict[str, Any] = {}
+        for name, constant in constants:
+            namespace[name] = eval(constant, namespace)
+        assert eval(literal, namespace) == value
+
+    def test_shared_python_values_by_identity(self) -> None:
+        """Test that without consing only parts held more than once are named."""
+        shared = copy.deepcopy(ERROR)
+        value = {"A": shared, "B": {"error": shared}, "C": copy.deepcopy(ERROR)}
+
+        constants, literal = MCPServerGenerator._to_shared_python_values(value, "_S")
+        assert [name for name, _ in constants] == ["_S0"]
+        assert literal.startswith("{'A': _S0, 'B': {'error': _S0}, 'C': {'type': 'object'")
+
+    def test_generated_module_defines_schemas_once(self, tmp_path: Path) -> None:
+        """Test that a shared schema is written once into the generated server."""
+        spec = _spec(1)
+        spec["components"] = {
+            "schemas": {f"Error{i}": copy.deepcopy(ERROR) for i in range(50)},
+        }
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(spec))
+
+        MCPServerGenerator(
+            str(spec_file), server_name="items", validate=False, share_schemas=True
+        ).generate(tmp_path / "out")
+
+        source = (tmp_path / "out" / "items" / "main.py").read_text()
+        compile(source, "main.py", "exec")
+        assert source.count("'message'") == 1
+        assert module_schemas(source) == spec["components"]["schemas"]
@@ -0,0 +1,189 @@
+"""Tests for deep, memoized dereferencing."""
+
+import json
+from pathlib import Path
+
+from mcp_swagger_cli.dereference import Dereferencer
+from mcp_swagger_cli.generator import MCPServerGenerator
+from mcp_swagger_cli.parser import OpenAPIParser
+from mcp_swagger_cli.refs import PointerIndex
+
+from tests.test_consing import module_schemas
+
+SCHEMAS = {
+    "Tag": {"type": "string"},
+    "Pet": {
+        "type": "object",
+        "properties": {
+            "tags": {"type": "array", "items": {"$ref": "#/components/schemas/Tag"}},
+            "extra": {"type": "object", "additionalProperties": {"$ref": "#/components/schemas/Tag"}},
+            "owner": {"$ref": "#/components/schemas/Owner"},
+        },
+    },
+    "Owner": {"type": "object", "properties": {"pets": {"type": "array", "items": {"$ref": "#/components/schemas/Pet"}}}},
+}
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "Pets", "version": "1.0.0"},
+    "paths": {
+        "/pets": {
+            "post": {
+                "operationId": "createPet",
+                "requestBody": {
+                    "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Pet"}}},
+                },
+                "responses": {},
+            },
+        },
+    },
+    "components": {"schemas": SCHEMAS},
+}
+
+
+def _dereferencer(spec: dict) -> Dereferencer:
+    index = PointerIndex(spec)
+
+    def resolve(node: dict) -> dict:
+        try:
+            return index.resolve(node["$ref"][1:])
+        except KeyError:
+            return node
+
+    return Dereferencer(resolve)
+
+
+class TestDereferencer:
+    """Tests for the dereferencing walk."""
+
+    def test_nested_refs_replaced_and_shared(self) -> None:
+        """Test that refs under properties, items and additionalProperties are replaced."""
+        pet = _dereferencer(SPEC)(SCHEMAS["Pet"])
+
+        properties = pet["properties"]
+        assert properties["tags"]["items"] == {"type": "string"}
+        assert properties["extra"]["additionalProperties"] is properties["tags"]["items"]
+        assert properties["owner"]["properties"]["pets"]["items"] == {"$ref": "#/components/schemas/Pet"}
+
+    def test_cycles_become_back_references(self) -> None:
+        """Test that a recursive schema dereferences to a finite, serializable tree."""
+        dereference = _dereferencer(SPEC)
+
+        owner = dereference({"$ref": "#/components/schemas/Owner"})
+
+        json.dumps(owner)
+        pet = owner["properties"]["pets"]["items"]
+        assert pet["properties"]["owner"] == {"$ref": "#/components/schemas/Owner"}
+        assert dereference({"$ref": "#/components/schemas/Pet"}) is pet
+
+    def test_untouched_containers_not_copied(self) -> None:
+        """Test that containers without refs below them come back as they are."""
+        schema = {"type": "object", "properties": {"a": {"type": "string"}}}
+
+        assert _dereferencer(SPEC)(schema) is schema
+        assert SCHEMAS["Pet"]["properties"]["tags"]["items"] == {"$ref": "#/components/schemas/Tag"}
+
+    def test_unresolvable_ref_kept(self) -> None:
+        """Test that refs that do not resolve stay as they are."""
+        schema = {"items": {"$ref": "#/components/schemas/Missing"}}
+
+        assert _dereferencer(SPEC)(schema) is schema
+
+    def test_depth_limit(self) -> None:
+        """Test that refs below the configured depth are kept as they are."""
+        dereference = _dereferencer(SPEC)
+        limited = Dereferencer(dereference._resolve, max_depth=1)
+        top = {"$ref": "#/components/schemas/Pet"}
+
+        pet = limited(top)
+
+        assert pet["type"] == "object"
+        assert pet["properties"]["owner"] == {"$ref": "#/components/schemas/Owner"}
+        assert Dereferencer(dereference._resolve, max_depth=0)(top) is top
+        two_levels = Dereferencer(dereference._resolve, max_depth=2)(top)
+        assert two_levels["properties"]["owner"]["properties"]["pets"]["items"] == {
+            "$ref": "#/components/schemas/Pet"
+        }
+        assert two_levels["properties"]["tags"]["items"] == {"type": "string"}
+
+    def test_each_target_resolved_once(self) -> None:
+        """Test that a schema used 500 times is resolved once."""
+        resolved = []
+        resolve = _dereferencer(SPEC)._resolve
+        dereference = Dereferencer(lambda node: resolved.append(node["$ref"]) or resolve(node))
+        referrers = [{"items": {"$ref": "#/components/schemas/Tag"}} for _ in range(500)]
+
+        results = [dereference(referrer) for referrer in referrers]
+
+        assert resolved == ["#/components/schemas/Tag"]
+        assert all(result["items"] is results[0]["items"] for result in results)
+
+    def test_linear_in_refs(self) -> None:
+        """Test that tens of thousands of refs into a web of schemas resolve each target once."""
+        count = 5000
+        schemas = {
+            f"S{i}": {
+                "type": "object",
+                "properties": {
+                    "left": {"$ref": f"#/components/schemas/S{2 * i + 1}"},
+                    "right": {"type": "array", "items": {"$ref": f"#/components/schemas/S{2 * i + 2}"}},
+                },
+            }
+            for i in range(count)
+        }
+        schemas.update({f"S{i}": {"type": "string"} for i in range(count, 2 * count + 1)})
+        referrers = [{"items": {"$ref": f"#/components/schemas/S{i % count}"}} for i in range(50000)]
+        resolved = []
+        resolve = _dereferencer({"components": {"schemas": schemas}})._resolve
+        dereference = Dereferencer(lambda node: resolved.append(node["$ref"]) or resolve(node))
+
+        results = [dereference(referrer) for referrer in referrers]
+
+        assert results[0]["items"] is results[count]["items"]
+        assert results[0]["items"]["properties"]["left"] is results[1]["items"]
+        # Every schema is resolved and walked once, however many refs reach it
+        assert len(resolved) == len(set(resolved)) == len(schemas)
+        assert len(dereference._refs) == len(dereference._targets) == len(schemas)
+
+
+class TestParserDereferencing:
+    """Tests for deep dereferencing in OpenAPIParser and the generator."""
+
+    def test_request_body_and_schemas_complete(self, tmp_path: Path) -> None:
+        """Test that request bodies and get_schemas carry no resolvable nested refs."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SPEC))
+        parser = OpenAPIParser(str(spec_file), validate=False)
+
+        body = parser.get_operations()[0]["request_body"]["schema"]
+        schemas = parser.get_schemas()
+
+        assert body["properties"]["tags"]["items"] == {"type": "string"}
+        assert schemas["Pet"] is body
+        assert schemas["Owner"] is body["properties"]["owner"]
+        assert schemas["Owner"]["properties"]["pets"]["items"] == {"$ref": "#/components/schemas/Pet"}
+
+    def test_ref_depth_option(self, tmp_path: Path) -> None:
+        """Test that ref_depth=1 resolves only the top-level ref, as before."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SPEC))
+
+        parser = OpenAPIParser(str(spec_file), validate=False, ref_depth=1)
+
+        body = parser.get_operations()[0]["request_body"]["schema"]
+        assert body["properties"] == SCHEMAS["Pet"]["properties"]
+        assert parser.get_schemas()["Pet"]["properties"]["owner"]["properties"] == SCHEMAS["Owner"]["properties"]
+
+    def test_recursive_spec_generates(self, tmp_path: Path) -> None:
+        """Test that a server is generated from a recursive spec and compiles."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SPEC))
+
+        generator = MCPServerGenerator(str(spec_file), server_name="pets", validate=False)
+        generator.generate(tmp_path / "out")
+
+        source = (tmp_path / "out" / "pets" / "main.py").read_text()
+        compile(source, "main.py", "exec")
+        schemas = module_schemas(source)
+        assert schemas["Pet"]["properties"]["extra"]["additionalProperties"] == {"type": "string"}
+        assert schemas["Owner"]["properties"]["pets"]["items"] == {"$ref": "#/components/schemas/Pet"}
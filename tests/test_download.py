@@ -0,0 +1,125 @@
+"""Tests for streamed, resumable spec downloads."""
+
+import hashlib
+import json
+
+import httpx
+import pytest
+
+from mcp_swagger_cli.cache import SpecCache
+from mcp_swagger_cli.download import download
+from mcp_swagger_cli.parser import OpenAPIParser
+
+from tests.conftest import SpecRequestHandler
+from tests.test_parser import SAMPLE_OPENAPI_30
+
+
+@pytest.fixture
+def client():
+    """A fresh HTTP client, so every test starts on a new connection."""
+    with httpx.Client(timeout=10.0) as client:
+        yield client
+
+
+def _served_body() -> bytes:
+    return json.dumps(SpecRequestHandler.spec).encode()
+
+
+class TestDownload:
+    """Tests for the download helper."""
+
+    def test_body_spooled_and_hashed(self, spec_server: str, client: httpx.Client) -> None:
+        """Test that the body lands in the spool file with its digest."""
+        SpecRequestHandler.spec = SAMPLE_OPENAPI_30
+        body = _served_body()
+
+        with download(client, f"{spec_server}/openapi.json") as fetched:
+            assert fetched.response.status_code == 200
+            assert fetched.file.read() == body
+            assert fetched.size == len(body)
+            assert fetched.digest == hashlib.sha256(body).hexdigest()
+            assert fetched.resumes == 0
+
+    def test_interrupted_transfer_resumed_with_range(
+        self, spec_server: str, client: httpx.Client
+    ) -> None:
+        """Test that a dropped transfer continues from the received offset."""
+        SpecRequestHandler.spec = SAMPLE_OPENAPI_30
+        SpecRequestHandler.drop_after = 100
+        body = _served_body()
+
+        with download(client, f"{spec_server}/openapi.json") as fetched:
+            assert fetched.file.read() == body
+            assert fetched.digest == hashlib.sha256(body).hexdigest()
+            assert fetched.resumes == 1
+
+        resume_headers = {k.lower(): v for k, v in SpecRequestHandler.requests[1].items()}
+        assert resume_headers["range"] == "bytes=100-"
+        assert resume_headers["if-range"] == SpecRequestHandler.etag
+
+    def test_mismatched_range_refetched_in_full(
+        self, spec_server: str, client: httpx.Client
+    ) -> None:
+        """Test that a 206 for another range than asked is not taken as the body."""
+        SpecRequestHandler.spec = SAMPLE_OPENAPI_30
+        SpecRequestHandler.drop_after = 100
+        SpecRequestHandler.range_start = 10
+        body = _served_body()
+
+        with download(client, f"{spec_server}/openapi.json") as fetched:
+            assert fetched.file.read() == body
+            assert fetched.digest == hashlib.sha256(body).hexdigest()
+            assert fetched.resumes == 1
+
+        refetch_headers = {k.lower() for k in SpecRequestHandler.requests[2]}
+        assert len(SpecRequestHandler.requests) == 3
+        assert "range" not in refetch_headers and "if-range" not in refetch_headers
+
+    def test_interrupted_transfer_without_ranges_fails(
+        self, spec_server: str, client: httpx.Client
+    ) -> None:
+        """Test that a dropped transfer is not resumed when ranges are unsupported."""
+        SpecRequestHandler.spec = SAMPLE_OPENAPI_30
+        SpecRequestHandler.accept_ranges = False
+        SpecRequestHandler.drop_after = 100
+
+        with pytest.raises(httpx.TransportError):
+            download(client, f"{spec_server}/openapi.json")
+
+        assert len(SpecRequestHandler.requests) == 1
+
+    def test_error_status_returned_without_body(
+        self, spec_server: str, client: httpx.Client
+    ) -> None:
+        """Test that a 304 is handed back for the caller to handle."""
+        SpecRequestHandler.spec = SAMPLE_OPENAPI_30
+
+        with download(
+            client, f"{spec_server}/openapi.json", {"If-None-Match": SpecRequestHandler.etag}
+        ) as fetched:
+            assert fetched.response.status_code == 304
+            assert fetched.size == 0
+
+
+class TestParserDownloads:
+    """Tests for URL specs loaded through streamed downloads."""
+
+    def test_download_digest_feeds_cache(self, spec_server: str, tmp_path) -> None:
+        """Test that the digest computed while downloading keys the parsed-spec cache."""
+        SpecRequestHandler.spec = SAMPLE_OPENAPI_30
+        cache = SpecCache(tmp_path)
+
+        parser = OpenAPIParser(f"{spec_server}/openapi.json", validate=False, cache=cache)
+
+        assert parser.spec == SAMPLE_OPENAPI_30
+        assert cache.get(hashlib.sha256(_served_body()).hexdigest()) == SAMPLE_OPENAPI_30
+
+    def test_interrupted_spec_download_resumed(self, spec_server: str) -> None:
+        """Test that the parser survives a dropped transfer of the spec."""
+        SpecRequestHandler.spec = SAMPLE_OPENAPI_30
+        SpecRequestHandler.drop_after = 50
+
+        parser = OpenAPIParser(f"{spec_server}/openapi.json", validate=False)
+
+        assert parser.spec == SAMPLE_OPENAPI_30
+        assert len(SpecRequestHandler.requests) == 2
@@ -0,0 +1,126 @@
+"""Tests for operation filtering and its pushdown into spec loading."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mcp_swagger_cli.filters import OperationFilter
+from mcp_swagger_cli.generator import MCPServerGenerator
+from mcp_swagger_cli.parser import OpenAPIParser
+
+from tests.test_parser import SAMPLE_OPENAPI_30
+
+
+def _tagged_spec() -> dict:
+    spec = json.loads(json.dumps(SAMPLE_OPENAPI_30))
+    spec["paths"]["/orders"] = {
+        "get": {"operationId": "listOrders", "tags": ["orders"], "responses": {}},
+    }
+    spec["paths"]["/usersabc"] = {
+        "get": {"operationId": "listUsersAbc", "responses": {}},
+    }
+    return spec
+
+
+@pytest.fixture
+def spec_file(tmp_path: Path) -> Path:
+    """A JSON spec with several tags and look-alike paths."""
+    spec_file = tmp_path / "openapi.json"
+    spec_file.write_text(json.dumps(_tagged_spec()))
+    return spec_file
+
+
+class TestOperationFilter:
+    """Tests for the filter predicates."""
+
+    def test_empty_filter_matches_everything(self) -> None:
+        """Test that a filter without tags or paths selects every operation."""
+        select = OperationFilter()
+
+        assert not select
+        assert select.matches("/anything", None)
+        assert select.may_match_path("/anything")
+
+    def test_path_prefix_matches_whole_segments(self) -> None:
+        """Test that path filters match the path and paths below it only."""
+        select = OperationFilter(path_filters=["users"])
+
+        assert select.matches("/users", [])
+        assert select.matches("/users/{userId}", [])
+        assert not select.matches("/usersabc", [])
+        assert not select.may_match_path("/orders")
+
+    def test_tags_or_paths(self) -> None:
+        """Test that with both kinds of filter either match selects the operation."""
+        select = OperationFilter(tags=["orders"], path_filters=["/users"])
+
+        assert select.matches("/orders", ["orders"])
+        assert select.matches("/users", ["users"])
+        assert not select.matches("/pets", ["pets"])
+        # Tags are only known once the path item is read
+        assert select.may_match_path("/pets")
+
+
+class TestFilteredLoading:
+    """Tests for filters pushed into OpenAPIParser."""
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"lazy": True}, {"streaming": True}], ids=["read", "lazy", "stream"]
+    )
+    def test_only_selected_operations_built(self, spec_file: Path, kwargs: dict) -> None:
+        """Test that filtered loading yields exactly the filtered full operation list."""
+        select = OperationFilter(tags=["orders"], path_filters=["/users/{userId}"])
+        full = OpenAPIParser(str(spec_file), validate=False).get_operations()
+
+        parser = OpenAPIParser(str(spec_file), validate=False, operation_filter=select, **kwargs)
+
+        expected = [op for op in full if select.matches(op["path"], op["tags"])]
+        assert [op["operation_id"] for op in parser.get_operations()] == [
+            op["operation_id"] for op in expected
+        ]
+        assert parser.get_operations() == expected
+        info = parser.get_spec_info()
+        assert info["operation_count"] == len(expected)
+        assert info["paths"] == ["/users/{userId}", "/orders"]
+
+    def test_lazy_skips_unmatched_path_items(self, spec_file: Path) -> None:
+        """Test that in lazy mode path items outside the path filter are never decoded."""
+        parser = OpenAPIParser(
+            str(spec_file),
+            validate=False,
+            lazy=True,
+            operation_filter=OperationFilter(path_filters=["/orders"]),
+        )
+
+        parser.get_spec_info()
+        parser.get_operations()
+
+        paths = parser.spec["paths"]
+        assert paths.is_decoded("/orders")
+        assert not paths.is_decoded("/users")
+        assert not paths.is_decoded("/usersabc")
+
+    def test_unselected_refs_not_resolved(self, spec_file: Path) -> None:
+        """Test that operations the filter drops never resolve their refs."""
+        select = OperationFilter(tags=["orders"])
+        parser = OpenAPIParser(str(spec_file), validate=False, operation_filter=select)
+        calls = []
+        parser._resolve_schema_ref = lambda schema: calls.append(schema) or schema
+
+        assert [op["operation_id"] for op in parser.get_operations()] == ["listOrders"]
+        assert calls == []
+
+
+class TestGeneratorPushdown:
+    """Tests for the generator's use of the filter."""
+
+    def test_generator_passes_filter_to_parser(self, spec_file: Path, tmp_path: Path) -> None:
+        """Test that the generated server has the same operations as before filtering moved."""
+        generator = MCPServerGenerator(
+            str(spec_file), server_name="api", validate=False, path_filters=["/users"]
+        )
+
+        assert generator.parser.operation_filter is generator.operation_filter
+        operations = generator._filter_operations(generator.parser.get_operations())
+        assert {op["path"] for op in operations} == {"/users", "/users/{userId}"}
@@ -0,0 +1,123 @@
+"""Tests for Merkle fingerprints of specs."""
+
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from mcp_swagger_cli.cli import app
+from mcp_swagger_cli.exceptions import SpecParseError
+from mcp_swagger_cli.filters import OperationFilter
+from mcp_swagger_cli.fingerprint import Fingerprint
+from mcp_swagger_cli.parser import OpenAPIParser
+
+from tests.test_parser import SAMPLE_OPENAPI_30, SAMPLE_SWAGGER_20
+
+
+def _copy(spec: dict) -> dict:
+    return json.loads(json.dumps(spec))
+
+
+def _fingerprint(tmp_path: Path, spec: dict, name: str = "openapi.json", **kwargs) -> Fingerprint:
+    spec_file = tmp_path / name
+    spec_file.write_text(json.dumps(spec))
+    return OpenAPIParser(str(spec_file), validate=False, **kwargs).get_fingerprint()
+
+
+class TestFingerprint:
+    """Tests for building and comparing fingerprints."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"lazy": True}, {"streaming": True, "fingerprint": True}, {"memory_map": True}],
+        ids=["lazy", "stream", "mmap"],
+    )
+    def test_same_root_in_every_mode(self, tmp_path: Path, kwargs: dict) -> None:
+        """Test that the loading mode does not change the fingerprint."""
+        expected = _fingerprint(tmp_path, SAMPLE_OPENAPI_30)
+
+        assert _fingerprint(tmp_path, SAMPLE_OPENAPI_30, **kwargs) == expected
+
+    def test_formatting_and_order_ignored(self, tmp_path: Path) -> None:
+        """Test that YAML vs JSON, indentation and key order do not count as changes."""
+        expected = _fingerprint(tmp_path, SAMPLE_OPENAPI_30)
+        spec_file = tmp_path / "openapi.yaml"
+        reordered = dict(reversed(list(_copy(SAMPLE_OPENAPI_30).items())))
+        spec_file.write_text(yaml.safe_dump(reordered, sort_keys=False))
+
+        assert OpenAPIParser(str(spec_file), validate=False).get_fingerprint() == expected
+
+    def test_diff_reports_deepest_change(self, tmp_path: Path) -> None:
+        """Test that a diff names the operations and schemas that changed."""
+        old = _fingerprint(tmp_path, SAMPLE_OPENAPI_30)
+        spec = _copy(SAMPLE_OPENAPI_30)
+        spec["paths"]["/users"]["get"]["summary"] = "Changed"
+        spec["paths"]["/orders"] = {"get": {"responses": {}}}
+        spec["components"]["schemas"]["User"]["required"] = ["id"]
+        del spec["paths"]["/users/{userId}"]
+
+        new = _fingerprint(tmp_path, spec)
+
+        assert old != new
+        assert old.get("info") == new.get("info")
+        assert old.diff(new) == [
+            ("changed", ("components", "schemas", "User")),
+            ("added", ("paths", "/orders")),
+            ("changed", ("paths", "/users", "get")),
+            ("removed", ("paths", "/users/{userId}")),
+        ]
+
+    def test_swagger_20_tables_split(self, tmp_path: Path) -> None:
+        """Test that Swagger 2.0 definitions get a node per schema."""
+        fingerprint = _fingerprint(tmp_path, SAMPLE_SWAGGER_20)
+
+        assert fingerprint.get("definitions", "Pet") is not None
+        assert fingerprint.get("paths", "/pets", "get") is not None
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test that a serialized fingerprint compares equal to the original."""
+        fingerprint = _fingerprint(tmp_path, SAMPLE_OPENAPI_30)
+
+        restored = Fingerprint.from_dict(json.loads(json.dumps(fingerprint.to_dict())))
+
+        assert restored == fingerprint
+        assert restored.diff(fingerprint) == []
+        assert restored.get("paths", "/users", "get") == fingerprint.get("paths", "/users", "get")
+
+    def test_filter_limits_coverage(self, tmp_path: Path) -> None:
+        """Test that a filtered load covers only the path items it may select."""
+        fingerprint = _fingerprint(
+            tmp_path, SAMPLE_OPENAPI_30, operation_filter=OperationFilter(path_filters=["/users/{userId}"])
+        )
+
+        assert list(fingerprint.get("paths").children) == ["/users/{userId}"]
+
+    def test_streamed_without_flag_rejected(self, tmp_path: Path) -> None:
+        """Test that a streamed spec cannot be fingerprinted after the fact."""
+        with pytest.raises(SpecParseError, match="fingerprint=True"):
+            _fingerprint(tmp_path, SAMPLE_OPENAPI_30, streaming=True)
+
+
+class TestDiffCommand:
+    """Tests for mcp-swagger diff."""
+
+    def test_diff_command(self, tmp_path: Path) -> None:
+        """Test the diff output and --exit-code."""
+        old_file = tmp_path / "old.json"
+        old_file.write_text(json.dumps(SAMPLE_OPENAPI_30))
+        spec = _copy(SAMPLE_OPENAPI_30)
+        spec["paths"]["/users"]["post"]["deprecated"] = True
+        new_file = tmp_path / "new.json"
+        new_file.write_text(json.dumps(spec))
+        runner = CliRunner()
+
+        result = runner.invoke(app, ["diff", str(old_file), str(old_file), "--no-cache"])
+        assert result.exit_code == 0, result.output
+        assert "No changes" in result.output
+
+        result = runner.invoke(app, ["diff", str(old_file), str(new_file), "--no-cache", "--exit-code"])
+        assert result.exit_code == 1
+        assert "~ paths /users post" in result.output
+        assert "1 change(s)" in result.output
@@ -0,0 +1,63 @@
+"""Tests for the shared HTTP client."""
+
+from unittest.mock import patch
+
+import pytest
+
+from mcp_swagger_cli import http_client
+from mcp_swagger_cli.exceptions import MCPSwaggerError
+from mcp_swagger_cli.http_client import (
+    close_http_client,
+    configure_http_client,
+    get_http_client,
+)
+from mcp_swagger_cli.parser import OpenAPIParser
+
+from tests.conftest import SpecRequestHandler
+from tests.test_parser import SAMPLE_OPENAPI_30
+
+
+@pytest.fixture(autouse=True)
+def reset_http_client():
+    """Give each test a fresh, default-configured shared client."""
+    configure_http_client()
+    yield
+    configure_http_client()
+
+
+class TestSharedClient:
+    """Tests for the shared client's lifecycle and configuration."""
+
+    def test_client_is_shared(self) -> None:
+        """Test that the same client is returned until it is closed."""
+        client = get_http_client()
+
+        assert get_http_client() is client
+        close_http_client()
+        assert client.is_closed
+        assert get_http_client() is not client
+
+    def test_configure_replaces_client(self) -> None:
+        """Test that configuring closes the pool and applies the new settings."""
+        client = get_http_client()
+
+        configure_http_client(timeout=5.0, max_connections=2)
+
+        assert client.is_closed
+        assert get_http_client().timeout.read == 5.0
+
+    def test_http2_without_h2(self) -> None:
+        """Test that HTTP/2 without the optional package gives a clear error."""
+        with patch.object(http_client, "h2", None):
+            with pytest.raises(MCPSwaggerError, match="h2"):
+                configure_http_client(http2=True)
+
+    def test_spec_fetches_reuse_connection(self, spec_server: str) -> None:
+        """Test that repeated spec fetches go over one kept-alive connection."""
+        SpecRequestHandler.spec = SAMPLE_OPENAPI_30
+
+        for _ in range(3):
+            OpenAPIParser(f"{spec_server}/openapi.json", validate=False)
+
+        assert len(SpecRequestHandler.client_ports) == 3
+        assert len(set(SpecRequestHandler.client_ports)) == 1
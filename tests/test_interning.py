@@ -0,0 +1,102 @@
+"""Tests for string interning of parsed specs."""
+
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from mcp_swagger_cli.interning import StringInterner
+from mcp_swagger_cli.parser import OpenAPIParser
+
+from tests.test_parser import SAMPLE_OPENAPI_30
+
+
+class TestStringInterner:
+    """Tests for the tree walk."""
+
+    def test_equal_strings_shared(self) -> None:
+        """Test that equal keys and values end up as one object."""
+        tree = json.loads('[{"type": "string"}, {"type": "string", "items": ["type"]}]')
+        first, second = StringInterner()(tree)
+
+        first_key, second_key = next(iter(first)), next(iter(second))
+        assert first_key is second_key
+        assert first["type"] is second["type"]
+        assert second["items"][0] is first_key
+        assert tree == [{"type": "string"}, {"type": "string", "items": ["type"]}]
+
+    def test_duplicate_keys_rekeyed_in_order(self) -> None:
+        """Test that dicts with duplicate keys are rebuilt with the same order."""
+        interner = StringInterner()
+        interner("".join(["na", "me"]))
+        node = {"".join(["na", "me"]): 1, "other": 2}
+
+        assert interner(node) is node
+        assert list(node) == ["name", "other"]
+        assert next(iter(node)) is interner.string("name")
+
+    def test_scalars_unchanged(self) -> None:
+        """Test that non-container, non-string values pass through."""
+        interner = StringInterner()
+
+        for value in (3, 1.5, True, None):
+            assert interner(value) is value
+
+    def test_aliases_and_cycles(self) -> None:
+        """Test that shared and self-referencing YAML nodes keep their identity."""
+        tree = yaml.safe_load("a: &x {type: string}\nb: *x\n")
+        tree["self"] = tree
+
+        assert StringInterner()(tree) is tree
+        assert tree["a"] is tree["b"]
+        assert tree["self"] is tree
+
+
+class TestInternedParsing:
+    """Tests for OpenAPIParser(intern_strings=True)."""
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"lazy": True}, {"streaming": True}], ids=["read", "lazy", "stream"]
+    )
+    def test_operations_unchanged(self, tmp_path: Path, kwargs: dict) -> None:
+        """Test that interning does not change what the parser reports."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SAMPLE_OPENAPI_30))
+        plain = OpenAPIParser(str(spec_file), validate=False, **kwargs)
+
+        interned = OpenAPIParser(str(spec_file), validate=False, intern_strings=True, **kwargs)
+
+        assert interned.get_operations() == plain.get_operations()
+        assert interned.get_spec_info() == plain.get_spec_info()
+        assert interned.get_schemas() == plain.get_schemas()
+
+    @pytest.mark.parametrize("kwargs", [{}, {"lazy": True}, {"streaming": True}])
+    def test_records_share_strings(self, tmp_path: Path, kwargs: dict) -> None:
+        """Test that operation records built from different path items share strings."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SAMPLE_OPENAPI_30))
+
+        parser = OpenAPIParser(str(spec_file), validate=False, intern_strings=True, **kwargs)
+        by_id = {op["operation_id"]: op for op in parser.get_operations()}
+
+        list_users = by_id["listUsers"]["tags"][0]
+        get_user = by_id["getUser"]["tags"][0]
+        assert list_users == get_user == "users"
+        assert list_users is get_user
+
+    @pytest.mark.parametrize("fingerprint", [False, True])
+    def test_lazy_scalar_members(self, tmp_path: Path, fingerprint: bool) -> None:
+        """Test lazy interned loading of a spec with scalar top-level members."""
+        spec = {**SAMPLE_OPENAPI_30, "x-count": 3, "x-internal": True, "x-owner": None}
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(spec))
+
+        parser = OpenAPIParser(
+            str(spec_file), validate=False, lazy=True, intern_strings=True, fingerprint=fingerprint
+        )
+
+        assert parser.spec["x-count"] == 3
+        assert parser.spec["x-internal"] is True
+        assert parser.spec["x-owner"] is None
+        assert len(parser.get_operations()) == 3
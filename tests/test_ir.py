@@ -0,0 +1,161 @@
+"""Tests for the compiled operation IR."""
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from mcp_swagger_cli.cli import app
+from mcp_swagger_cli.exceptions import SpecParseError
+from mcp_swagger_cli.generator import MCPServerGenerator
+from mcp_swagger_cli.ir import IR_MAGIC, SpecIR, is_ir_file, load_spec_source
+from mcp_swagger_cli.parser import OpenAPIParser
+
+from tests.test_parser import SAMPLE_OPENAPI_30, SAMPLE_SWAGGER_20
+
+
+@pytest.fixture
+def spec_file(tmp_path: Path) -> Path:
+    """A JSON OpenAPI 3.0 spec on disk."""
+    spec_file = tmp_path / "openapi.json"
+    spec_file.write_text(json.dumps(SAMPLE_OPENAPI_30))
+    return spec_file
+
+
+def _large_spec(path_count: int) -> dict:
+    spec = json.loads(json.dumps(SAMPLE_OPENAPI_30))
+    template = spec["paths"]["/users/{userId}"]
+    spec["paths"] = {f"/resource{i}/{{userId}}": template for i in range(path_count)}
+    return spec
+
+
+class TestSpecIR:
+    """Tests for building, serializing and loading the IR."""
+
+    @pytest.mark.parametrize("sample", [SAMPLE_OPENAPI_30, SAMPLE_SWAGGER_20])
+    def test_round_trip_matches_parser(self, tmp_path: Path, sample: dict) -> None:
+        """Test that a loaded IR reproduces the parser's info, operations and schemas."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(sample))
+        parser = OpenAPIParser(str(spec_file), validate=False)
+        ir_file = tmp_path / "openapi.mcpir"
+
+        SpecIR.from_parser(parser).dump(ir_file)
+        ir = SpecIR.load(ir_file)
+
+        assert ir.get_spec_info() == parser.get_spec_info()
+        assert ir.get_operations() == parser.get_operations()
+        assert ir.get_schemas() == parser.get_schemas()
+
+    def test_version_mismatch_rejected(self, spec_file: Path) -> None:
+        """Test that an IR written by another format version is refused."""
+        data = SpecIR.from_parser(OpenAPIParser(str(spec_file), validate=False)).dumps()
+        stale = IR_MAGIC + b"\xff\xff" + data[len(IR_MAGIC) + 2:]
+
+        with pytest.raises(SpecParseError, match="Unsupported IR version"):
+            SpecIR.loads(stale)
+
+    @pytest.mark.parametrize("data", [b"{}", IR_MAGIC + b"\x00\x01garbage"])
+    def test_invalid_data_rejected(self, data: bytes) -> None:
+        """Test that non-IR and truncated data raise SpecParseError."""
+        with pytest.raises(SpecParseError):
+            SpecIR.loads(data)
+
+    def test_load_spec_source_sniffs_magic(self, spec_file: Path, tmp_path: Path) -> None:
+        """Test that IR files are recognized by content, not by suffix."""
+        ir_file = tmp_path / "compiled.json"
+        SpecIR.from_parser(OpenAPIParser(str(spec_file), validate=False)).dump(ir_file)
+
+        assert is_ir_file(str(ir_file))
+        assert not is_ir_file(str(spec_file))
+        assert isinstance(load_spec_source(str(ir_file)), SpecIR)
+        assert isinstance(load_spec_source(str(spec_file), validate=False), OpenAPIParser)
+
+    def test_yaml_dates_stored_as_strings(self, tmp_path: Path) -> None:
+        """Test that unquoted YAML dates are written as ISO strings."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(
+            "openapi: 3.0.3\n"
+            "info: {title: Dates, version: 1.0.0}\n"
+            "paths:\n"
+            "  /events:\n"
+            "    get:\n"
+            "      operationId: listEvents\n"
+            "      parameters:\n"
+            "        - {name: since, in: query, schema: {type: string, default: 2020-01-01}}\n"
+            "      responses: {'200': {description: OK}}\n"
+            "components:\n"
+            "  schemas:\n"
+            "    Event: {type: object, example: {at: 2020-01-01T12:30:00}}\n"
+        )
+        parser = OpenAPIParser(str(spec_file), validate=False)
+
+        ir = SpecIR.loads(SpecIR.from_parser(parser).dumps())
+
+        assert ir.get_operations()[0]["parameters"][0]["default"] == "2020-01-01"
+        assert ir.get_schemas()["Event"]["example"] == {"at": "2020-01-01T12:30:00"}
+
+    def test_unstorable_value_rejected(self, spec_file: Path) -> None:
+        """Test that values marshal cannot store raise SpecParseError."""
+        ir = SpecIR.from_parser(OpenAPIParser(str(spec_file), validate=False))
+        ir.spec_info["x-custom"] = object()
+
+        with pytest.raises(SpecParseError, match="Cannot store object"):
+            ir.dumps()
+
+    def test_load_skips_parsing(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that loading an IR never parses or normalizes the spec again.
+
+        Load times are measured by benchmarks/bench_ir.py.
+        """
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(_large_spec(1000)))
+        ir_file = tmp_path / "openapi.mcpir"
+        SpecIR.from_parser(OpenAPIParser(str(spec_file), validate=False)).dump(ir_file)
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("the spec was parsed again")
+
+        monkeypatch.setattr(OpenAPIParser, "__init__", fail)
+        monkeypatch.setattr("mcp_swagger_cli.parser.normalize_operation", fail)
+        monkeypatch.setattr("mcp_swagger_cli.parser.normalize_spec", fail)
+        ir = load_spec_source(str(ir_file))
+
+        assert isinstance(ir, SpecIR)
+        assert len(ir.get_operations()) == 1000
+
+
+class TestIRConsumers:
+    """Tests for the generator and CLI reading IR files."""
+
+    def test_generator_output_identical(self, spec_file: Path, tmp_path: Path) -> None:
+        """Test that generating from the IR gives the same server as from the spec."""
+        ir_file = tmp_path / "openapi.mcpir"
+        SpecIR.from_parser(OpenAPIParser(str(spec_file), validate=False)).dump(ir_file)
+
+        for source, output in ((spec_file, "from_spec"), (ir_file, "from_ir")):
+            generator = MCPServerGenerator(str(source), server_name="api", validate=False)
+            generator.generate(tmp_path / output)
+
+        generated = sorted((tmp_path / "from_spec").rglob("*.py"))
+        assert generated
+        for path in generated:
+            relative = path.relative_to(tmp_path / "from_spec")
+            assert (tmp_path / "from_ir" / relative).read_text() == path.read_text()
+
+    def test_cli_compile_then_info(self, spec_file: Path, tmp_path: Path) -> None:
+        """Test the compile command and reading its output with info."""
+        runner = CliRunner()
+        ir_file = tmp_path / "api.mcpir"
+
+        result = runner.invoke(
+            app, ["compile", str(spec_file), "-o", str(ir_file), "--no-validate", "--no-cache"]
+        )
+        assert result.exit_code == 0, result.output
+        assert is_ir_file(str(ir_file))
+
+        result = runner.invoke(app, ["info", str(ir_file)])
+        assert result.exit_code == 0, result.output
+        assert "Test API" in result.output
+        assert "/users/{userId}" in result.output
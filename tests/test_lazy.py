@@ -0,0 +1,102 @@
+"""Tests for the lazy spec view."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from mcp_swagger_cli.cache import SpecCache
+from mcp_swagger_cli.exceptions import SpecParseError
+from mcp_swagger_cli.lazy import LazyObject, index_spec
+from mcp_swagger_cli.parser import OpenAPIParser
+
+from tests.test_parser import SAMPLE_OPENAPI_30, SAMPLE_SWAGGER_20
+
+
+class TestLazyObject:
+    """Tests for the offset index and the lazy mapping."""
+
+    def test_index_offsets(self) -> None:
+        """Test that offsets cover each member value and each path item."""
+        text = json.dumps(SAMPLE_OPENAPI_30, indent=2)
+
+        index = index_spec(text)
+
+        start, end = index["info"]
+        assert json.loads(text[start:end]) == SAMPLE_OPENAPI_30["info"]
+        start, end = index["paths"]["/users/{userId}"]
+        assert json.loads(text[start:end]) == SAMPLE_OPENAPI_30["paths"]["/users/{userId}"]
+
+    def test_members_decoded_on_access(self) -> None:
+        """Test that only accessed members are decoded."""
+        text = json.dumps(SAMPLE_OPENAPI_30)
+        spec = LazyObject(text, index_spec(text))
+
+        assert spec["info"]["title"] == "Test API"
+        assert spec.is_decoded("info")
+        assert not spec.is_decoded("components")
+        paths = spec["paths"]
+        assert isinstance(paths, LazyObject)
+        assert paths["/users"] == SAMPLE_OPENAPI_30["paths"]["/users"]
+        assert not paths.is_decoded("/users/{userId}")
+
+    def test_materialize(self) -> None:
+        """Test that a fully materialized view equals the eager decode."""
+        text = json.dumps(SAMPLE_OPENAPI_30)
+
+        assert LazyObject(text, index_spec(text)).materialize() == SAMPLE_OPENAPI_30
+
+    @pytest.mark.parametrize("text", ['{"a": 1', '{"a" 1}', '{"a": 1} []', "[]"])
+    def test_invalid_json(self, text: str) -> None:
+        """Test that malformed documents are rejected while indexing."""
+        with pytest.raises(json.JSONDecodeError):
+            index_spec(text)
+
+
+class TestParserLazyMode:
+    """Tests for OpenAPIParser(lazy=True)."""
+
+    @pytest.mark.parametrize("sample", [SAMPLE_OPENAPI_30, SAMPLE_SWAGGER_20])
+    def test_matches_eager_parse(self, tmp_path: Path, sample: dict) -> None:
+        """Test that the lazy view yields the same info, operations and schemas."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(sample))
+
+        eager = OpenAPIParser(str(spec_file), validate=False)
+        lazy = OpenAPIParser(str(spec_file), validate=False, lazy=True)
+
+        assert isinstance(lazy.spec, LazyObject)
+        assert lazy.get_spec_info() == eager.get_spec_info()
+        assert lazy.get_operations() == eager.get_operations()
+        assert lazy.get_schemas() == eager.get_schemas()
+
+    def test_index_cached(self, tmp_path: Path) -> None:
+        """Test that a warm load reuses the cached index instead of rescanning."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SAMPLE_OPENAPI_30))
+        cache = SpecCache(tmp_path / "cache")
+        OpenAPIParser(str(spec_file), validate=False, lazy=True, cache=cache)
+
+        with patch("mcp_swagger_cli.parser.index_spec", side_effect=AssertionError):
+            parser = OpenAPIParser(str(spec_file), validate=False, lazy=True, cache=cache)
+
+        assert parser.get_schemas() == SAMPLE_OPENAPI_30["components"]["schemas"]
+
+    def test_yaml_loaded_eagerly(self, tmp_path: Path) -> None:
+        """Test that YAML specs fall back to a plain decode."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(yaml.dump(SAMPLE_OPENAPI_30))
+
+        parser = OpenAPIParser(str(spec_file), validate=False, lazy=True)
+
+        assert parser.spec == SAMPLE_OPENAPI_30
+
+    def test_invalid_json_raises(self, tmp_path: Path) -> None:
+        """Test that malformed JSON raises SpecParseError."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text('{"openapi": "3.0.0", "paths": {')
+
+        with pytest.raises(SpecParseError, match="Invalid JSON"):
+            OpenAPIParser(str(spec_file), validate=False, lazy=True)
@@ -0,0 +1,177 @@
+"""Tests for the dialect-independent spec model."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mcp_swagger_cli.normalize import normalize_operation, normalize_spec
+from mcp_swagger_cli.parser import OpenAPIParser
+
+PET_SCHEMA = {"type": "object", "properties": {"name": {"type": "string"}}}
+
+SWAGGER_20 = {
+    "swagger": "2.0",
+    "info": {"title": "Pets", "version": "1.0.0"},
+    "host": "api.example.com",
+    "basePath": "/v2",
+    "schemes": ["http", "https"],
+    "consumes": ["application/json"],
+    "securityDefinitions": {"key": {"type": "apiKey", "name": "X-Key", "in": "header"}},
+    "parameters": {"limit": {"name": "limit", "in": "query", "type": "integer"}},
+    "paths": {
+        "/pets": {
+            "get": {
+                "operationId": "listPets",
+                "parameters": [{"$ref": "#/parameters/limit"}],
+                "responses": {
+                    "200": {"description": "OK", "schema": {"$ref": "#/definitions/Pet"}},
+                },
+            },
+            "post": {
+                "operationId": "createPet",
+                "parameters": [
+                    {
+                        "name": "pet",
+                        "in": "body",
+                        "required": True,
+                        "description": "The pet",
+                        "schema": {"$ref": "#/definitions/Pet"},
+                    },
+                ],
+                "responses": {"201": {"description": "Created"}},
+            },
+        },
+    },
+    "definitions": {"Pet": PET_SCHEMA},
+}
+
+OPENAPI_30 = {
+    "openapi": "3.0.0",
+    "info": {"title": "Pets", "version": "1.0.0"},
+    "servers": [{"url": "http://api.example.com/v2"}],
+    "paths": {
+        "/pets": {
+            "get": {
+                "operationId": "listPets",
+                "parameters": [{"$ref": "#/components/parameters/limit"}],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {"schema": {"$ref": "#/components/schemas/Pet"}},
+                        },
+                    },
+                },
+            },
+            "post": {
+                "operationId": "createPet",
+                "requestBody": {
+                    "required": True,
+                    "description": "The pet",
+                    "content": {
+                        "application/json": {"schema": {"$ref": "#/components/schemas/Pet"}},
+                    },
+                },
+                "responses": {"201": {"description": "Created"}},
+            },
+        },
+    },
+    "components": {
+        "schemas": {"Pet": PET_SCHEMA},
+        "parameters": {"limit": {"name": "limit", "in": "query", "schema": {"type": "integer"}}},
+        "securitySchemes": {"key": {"type": "apiKey", "name": "X-Key", "in": "header"}},
+    },
+}
+
+
+def _parse(tmp_path: Path, spec: dict, **kwargs) -> OpenAPIParser:
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(spec))
+    return OpenAPIParser(str(spec_file), validate=False, **kwargs)
+
+
+class TestSpecModel:
+    """Tests for the top-level tables."""
+
+    def test_swagger_20_tables(self) -> None:
+        """Test that 2.0 tables land where their 3.x counterparts do."""
+        model = normalize_spec(SWAGGER_20)
+
+        assert model.version == "2.0"
+        assert model.schemas == {"Pet": PET_SCHEMA}
+        assert model.server_urls == ["http://api.example.com/v2"]
+        assert model.security_schemes == SWAGGER_20["securityDefinitions"]
+        assert model.resolve_local("#/parameters/limit", None)["name"] == "limit"
+        assert model.resolve_local("#/definitions/Pet", None) == PET_SCHEMA
+        assert model.resolve_local("#/definitions/Missing", "default") == "default"
+
+    def test_body_parameter_becomes_body(self) -> None:
+        """Test that a 2.0 body parameter is split off as the request body."""
+        path_item = SWAGGER_20["paths"]["/pets"]
+        normalized = normalize_operation(normalize_spec(SWAGGER_20), path_item, path_item["post"])
+
+        assert normalized.parameters == []
+        assert normalized.body.required is True
+        assert normalized.body.schema == {"$ref": "#/definitions/Pet"}
+        assert normalized.consumes == ["application/json"]
+
+    def test_form_request_body(self) -> None:
+        """Test that 3.x form bodies are flagged and set the consumes."""
+        operation = {
+            "requestBody": {
+                "content": {"multipart/form-data": {"schema": PET_SCHEMA}},
+            },
+        }
+
+        normalized = normalize_operation(normalize_spec(OPENAPI_30), {}, operation)
+
+        assert normalized.body.form is True
+        assert normalized.body.schema == PET_SCHEMA
+        assert normalized.consumes == ["multipart/form-data"]
+
+
+class TestDialectsAgree:
+    """Tests that equivalent 2.0 and 3.x specs parse to the same model."""
+
+    @pytest.mark.parametrize("kwargs", [{}, {"lazy": True}, {"streaming": True}])
+    def test_operations_match(self, tmp_path: Path, kwargs: dict) -> None:
+        """Test that both dialects give the same operations.
+
+        Consumes differ by design (2.0 declares them, 3.x derives them from
+        the body), and response schemas are reported unresolved.
+        """
+        swagger = _parse(tmp_path, SWAGGER_20, **kwargs).get_operations()
+        openapi = _parse(tmp_path, OPENAPI_30, **kwargs).get_operations()
+
+        assert swagger[0]["responses"]["200"]["schema"] == {"$ref": "#/definitions/Pet"}
+        assert openapi[0]["responses"]["200"]["schema"] == {"$ref": "#/components/schemas/Pet"}
+        for operation in swagger + openapi:
+            operation.pop("consumes")
+            operation.pop("responses")
+        assert swagger == openapi
+        assert openapi[0]["parameters"][0]["type"] == "integer"
+        assert openapi[1]["request_body"]["schema"] == PET_SCHEMA
+
+    def test_spec_info_and_tables_match(self, tmp_path: Path) -> None:
+        """Test that servers, schemas and security schemes agree across dialects."""
+        swagger = _parse(tmp_path, SWAGGER_20)
+        openapi = _parse(tmp_path, OPENAPI_30)
+
+        assert swagger.get_spec_info()["servers"] == openapi.get_spec_info()["servers"]
+        assert swagger.get_servers() == openapi.get_servers()
+        assert swagger.get_schemas() == openapi.get_schemas()
+        assert swagger.get_security_schemes() == openapi.get_security_schemes()
+
+    def test_streamed_tables_after_paths(self, tmp_path: Path) -> None:
+        """Test that top-level members after paths are seen once streaming ends."""
+        spec = {"paths": OPENAPI_30["paths"], **OPENAPI_30}
+        spec["servers"] = [{"url": "http://late.example.com"}]
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text(
+            json.dumps({key: spec[key] for key in ("openapi", "info", "components", "paths", "servers")})
+        )
+
+        parser = OpenAPIParser(str(spec_file), validate=False, streaming=True)
+
+        assert parser.get_spec_info()["servers"] == ["http://late.example.com"]
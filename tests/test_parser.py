@@ -1,14 +1,18 @@
 """Tests for the parser module."""
 
+import asyncio
 import json
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import httpx
 import pytest
 import yaml
 
-from mcp_swagger_cli.parser import OpenAPIParser
+from mcp_swagger_cli.parser import OpenAPIParser, load_specs
+
+from tests.conftest import SpecRequestHandler
 
 
 # Sample OpenAPI 3.0 spec for testing
@@ -259,3 +263,196 @@ class TestOpenAPIParser:
         
         with pytest.raises(SpecNotFoundError):
             OpenAPIParser("/nonexistent/path/spec.json", validate=False)
+
+    def test_yaml_uses_libyaml_loader_when_available(self, tmp_path: Path) -> None:
+        """Test that YAML specs are loaded with CSafeLoader when libyaml is present."""
+        from mcp_swagger_cli import parser as parser_module
+
+        if not yaml.__with_libyaml__:
+            pytest.skip("PyYAML built without libyaml")
+
+        assert parser_module._YAMLLoader is yaml.CSafeLoader
+        assert "libyaml" in parser_module.describe_yaml_loader()
+
+    def test_yaml_falls_back_to_pure_python_loader(self, tmp_path: Path) -> None:
+        """Test that YAML loading still works with the pure-Python loader."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(yaml.dump(SAMPLE_OPENAPI_30))
+
+        with patch("mcp_swagger_cli.parser._YAMLLoader", yaml.SafeLoader):
+            from mcp_swagger_cli.parser import describe_yaml_loader
+
+            parser = OpenAPIParser(str(spec_file), validate=False)
+            assert describe_yaml_loader().startswith("SafeLoader")
+
+        assert parser.spec["info"]["title"] == "Test API"
+
+    def test_memory_mapped_load_matches_read(self, tmp_path: Path) -> None:
+        """Test that memory-mapped loading produces the same spec."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_bytes(b"\xef\xbb\xbf" + json.dumps(SAMPLE_OPENAPI_30).encode())
+
+        parser = OpenAPIParser(str(spec_file), validate=False, memory_map=True)
+
+        assert parser.spec == SAMPLE_OPENAPI_30
+
+
+class TestFormatSniffing:
+    """Tests for telling JSON from YAML by the leading bytes."""
+
+    @pytest.mark.parametrize(
+        ("head", "is_yaml"),
+        [
+            (b'{"openapi": "3.0.0"}', False),
+            (b"\xef\xbb\xbf \n\t{", False),
+            (b"[]", False),
+            (b"openapi: 3.0.0", True),
+            (b"---\nopenapi: 3.0.0", True),
+            (b"# comment\n{", True),
+            (b"{openapi: 3.0.0, info: {title: Flow}}", True),
+            (b"{\n  openapi: 3.0.0", True),
+            (b"  \n", True),
+            (b"", True),
+        ],
+    )
+    def test_sniff_is_yaml(self, head: bytes, is_yaml: bool) -> None:
+        """Test that only a leading [, or { and a quoted key, selects the JSON decoder."""
+        from mcp_swagger_cli.parser import _sniff_is_yaml
+
+        assert _sniff_is_yaml(head) is is_yaml
+
+    @pytest.mark.parametrize("name", ["openapi.txt", "openapi.yaml", "openapi"])
+    def test_json_decoded_once_whatever_the_suffix(self, tmp_path: Path, name: str) -> None:
+        """Test that JSON goes straight to the JSON decoder, once, whatever the file is called."""
+        spec_file = tmp_path / name
+        spec_file.write_text(json.dumps(SAMPLE_OPENAPI_30))
+
+        with patch("mcp_swagger_cli.parser._load_yaml", side_effect=AssertionError), patch(
+            "mcp_swagger_cli.parser.json.loads", wraps=json.loads
+        ) as loads:
+            parser = OpenAPIParser(str(spec_file), validate=False)
+
+        assert parser.spec == SAMPLE_OPENAPI_30
+        assert loads.call_count == 1
+
+    @pytest.mark.parametrize(
+        "kwargs", [{}, {"lazy": True}, {"streaming": True}, {"memory_map": True}],
+        ids=["read", "lazy", "stream", "mmap"],
+    )
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "{openapi: 3.0.0, info: {title: Flow, version: '1'}, paths: {}}",
+            '{"openapi": 3.0.0, "info": {"title": Flow, "version": \'1\'}, "paths": {}}',
+        ],
+        ids=["bare-keys", "quoted-keys"],
+    )
+    def test_flow_style_yaml(self, tmp_path: Path, kwargs: dict, text: str) -> None:
+        """Test that YAML flow style, which starts with {, still loads."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(text)
+
+        parser = OpenAPIParser(str(spec_file), validate=False, **kwargs)
+
+        assert parser.spec["info"] == {"title": "Flow", "version": "1"}
+        assert parser.get_spec_info()["openapi_version"] == "3.0.0"
+
+    def test_yaml_with_json_suffix(self, tmp_path: Path) -> None:
+        """Test that YAML saved under a .json name is still loaded."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(yaml.dump(SAMPLE_OPENAPI_30))
+
+        parser = OpenAPIParser(str(spec_file), validate=False, lazy=True)
+
+        assert parser.spec == SAMPLE_OPENAPI_30
+
+    def test_url_format_ignores_content_type(self) -> None:
+        """Test that a URL body's format comes from its bytes, not its content type."""
+        body = json.dumps(SAMPLE_OPENAPI_30).encode()
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=body, headers={"content-type": "text/yaml"})
+        )
+
+        with patch(
+            "mcp_swagger_cli.parser.get_http_client",
+            return_value=httpx.Client(transport=transport),
+        ), patch("mcp_swagger_cli.parser._load_yaml", side_effect=AssertionError):
+            parser = OpenAPIParser("https://example.com/openapi.yaml", validate=False)
+
+        assert parser.spec == SAMPLE_OPENAPI_30
+
+    def test_streaming_sniffs_format(self, tmp_path: Path) -> None:
+        """Test that streaming falls back to a full load for YAML, whatever the suffix."""
+        spec_file = tmp_path / "openapi.txt"
+        spec_file.write_text(yaml.dump(SAMPLE_OPENAPI_30))
+
+        parser = OpenAPIParser(str(spec_file), validate=False, streaming=True)
+
+        assert parser.spec == SAMPLE_OPENAPI_30
+
+    def test_sniffing_large_input_is_constant_time(self) -> None:
+        """Test that sniffing scans only the leading whitespace, never the whole spec."""
+        import mmap
+        import time
+
+        from mcp_swagger_cli.parser import _sniff_is_yaml
+
+        def best_of_five(data: bytes | mmap.mmap) -> float:
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                for _ in range(1000):
+                    assert _sniff_is_yaml(data) is False
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        large = b'{"' + b" " * (64 * 1024 * 1024)
+        with mmap.mmap(-1, len(large)) as mapped:
+            mapped.write(large)
+
+            small_time = best_of_five(b"{}")
+            # Relative to two bytes, so the bound holds on slow machines; a
+            # scan of 64 MiB would be thousands of times slower
+            assert best_of_five(large) < 10 * small_time
+            assert best_of_five(mapped) < 10 * small_time
+
+
+class TestAsyncLoading:
+    """Tests for OpenAPIParser.aload and load_specs."""
+
+    def test_aload_url(self, spec_server: str) -> None:
+        """Test loading a URL spec with the async constructor."""
+        SpecRequestHandler.spec = SAMPLE_OPENAPI_30
+
+        parser = asyncio.run(OpenAPIParser.aload(f"{spec_server}/openapi.json", validate=False))
+
+        assert parser.spec == SAMPLE_OPENAPI_30
+        assert len(parser.get_operations()) == 3
+
+    def test_aload_file(self, tmp_path: Path) -> None:
+        """Test loading a file spec with the async constructor."""
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(yaml.dump(SAMPLE_OPENAPI_30))
+
+        parser = asyncio.run(OpenAPIParser.aload(str(spec_file), validate=False))
+
+        assert parser.spec["info"]["title"] == "Test API"
+
+    def test_aload_http_error(self) -> None:
+        """Test that fetch failures surface as SpecParseError."""
+        from mcp_swagger_cli.exceptions import SpecParseError
+
+        with pytest.raises(SpecParseError):
+            asyncio.run(OpenAPIParser.aload("http://127.0.0.1:1/openapi.json", validate=False))
+
+    def test_load_specs_bounded_concurrency(self, spec_server: str) -> None:
+        """Test that load_specs loads all specs with at most N in flight."""
+        SpecRequestHandler.spec = SAMPLE_OPENAPI_30
+        SpecRequestHandler.delay = 0.05
+        urls = [f"{spec_server}/spec{i}.json" for i in range(6)]
+
+        parsers = asyncio.run(load_specs(urls, concurrency=2, validate=False))
+
+        assert [p.spec_path for p in parsers] == urls
+        assert all(p.spec["info"]["title"] == "Test API" for p in parsers)
+        assert SpecRequestHandler.max_in_flight == 2
@@ -0,0 +1,164 @@
+"""Tests for schema reachability and tree-shaking of filtered servers."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mcp_swagger_cli.generator import MCPServerGenerator
+from mcp_swagger_cli.ir import SpecIR
+from mcp_swagger_cli.parser import OpenAPIParser
+from mcp_swagger_cli.reachability import SchemaGraph, reachable_schemas
+
+from tests.test_consing import module_schemas
+
+
+def _ref(name: str) -> dict[str, str]:
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+SPEC: dict[str, Any] = {
+    "openapi": "3.0.3",
+    "info": {"title": "Shop", "version": "1.0.0"},
+    "paths": {
+        "/pets": {
+            "post": {
+                "operationId": "createPet",
+                "tags": ["pets"],
+                "parameters": [{"$ref": "#/components/parameters/Region"}],
+                "requestBody": {"content": {"application/json": {"schema": _ref("Pet")}}},
+                "responses": {"default": {"$ref": "#/components/responses/Error"}},
+            }
+        },
+        "/users": {
+            "get": {
+                "operationId": "listUsers",
+                "tags": ["users"],
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {"application/json": {"schema": {"type": "array", "items": _ref("User")}}},
+                    }
+                },
+            }
+        },
+    },
+    "components": {
+        "parameters": {"Region": {"name": "region", "in": "query", "schema": _ref("Region")}},
+        "responses": {
+            "Error": {"description": "Error", "content": {"application/json": {"schema": _ref("Error")}}}
+        },
+        "schemas": {
+            "Pet": {"type": "object", "properties": {"owner": _ref("Owner"), "siblings": {"items": _ref("Pet")}}},
+            "Owner": {"type": "object", "properties": {"address": _ref("Address")}},
+            "Address": {"type": "object", "properties": {"city": {"type": "string"}}},
+            "Region": {"type": "string", "enum": ["eu", "us"]},
+            "Error": {"type": "object", "properties": {"message": {"type": "string"}}},
+            "User": {"type": "object", "properties": {"address": _ref("Address")}},
+            "Unused": {"type": "object"},
+        },
+    },
+}
+
+PETS_SCHEMAS = {"Pet", "Owner", "Address", "Region", "Error"}
+
+
+class TestSchemaGraph:
+    """Tests for references between named schemas."""
+
+    def test_refs_follow_other_components(self) -> None:
+        """Test that refs to parameters and responses count their schemas."""
+        components = SPEC["components"]
+
+        def resolve(node: dict[str, Any]) -> Any:
+            _, _, section, name = node["$ref"].split("/")
+            return components[section][name]
+
+        graph = SchemaGraph(components["schemas"], resolve)
+        assert graph.refs(SPEC["paths"]["/pets"]["post"]) == ["Error", "Pet", "Region"]
+        assert graph.dependencies("Pet") == ["Owner", "Pet"]
+        assert graph.to_dict()["Unused"] == []
+
+    def test_refs_by_pointer(self) -> None:
+        """Test that table refs are named from their pointer, escapes included."""
+        graph = SchemaGraph({}, lambda node: node)
+
+        node = [{"$ref": "#/definitions/a~1b"}, {"$ref": "#/components/schemas/My%20Type"}]
+        assert graph.refs(node) == ["My Type", "a/b"]
+        assert graph.refs({"$ref": "#/components/schemas/Pet/properties/owner"}) == []
+
+    def test_reachable_schemas(self) -> None:
+        """Test the transitive closure, through cycles."""
+        dependencies = {"A": ["B"], "B": ["A", "C"], "C": [], "D": ["A"]}
+
+        assert reachable_schemas(["A"], dependencies) == {"A", "B", "C"}
+        assert reachable_schemas([], dependencies) == set()
+
+
+class TestTreeShaking:
+    """Tests for schema tree-shaking of filtered servers."""
+
+    @pytest.mark.parametrize("kwargs", [{}, {"lazy": True}, {"streaming": True}], ids=["read", "lazy", "stream"])
+    def test_operation_schema_refs(self, tmp_path: Path, kwargs: dict) -> None:
+        """Test that operation records list the schemas they refer to directly."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SPEC))
+
+        parser = OpenAPIParser(str(spec_file), validate=False, **kwargs)
+        refs = {op["operation_id"]: op["schema_refs"] for op in parser.get_operations()}
+
+        assert refs == {"createPet": ["Error", "Pet", "Region"], "listUsers": ["User"]}
+        assert parser.get_schema_dependencies()["User"] == ["Address"]
+
+    @pytest.mark.parametrize("compiled", [False, True], ids=["spec", "ir"])
+    def test_filtered_server_keeps_reachable_schemas(self, tmp_path: Path, compiled: bool) -> None:
+        """Test that a server filtered by tag only defines the schemas it reaches."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SPEC))
+        source_path = spec_file
+        if compiled:
+            source_path = tmp_path / "spec.mcpir"
+            SpecIR.from_parser(OpenAPIParser(str(spec_file), validate=False)).dump(source_path)
+
+        generator = MCPServerGenerator(str(source_path), server_name="shop", validate=False, tags=["pets"])
+        generator.generate(tmp_path / "out")
+
+        source = (tmp_path / "out" / "shop" / "main.py").read_text()
+        assert set(module_schemas(source)) == PETS_SCHEMAS
+        assert "schema://api/user" not in source
+
+    def test_discriminator_mapping_targets_kept(self, tmp_path: Path) -> None:
+        """Test that schemas named only in a discriminator mapping survive tree-shaking."""
+        spec = json.loads(json.dumps(SPEC))
+        schemas = spec["components"]["schemas"]
+        schemas["Pet"] = {
+            "oneOf": [_ref("Cat")],
+            "discriminator": {
+                "propertyName": "kind",
+                "mapping": {"cat": "#/components/schemas/Cat", "lizard": "Lizard", "dog": "#/components/schemas/Dog"},
+            },
+        }
+        schemas["Cat"] = {"type": "object"}
+        schemas["Lizard"] = {"type": "object", "properties": {"scales": _ref("Scales")}}
+        schemas["Scales"] = {"type": "string"}
+        schemas["Dog"] = {"type": "object"}
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(spec))
+
+        generator = MCPServerGenerator(str(spec_file), server_name="shop", validate=False, tags=["pets"])
+        generator.generate(tmp_path / "out")
+
+        kept = set(module_schemas((tmp_path / "out" / "shop" / "main.py").read_text()))
+        assert {"Pet", "Cat", "Lizard", "Scales", "Dog"} <= kept
+        assert "Unused" not in kept and "User" not in kept
+
+    def test_unfiltered_server_keeps_all_schemas(self, tmp_path: Path) -> None:
+        """Test that without filters every schema is kept."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(SPEC))
+
+        MCPServerGenerator(str(spec_file), server_name="shop", validate=False).generate(tmp_path / "out")
+
+        source = (tmp_path / "out" / "shop" / "main.py").read_text()
+        assert set(module_schemas(source)) == set(SPEC["components"]["schemas"])
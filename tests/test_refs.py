@@ -0,0 +1,460 @@
+"""Tests for external $ref resolution."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from mcp_swagger_cli.exceptions import SpecNotFoundError
+from mcp_swagger_cli.generator import MCPServerGenerator
+from mcp_swagger_cli.ir import SpecIR
+from mcp_swagger_cli.parser import OpenAPIParser
+from mcp_swagger_cli.refs import (
+    ExternalRefResolver,
+    PointerIndex,
+    absolute_ref,
+    find_external_refs,
+    join_uri,
+    resolve_pointer,
+)
+
+from tests.conftest import SpecRequestHandler
+
+
+def _multi_file_spec(ref_prefix: str) -> dict:
+    """Build a root spec whose schemas and parameters live in other documents."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Multi-file API", "version": "1.0.0"},
+        "paths": {
+            "/users/{id}": {
+                "get": {
+                    "operationId": "getUser",
+                    "parameters": [
+                        {"$ref": f"{ref_prefix}parameters/common.yaml#/UserId"},
+                    ],
+                    "responses": {"200": {"description": "OK"}},
+                },
+                "put": {
+                    "operationId": "updateUser",
+                    "requestBody": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": f"{ref_prefix}schemas/user.yaml#/User"},
+                            },
+                        },
+                    },
+                    "responses": {"204": {"description": "Updated"}},
+                },
+            },
+        },
+    }
+
+
+USER_DOCUMENT = {
+    "User": {
+        "type": "object",
+        "required": ["name"],
+        "properties": {"name": {"type": "string"}},
+    },
+    "Alias": {"$ref": "#/User"},
+}
+
+PARAMETERS_DOCUMENT = {
+    "UserId": {"name": "id", "in": "path", "required": True, "schema": {"$ref": "../schemas/user.yaml#/Id"}},
+}
+
+
+class TestRefHelpers:
+    """Tests for the ref parsing helpers."""
+
+    def test_find_external_refs(self) -> None:
+        """Test that only external refs are found, in JSON and block YAML."""
+        data = json.dumps({"a": {"$ref": "./a.json#/A"}, "b": {"$ref": "#/components/schemas/B"}})
+        assert find_external_refs(data.encode()) == {"./a.json#/A"}
+
+        data = yaml.dump({"a": {"$ref": "common.yaml#/A"}, "b": [{"$ref": "#/B"}]})
+        assert find_external_refs(data.encode()) == {"common.yaml#/A"}
+
+    def test_join_uri(self) -> None:
+        """Test resolving ref documents against file and URL bases."""
+        assert join_uri("/specs/api.yaml", "./schemas/user.yaml") == "/specs/schemas/user.yaml"
+        assert join_uri("/specs/schemas/user.yaml", "../common.yaml") == "/specs/common.yaml"
+        assert join_uri("https://x.io/api/v1.json", "common.json") == "https://x.io/api/common.json"
+        assert join_uri("/specs/api.yaml", "https://x.io/c.json") == "https://x.io/c.json"
+        assert join_uri("/specs/api.yaml", "") == "/specs/api.yaml"
+
+    def test_resolve_pointer(self) -> None:
+        """Test JSON-pointer walking with escapes and array indexes."""
+        document = {"a/b": {"items": [{"x": 1}]}, "m~n": 2}
+
+        assert resolve_pointer(document, "/a~1b/items/0/x") == 1
+        assert resolve_pointer(document, "/m~0n") == 2
+        assert resolve_pointer(document, "") is document
+        with pytest.raises(KeyError):
+            resolve_pointer(document, "/missing")
+
+    def test_pointer_index_memoizes_prefixes(self) -> None:
+        """Test that resolved pointers and their prefixes are kept, misses are not."""
+        document = {"components": {"schemas": {"A": {"type": "string"}}}, "": {"x": 1}}
+        index = PointerIndex(document)
+
+        assert index.resolve("/components/schemas/A") == {"type": "string"}
+        assert len(index) == 4
+        document["components"]["schemas"] = {"B": {}}
+        # Cached prefixes are reused, not walked again
+        assert index.resolve("/components/schemas/A") == {"type": "string"}
+        with pytest.raises(KeyError):
+            index.resolve("/components/missing")
+        document["components"]["missing"] = 2
+        assert index.resolve("/components/missing") == 2
+
+    def test_pointer_index_rfc_6901(self) -> None:
+        """Test escapes, percent-decoding and the empty member name."""
+        document = {"paths": {"/users/{id}": {"get": {"x": 1}}}, "": {"x": 2}, "a b": 3}
+        index = PointerIndex(document)
+
+        assert index.resolve("/paths/~1users~1{id}/get/x") == 1
+        assert index.resolve("/paths/~1users~1%7Bid%7D/get/x") == 1
+        assert index.resolve("/a%20b") == 3
+        assert index.resolve("//x") == 2
+        with pytest.raises(KeyError):
+            index.resolve("paths")
+
+    def test_absolute_ref(self) -> None:
+        """Test that refs are made absolute against their document."""
+        assert absolute_ref("#/A", "/specs/schemas/user.yaml") == "/specs/schemas/user.yaml#/A"
+        assert absolute_ref("other.yaml#/B", "/specs/schemas/user.yaml") == "/specs/schemas/other.yaml#/B"
+
+
+class TestExternalRefResolver:
+    """Tests for document loading and caching."""
+
+    def test_document_loaded_once_under_concurrency(self) -> None:
+        """Test that concurrent resolutions of one document share a single load."""
+        loads = []
+
+        def load(uri: str):
+            loads.append(uri)
+            time.sleep(0.05)
+            return {"A": {"type": "string"}}, None
+
+        resolver = ExternalRefResolver(load)
+        threads = [
+            threading.Thread(target=resolver.resolve, args=("a.json#/A", "/specs/api.json"))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert loads == ["/specs/a.json"]
+
+    def test_prefetch_is_parallel_and_transitive(self) -> None:
+        """Test that prefetch loads documents concurrently, following their refs."""
+        documents = {f"/specs/doc{i}.json": {"$ref": "leaf.json#/L"} for i in range(8)}
+        documents["/specs/leaf.json"] = {"L": {"type": "integer"}}
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def load(uri: str):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            document = documents[uri]
+            return document, json.dumps(document).encode()
+
+        resolver = ExternalRefResolver(load)
+        resolver.prefetch([f"doc{i}.json#/" for i in range(8)], "/specs/api.json")
+
+        assert peak > 1
+        assert resolver.resolve("leaf.json#/L", "/specs/api.json")[0] == {"type": "integer"}
+
+    def test_prefetch_defers_load_errors(self) -> None:
+        """Test that a failed prefetch only raises when the document is used."""
+
+        def load(uri: str):
+            raise SpecNotFoundError(f"Referenced document not found: {uri}")
+
+        resolver = ExternalRefResolver(load)
+        resolver.prefetch(["missing.json#/A"], "/specs/api.json")
+
+        with pytest.raises(SpecNotFoundError):
+            resolver.resolve("missing.json#/A", "/specs/api.json")
+
+
+class TestParserExternalRefs:
+    """Tests for external refs in OpenAPIParser."""
+
+    def _write_spec(self, tmp_path: Path) -> Path:
+        (tmp_path / "schemas").mkdir()
+        (tmp_path / "schemas" / "user.yaml").write_text(
+            yaml.dump({**USER_DOCUMENT, "Id": {"type": "integer"}})
+        )
+        (tmp_path / "parameters").mkdir()
+        (tmp_path / "parameters" / "common.yaml").write_text(yaml.dump(PARAMETERS_DOCUMENT))
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(yaml.dump(_multi_file_spec("./")))
+        return spec_file
+
+    def test_file_refs_resolved(self, tmp_path: Path) -> None:
+        """Test that schema and parameter refs into sibling files are resolved."""
+        spec_file = self._write_spec(tmp_path)
+
+        parser = OpenAPIParser(str(spec_file), validate=False)
+        operations = {op["operation_id"]: op for op in parser.get_operations()}
+
+        assert operations["updateUser"]["request_body"]["schema"]["required"] == ["name"]
+        # The parameter's own schema ref is relative to parameters/common.yaml
+        assert operations["getUser"]["parameters"] == [
+            {
+                "name": "id",
+                "in": "path",
+                "required": True,
+                "type": "integer",
+                "description": "",
+                "default": None,
+                "enum": None,
+                "union": None,
+            }
+        ]
+
+    def test_flow_style_referenced_document(self, tmp_path: Path) -> None:
+        """Test that a referenced document in YAML flow style, which starts with {, loads."""
+        spec_file = self._write_spec(tmp_path)
+        document = {**USER_DOCUMENT, "Id": {"type": "integer"}}
+        (tmp_path / "schemas" / "user.yaml").write_text(json.dumps(document) + "  # flow style")
+
+        parser = OpenAPIParser(str(spec_file), validate=False)
+        operations = {op["operation_id"]: op for op in parser.get_operations()}
+
+        assert operations["updateUser"]["request_body"]["schema"]["required"] == ["name"]
+
+    def test_alias_followed_within_referenced_document(self, tmp_path: Path) -> None:
+        """Test that a local ref inside a referenced document stays in that document."""
+        spec_file = self._write_spec(tmp_path)
+        parser = OpenAPIParser(str(spec_file), validate=False)
+
+        schema = parser._resolve_schema_ref({"$ref": "schemas/user.yaml#/Alias"})
+
+        assert schema == USER_DOCUMENT["User"]
+
+    def test_recursive_external_schema_keeps_author_refs(self, tmp_path: Path) -> None:
+        """Test that cycle back-references in other documents leak no build paths."""
+        (tmp_path / "schemas").mkdir()
+        (tmp_path / "schemas" / "node.yaml").write_text(yaml.dump({"components": {"schemas": {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}},
+                    "tag": {"$ref": "#/components/schemas/Tag"},
+                },
+            },
+            "Tag": {"type": "string"},
+        }}}))
+        spec = _multi_file_spec("./")
+        spec["paths"]["/users/{id}"]["put"]["requestBody"]["content"]["application/json"]["schema"] = {
+            "$ref": "./schemas/node.yaml#/components/schemas/Node"
+        }
+        del spec["paths"]["/users/{id}"]["get"]
+        # Same pointer as in node.yaml, different schema
+        spec["components"] = {"schemas": {
+            "Node": {"$ref": "./schemas/node.yaml#/components/schemas/Node"},
+            "Tag": {"type": "integer"},
+        }}
+        spec_file = tmp_path / "openapi.yaml"
+        spec_file.write_text(yaml.dump(spec))
+
+        parser = OpenAPIParser(str(spec_file), validate=False)
+        body = parser.get_operations()[0]["request_body"]["schema"]
+
+        assert body["properties"]["tag"] == {"type": "string"}
+        assert body["properties"]["children"]["items"] == {"$ref": "#/components/schemas/Node"}
+        assert parser.get_schemas()["Tag"] == {"type": "integer"}
+
+        MCPServerGenerator(str(spec_file), server_name="nodes", validate=False).generate(tmp_path / "out")
+        source = (tmp_path / "out" / "nodes" / "main.py").read_text()
+        assert "#/components/schemas/Node" in source
+        assert str(tmp_path) not in source
+        ir = SpecIR.loads(SpecIR.from_parser(parser).dumps())
+        assert str(tmp_path) not in json.dumps([ir.get_schemas(), ir.get_operations()])
+
+    def test_unknown_pointer_left_unresolved(self, tmp_path: Path) -> None:
+        """Test that a pointer missing from a loaded document leaves the ref as is."""
+        spec_file = self._write_spec(tmp_path)
+        parser = OpenAPIParser(str(spec_file), validate=False)
+        ref = {"$ref": "schemas/user.yaml#/Missing"}
+
+        assert parser._resolve_schema_ref(ref) is ref
+
+    def test_missing_document_raises(self, tmp_path: Path) -> None:
+        """Test that a ref to a missing file raises SpecNotFoundError."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(_multi_file_spec("./missing/")))
+        parser = OpenAPIParser(str(spec_file), validate=False)
+
+        with pytest.raises(SpecNotFoundError):
+            parser.get_operations()
+
+    def test_resolve_refs_disabled(self, tmp_path: Path) -> None:
+        """Test that resolve_refs=False leaves external refs alone."""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(_multi_file_spec("./missing/")))
+        parser = OpenAPIParser(str(spec_file), validate=False, resolve_refs=False)
+
+        operations = {op["operation_id"]: op for op in parser.get_operations()}
+
+        assert operations["updateUser"]["request_body"]["schema"] == {
+            "$ref": "./missing/schemas/user.yaml#/User"
+        }
+
+    def test_url_refs_fetched_once(self, spec_server: str) -> None:
+        """Test that URL refs are fetched once each, however often they are used."""
+        SpecRequestHandler.spec = _multi_file_spec("")
+        SpecRequestHandler.documents = {
+            "/api/schemas/user.yaml": {**USER_DOCUMENT, "Id": {"type": "integer"}},
+            "/api/parameters/common.yaml": PARAMETERS_DOCUMENT,
+        }
+
+        parser = OpenAPIParser(f"{spec_server}/api/openapi.json", validate=False)
+        parser.get_operations()
+        parser.get_operations()
+
+        assert sorted(SpecRequestHandler.paths) == [
+            "/api/openapi.json",
+            "/api/parameters/common.yaml",
+            "/api/schemas/user.yaml",
+        ]
+
+
+class TestParserLocalRefs:
+    """Tests for local refs beyond the schema and parameter tables."""
+
+    def test_any_local_pointer_resolved(self, tmp_path: Path) -> None:
+        """Test refs into requestBodies, paths and ref-to-ref aliases."""
+        spec = {
+            "openapi": "3.0.0",
+            "info": {"title": "Local", "version": "1.0.0"},
+            "paths": {
+                "/users/{id}": {
+                    "get": {
+                        "operationId": "getUser",
+                        "parameters": [
+                            {"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}},
+                        ],
+                        "responses": {},
+                    },
+                    "put": {
+                        "operationId": "putUser",
+                        "parameters": [{"$ref": "#/paths/~1users~1%7Bid%7D/get/parameters/0"}],
+                        "requestBody": {
+                            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Alias"}}},
+                        },
+                        "responses": {},
+                    },
+                },
+            },
+            "components": {
+                "schemas": {
+                    "Alias": {"$ref": "#/components/schemas/User"},
+                    "User": {"type": "object", "properties": {"id": {"type": "integer"}}},
+                },
+            },
+        }
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(spec))
+
+        put = OpenAPIParser(str(spec_file), validate=False).get_operations()[1]
+
+        assert put["parameters"][0]["name"] == "id"
+        assert put["parameters"][0]["type"] == "integer"
+        assert put["request_body"]["schema"] == spec["components"]["schemas"]["User"]
+
+    def test_request_body_and_response_refs_resolved(self, tmp_path: Path) -> None:
+        """Test refs to components/requestBodies and components/responses."""
+        user = {"type": "object", "properties": {"id": {"type": "integer"}}}
+        spec = {
+            "openapi": "3.0.0",
+            "info": {"title": "Local", "version": "1.0.0"},
+            "paths": {
+                "/users": {
+                    "post": {
+                        "operationId": "createUser",
+                        "requestBody": {"$ref": "#/components/requestBodies/UserBody"},
+                        "responses": {
+                            "201": {"$ref": "#/components/responses/UserResponse"},
+                            "404": {"$ref": "#/components/responses/NotFound"},
+                        },
+                    },
+                },
+            },
+            "components": {
+                "schemas": {"User": user},
+                "requestBodies": {
+                    "UserBody": {
+                        "required": True,
+                        "description": "A user",
+                        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/User"}}},
+                    },
+                },
+                "responses": {
+                    "UserResponse": {
+                        "description": "Created",
+                        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/User"}}},
+                    },
+                    "NotFound": {"$ref": "#/components/responses/Missing"},
+                    "Missing": {"description": "Not found"},
+                },
+            },
+        }
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(spec))
+
+        operation = OpenAPIParser(str(spec_file), validate=False).get_operations()[0]
+
+        assert operation["request_body"]["required"] is True
+        assert operation["request_body"]["description"] == "A user"
+        assert operation["request_body"]["schema"] == user
+        assert operation["consumes"] == ["application/json"]
+        assert operation["responses"]["201"] == {
+            "description": "Created",
+            "schema": {"$ref": "#/components/schemas/User"},
+        }
+        assert operation["responses"]["404"] == {"description": "Not found", "schema": None}
+
+    def test_swagger_body_parameter_ref_resolved(self, tmp_path: Path) -> None:
+        """Test that a 2.0 body parameter behind a ref becomes the request body."""
+        spec = {
+            "swagger": "2.0",
+            "info": {"title": "Local", "version": "1.0.0"},
+            "paths": {
+                "/pets": {
+                    "post": {
+                        "operationId": "addPet",
+                        "parameters": [{"$ref": "#/parameters/PetBody"}],
+                        "responses": {"200": {"$ref": "#/responses/Ok"}},
+                    },
+                },
+            },
+            "parameters": {
+                "PetBody": {"name": "pet", "in": "body", "required": True, "schema": {"type": "object"}},
+            },
+            "responses": {"Ok": {"description": "OK", "schema": {"type": "string"}}},
+        }
+        spec_file = tmp_path / "swagger.json"
+        spec_file.write_text(json.dumps(spec))
+
+        operation = OpenAPIParser(str(spec_file), validate=False).get_operations()[0]
+
+        assert operation["parameters"] == []
+        assert operation["request_body"]["schema"] == {"type": "object"}
+        assert operation["responses"]["200"] == {"description": "OK", "schema": {"type": "string"}}
@@ -0,0 +1,258 @@
+"""Tests for the streaming module."""
+
+import gzip
+import io
+import json
+import os
+import threading
+import tracemalloc
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from mcp_swagger_cli.exceptions import SpecParseError
+from mcp_swagger_cli.parser import OpenAPIParser
+from mcp_swagger_cli.streaming import JSONStreamReader, read_spec_header, stream_spec_once
+
+from tests.test_parser import SAMPLE_OPENAPI_30, SAMPLE_SWAGGER_20
+
+
+def _synthetic_spec(path_count: int, payload_size: int) -> dict:
+    """Build a spec whose path items carry bulky data not kept in operations."""
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Synthetic", "version": "1.0.0"},
+        "paths": {
+            f"/items{i}": {
+                "get": {
+                    "operationId": f"getItem{i}",
+                    "tags": [f"tag{i % 5}"],
+                    "responses": {
+                        "200": {
+                            "description": "OK",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": "#/components/schemas/Item"},
+                                    "examples": {"big": {"value": ["x" * 64] * payload_size}},
+                                },
+                            },
+                        },
+                    },
+                },
+            }
+            for i in range(path_count)
+        },
+        "components": {"schemas": {"Item": {"type": "object"}}},
+    }
+
+
+class TestJSONStreamReader:
+    """Tests for JSONStreamReader class."""
+
+    def test_values_across_chunk_boundaries(self) -> None:
+        """Test that values split by the read window decode correctly."""
+        document = {"a": 1234567890, "b": [1.5, True, None, "str\\ing"], "c": {"d": "é"}}
+        stream = io.BytesIO(json.dumps(document).encode())
+        reader = JSONStreamReader(stream, chunk_size=3)
+
+        decoded = {key: reader.read_value() for key in reader.iter_object()}
+
+        assert decoded == document
+
+    def test_empty_object(self) -> None:
+        """Test iterating an empty object."""
+        reader = JSONStreamReader(io.BytesIO(b"  { }  "))
+        assert list(reader.iter_object()) == []
+
+    def test_truncated_document_raises(self) -> None:
+        """Test that a truncated document raises a decode error."""
+        reader = JSONStreamReader(io.BytesIO(b'{"a": {"b": 1'), chunk_size=4)
+        with pytest.raises(json.JSONDecodeError):
+            for _ in reader.iter_object():
+                reader.read_value()
+
+    def test_read_spec_header_skips_paths(self) -> None:
+        """Test that the header pass keeps everything except paths."""
+        stream = io.BytesIO(json.dumps(SAMPLE_OPENAPI_30).encode())
+        header = read_spec_header(stream)
+
+        assert "paths" not in header
+        assert header["components"] == SAMPLE_OPENAPI_30["components"]
+
+
+class TestSinglePassStreaming:
+    """Tests for stream_spec_once."""
+
+    def test_paths_yielded_as_read_after_components(self) -> None:
+        """Test that path items stream through when components come first."""
+        spec = {"components": {"schemas": {}}, "paths": {"/a": {}, "/b": {}}, "info": {}}
+        header, path_items = stream_spec_once(io.BytesIO(json.dumps(spec).encode()))
+
+        assert next(path_items) == ("/a", {})
+        assert "components" in header
+        assert "info" not in header
+        assert list(path_items) == [("/b", {})]
+        assert "info" in header
+
+    def test_paths_held_until_components_read(self) -> None:
+        """Test that path items wait for tables that follow paths."""
+        spec = {"paths": {"/a": {}}, "components": {"schemas": {}}}
+        header, path_items = stream_spec_once(io.BytesIO(json.dumps(spec).encode()))
+
+        assert next(path_items) == ("/a", {})
+        assert "components" in header
+
+
+class TestStreamingParser:
+    """Tests for OpenAPIParser streaming mode."""
+
+    @pytest.mark.parametrize("spec", [SAMPLE_OPENAPI_30, SAMPLE_SWAGGER_20])
+    def test_matches_full_load(self, spec: dict, tmp_path: Path) -> None:
+        """Test that streaming produces the same operations and info."""
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text(json.dumps(spec))
+
+        full = OpenAPIParser(str(spec_file), validate=False)
+        streamed = OpenAPIParser(str(spec_file), validate=False, streaming=True)
+
+        assert streamed.get_operations() == full.get_operations()
+        assert streamed.get_spec_info() == full.get_spec_info()
+
+    def test_paths_before_components(self, tmp_path: Path) -> None:
+        """Test that refs resolve when components follow paths in the document."""
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text(json.dumps(SAMPLE_OPENAPI_30))
+        assert list(SAMPLE_OPENAPI_30).index("paths") < list(SAMPLE_OPENAPI_30).index("components")
+
+        parser = OpenAPIParser(str(spec_file), validate=False, streaming=True)
+        create_user = next(op for op in parser.get_operations() if op["operation_id"] == "createUser")
+
+        assert create_user["request_body"]["schema"]["type"] == "object"
+
+    def test_invalid_json_raises_parse_error(self, tmp_path: Path) -> None:
+        """Test that malformed JSON surfaces as SpecParseError."""
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text('{"openapi": "3.0.0", "paths": {"/a": {')
+
+        with pytest.raises(SpecParseError):
+            OpenAPIParser(str(spec_file), validate=False, streaming=True)
+
+    def test_peak_memory_is_bounded(self, tmp_path: Path) -> None:
+        """Test that streaming peak memory is well below a full load."""
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text(json.dumps(_synthetic_spec(path_count=200, payload_size=200)))
+
+        def peak(streaming: bool) -> int:
+            tracemalloc.start()
+            try:
+                parser = OpenAPIParser(str(spec_file), validate=False, streaming=streaming)
+                assert len(parser.get_operations()) == 200
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        assert peak(streaming=True) * 3 < peak(streaming=False)
+
+
+class _Stdin:
+    """Stand-in for sys.stdin exposing a binary buffer."""
+
+    def __init__(self, data: bytes) -> None:
+        self.buffer = io.BytesIO(data)
+
+
+class TestStreamInput:
+    """Tests for specs read from stdin and named pipes."""
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            json.dumps(SAMPLE_OPENAPI_30).encode(),
+            yaml.dump(SAMPLE_OPENAPI_30).encode(),
+            gzip.compress(json.dumps(SAMPLE_OPENAPI_30).encode()),
+            yaml.dump(SAMPLE_OPENAPI_30, default_flow_style=True).encode(),
+            # Sniffed as JSON, then loaded as YAML
+            (json.dumps(SAMPLE_OPENAPI_30) + "  # flow style").encode(),
+        ],
+        ids=["json", "yaml", "gzip", "yaml-flow", "yaml-flow-quoted"],
+    )
+    def test_stdin_format_sniffed(self, data: bytes) -> None:
+        """Test that '-' reads stdin, sniffing compression and format."""
+        with patch("sys.stdin", _Stdin(data)):
+            parser = OpenAPIParser("-", validate=False)
+
+        assert parser.spec == SAMPLE_OPENAPI_30
+
+    def test_stdin_streaming(self) -> None:
+        """Test that streaming mode parses stdin in a single pass."""
+        data = json.dumps(SAMPLE_OPENAPI_30).encode()
+
+        with patch("sys.stdin", _Stdin(data)):
+            streamed = OpenAPIParser("-", validate=False, streaming=True)
+        with patch("sys.stdin", _Stdin(data)):
+            full = OpenAPIParser("-", validate=False)
+
+        assert streamed.get_operations() == full.get_operations()
+        assert streamed.get_spec_info() == full.get_spec_info()
+
+    def test_stdin_swagger_tables_after_paths(self) -> None:
+        """Test that Swagger 2.0 tables and defaults after paths still apply in a single pass."""
+        spec = {
+            "swagger": "2.0",
+            "info": {"title": "Pets", "version": "1.0.0"},
+            "definitions": {"Pet": {"type": "object", "properties": {"name": {"type": "string"}}}},
+            "paths": {
+                "/pets": {
+                    "post": {
+                        "operationId": "createPet",
+                        "parameters": [{"$ref": "#/parameters/Limit"}, {"$ref": "#/parameters/Name"}],
+                        "responses": {"default": {"$ref": "#/responses/Error"}},
+                    }
+                }
+            },
+            "parameters": {
+                "Limit": {"name": "limit", "in": "query", "type": "integer"},
+                "Name": {"name": "name", "in": "formData", "type": "string"},
+            },
+            "responses": {"Error": {"description": "Error", "schema": {"$ref": "#/definitions/Pet"}}},
+            "consumes": ["application/x-www-form-urlencoded"],
+        }
+        data = json.dumps(spec).encode()
+
+        with patch("sys.stdin", _Stdin(data)):
+            streamed = OpenAPIParser("-", validate=False, streaming=True)
+        with patch("sys.stdin", _Stdin(data)):
+            full = OpenAPIParser("-", validate=False)
+
+        operation = streamed.get_operations()[0]
+        assert operation == full.get_operations()[0]
+        assert [param["name"] for param in operation["parameters"]] == ["limit", "name"]
+        assert operation["responses"]["default"]["description"] == "Error"
+        assert operation["consumes"] == ["application/x-www-form-urlencoded"]
+
+    def test_stdin_invalid_json(self) -> None:
+        """Test that malformed piped JSON raises SpecParseError."""
+        with patch("sys.stdin", _Stdin(b'{"openapi": ')):
+            with pytest.raises(SpecParseError, match="standard input"):
+                OpenAPIParser("-", validate=False)
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="named pipes need POSIX")
+    def test_named_pipe(self, tmp_path: Path) -> None:
+        """Test that a named pipe is read as a stream rather than as a file."""
+        fifo = tmp_path / "spec.pipe"
+        os.mkfifo(fifo)
+
+        def write() -> None:
+            with open(fifo, "wb") as f:
+                f.write(json.dumps(SAMPLE_OPENAPI_30).encode())
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            parser = OpenAPIParser(str(fifo), validate=False, streaming=True)
+        finally:
+            writer.join()
+
+        assert len(parser.get_operations()) == 3
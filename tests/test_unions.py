@@ -0,0 +1,138 @@
+"""Tests for union schemas and their discriminator index."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+from mcp_swagger_cli.ir import SpecIR
+from mcp_swagger_cli.parser import OpenAPIParser
+from mcp_swagger_cli.unions import UnionIndex, select_variant, union_type
+
+SCHEMAS: dict[str, Any] = {
+    "Cat": {
+        "type": "object",
+        "properties": {"petType": {"type": "string"}, "indoor": {"type": "boolean"}},
+    },
+    "Dog": {
+        "type": "object",
+        "properties": {"petType": {"type": "string"}, "owner": {"$ref": "#/components/schemas/Owner"}},
+    },
+    "Lizard": {"type": "object", "properties": {"petType": {"type": "string"}}},
+    "Owner": {"type": "object", "properties": {"name": {"type": "string"}}},
+    "Pet": {
+        "oneOf": [{"$ref": "#/components/schemas/Cat"}, {"$ref": "#/components/schemas/Dog"}],
+        "discriminator": {
+            "propertyName": "petType",
+            "mapping": {"cat": "#/components/schemas/Cat", "lizard": "Lizard"},
+        },
+    },
+}
+
+UNION_SPEC: dict[str, Any] = {
+    "openapi": "3.0.3",
+    "info": {"title": "Pets", "version": "1.0.0"},
+    "paths": {
+        "/pets": {
+            "post": {
+                "operationId": "createPet",
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "query",
+                        "schema": {"oneOf": [{"type": "string"}, {"type": "integer"}]},
+                    },
+                    {
+                        "name": "nickname",
+                        "in": "query",
+                        "schema": {"anyOf": [{"type": "string"}, {"type": "null"}]},
+                    },
+                ],
+                "requestBody": {
+                    "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Pet"}}}
+                },
+                "responses": {"201": {"description": "Created"}},
+            }
+        }
+    },
+    "components": {"schemas": SCHEMAS},
+}
+
+
+def _resolve(node: dict[str, Any]) -> Any:
+    return SCHEMAS.get(node["$ref"].rsplit("/", 1)[-1], node)
+
+
+class TestUnionIndex:
+    """Tests for describing unions."""
+
+    def test_discriminator_mapping(self) -> None:
+        """Test explicit, bare-name and implicit discriminator values."""
+        union = UnionIndex(_resolve, lambda node: _resolve(node) if "$ref" in node else node)(SCHEMAS["Pet"])
+
+        assert union["keyword"] == "oneOf"
+        # Lizard is only named in the mapping, so it is added as a variant
+        assert union["variants"] == [SCHEMAS["Cat"], SCHEMAS["Dog"], SCHEMAS["Lizard"]]
+        # Dog has no mapping entry and is known by its schema name
+        assert union["discriminator"] == {
+            "property": "petType",
+            "mapping": {"cat": 0, "lizard": 2, "Dog": 1},
+        }
+        assert select_variant(union, {"petType": "Dog"}) is SCHEMAS["Dog"]
+        assert select_variant(union, {"petType": "lizard"}) is SCHEMAS["Lizard"]
+        assert select_variant(union, {"petType": "Cat"}) is None
+        assert select_variant(union, {"petType": ["cat"]}) is None
+
+    def test_described_once(self) -> None:
+        """Test that a union is described once per schema object."""
+        calls = []
+
+        def dereference(node: Any) -> Any:
+            calls.append(node)
+            return node
+
+        index = UnionIndex(_resolve, dereference)
+        schema = {"anyOf": [{"type": "string"}, {"type": "integer"}]}
+
+        assert index(schema) is index(schema)
+        assert len(calls) == 2
+        assert index({"type": "string"}) is None
+
+    def test_union_type(self) -> None:
+        """Test the type shared by the variants of a union."""
+        assert union_type({"variants": [{"type": "string"}, {"type": "null"}]}) == "string"
+        assert union_type({"variants": [{"type": "string"}, {"type": "integer"}]}) is None
+        assert union_type({"variants": [{"type": ["string", "null"]}]}) is None
+
+
+class TestParserUnions:
+    """Tests for unions in operation records."""
+
+    def _operation(self, tmp_path: Path) -> tuple[OpenAPIParser, dict[str, Any]]:
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(UNION_SPEC))
+        parser = OpenAPIParser(str(spec_file), validate=False)
+        return parser, parser.get_operations()[0]
+
+    def test_parameters_keep_variants(self, tmp_path: Path) -> None:
+        """Test that union parameters keep every alternative."""
+        _, operation = self._operation(tmp_path)
+        id_param, nickname = operation["parameters"]
+
+        assert id_param["type"] is None
+        assert id_param["union"]["variants"] == [{"type": "string"}, {"type": "integer"}]
+        assert id_param["union"]["discriminator"] is None
+        assert nickname["type"] == "string"
+        assert nickname["union"]["keyword"] == "anyOf"
+
+    def test_request_body_discriminator(self, tmp_path: Path) -> None:
+        """Test that a request body union is indexed by discriminator, refs dereferenced."""
+        parser, operation = self._operation(tmp_path)
+        union = operation["request_body"]["union"]
+
+        dog = select_variant(union, {"petType": "Dog", "owner": {"name": "Ann"}})
+        assert dog["properties"]["owner"] == SCHEMAS["Owner"]
+        # The same variant objects as in the dereferenced body schema
+        assert dog is operation["request_body"]["schema"]["oneOf"][1]
+
+        ir = SpecIR.loads(SpecIR.from_parser(parser).dumps())
+        assert ir.get_operations()[0]["request_body"]["union"] == union